@@ -1,7 +1,9 @@
 from .contacts import mesh_mesh_contacts
 from .contacts import brep_brep_contacts
+from .contacts import BrepFaceTable
 
 __all__ = [
+    "BrepFaceTable",
     "mesh_mesh_contacts",
     "brep_brep_contacts",
 ]
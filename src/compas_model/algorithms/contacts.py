@@ -1,8 +1,14 @@
+import warnings
 from math import fabs
 from typing import Optional
 from typing import Type
 from typing import Union
 
+from numpy import abs as npabs
+from numpy import asarray
+from numpy import empty
+from numpy import float64
+from numpy import ndarray
 from shapely.geometry import Polygon as ShapelyPolygon
 
 from compas.datastructures import Mesh
@@ -12,14 +18,16 @@ from compas.geometry import Point
 from compas.geometry import Polygon
 from compas.geometry import Transformation
 from compas.geometry import Vector
-from compas.geometry import bestfit_frame_numpy
+from compas.geometry import centroid_points
 from compas.geometry import centroid_polygon
 from compas.geometry import cross_vectors
 from compas.geometry import dot_vectors
 from compas.geometry import length_vector
+from compas.geometry import subtract_vectors
 from compas.geometry import transform_points
 from compas.tolerance import TOL
-from compas.tolerance import Tolerance
+from compas_model.geometry import bestfit_frames_numpy
+from compas_model.geometry import polygon_frame
 from compas_model.interactions import Contact
 
 
@@ -76,6 +84,7 @@ def mesh_mesh_contacts(
     tolerance: float = 1e-6,
     minimum_area: float = 1e-1,
     contacttype: Type[Contact] = Contact,
+    bestfit: bool = False,
 ) -> list[Contact]:
     """Compute all face-face contact interfaces between two meshes.
 
@@ -89,6 +98,9 @@ def mesh_mesh_contacts(
         Maximum deviation from the perfectly flat interface plane.
     minimum_area : float, optional
         Minimum area of a "face-face" interface.
+    bestfit : bool, optional
+        If True, the interface calculations of every pair of faces are done in the best-fit frame of the corner points of both faces.
+        Otherwise, the frame is derived from the normal and the longest edge of the face of the source mesh.
 
     Returns
     -------
@@ -108,34 +120,172 @@ def mesh_mesh_contacts(
 
     contacts: list[Contact] = []
 
+    b_faces = [(b.face_coordinates(b_face), b.face_normal(b_face)) for b_face in b.faces()]
+    pairs = []
+
     for a_face in a.faces():
         a_points = a.face_coordinates(a_face)
         a_normal = a.face_normal(a_face)
 
-        for b_face in b.faces():
-            b_points = b.face_coordinates(b_face)
-            b_normal = b.face_normal(b_face)
-
+        for b_points, b_normal in b_faces:
             # normals should actually be exactly opposite
             # parallelity is not enough
 
             if not is_opposite_normal_normal(a_normal, b_normal):
                 continue
 
-            result = polygon_polygon_overlap(a_points, b_points, a_normal, tolerance, minimum_area)  # type: ignore
+            pairs.append((a_points, b_points, a_normal))
+
+    frames = _pair_frames(pairs) if bestfit else [None] * len(pairs)
 
-            # this is not always an accurate representation of the interface
-            # if the polygon has holes
-            # the interface is incorrect
+    for (a_points, b_points, a_normal), frame in zip(pairs, frames):
+        result = polygon_polygon_overlap(a_points, b_points, a_normal, tolerance, minimum_area, frame=frame)  # type: ignore
 
-            if result:
-                points, frame, area, matrix_to_local, matrix_to_world = result
-                contact = contacttype(points=points, frame=frame, size=area)
-                contacts.append(contact)
+        # this is not always an accurate representation of the interface
+        # if the polygon has holes
+        # the interface is incorrect
+
+        if result:
+            points, frame, area, matrix_to_local, matrix_to_world = result
+            contact = contacttype(points=points, frame=frame, size=area)
+            contacts.append(contact)
 
     return contacts
 
 
+def _pair_frames(pairs: list[tuple[list, list, Vector]]) -> list[Frame]:
+    # compute the best-fit frames of the corner points of all face pairs at once
+    if not pairs:
+        return []
+    origins, xaxes, yaxes, _ = bestfit_frames_numpy([list(a_points) + list(b_points) for a_points, b_points, _ in pairs])
+    return [Frame(origin, xaxis, yaxis) for origin, xaxis, yaxis in zip(origins.tolist(), xaxes.tolist(), yaxes.tolist())]
+
+
+class BrepFaceTable:
+    """Table of the planar faces of a brep, with the data needed for contact calculations.
+
+    Parameters
+    ----------
+    brep : Brep
+        The brep.
+
+    Attributes
+    ----------
+    faces : list[BrepFace]
+        The planar faces of the brep.
+    boundaries : list[list[Point]]
+        For every face, the corner points of its outer boundary.
+    holes : list[list[list[Point]]]
+        For every face, the corner points of its holes.
+    normals : ndarray
+        An (n, 3) array with the unit normals of the faces.
+    centroids : ndarray
+        An (n, 3) array with the centroids of the corner points of the boundaries of the faces.
+    areas : ndarray
+        An (n,) array with the areas of the faces.
+    extents : ndarray
+        An (n, 6) array with the extents ``[xmin, ymin, zmin, xmax, ymax, zmax]`` of the boundaries of the faces.
+    nbytes : int, read-only
+        The (approximate) memory footprint of the table.
+
+    Notes
+    -----
+    Every face is converted to polygons only once, when the table is constructed.
+
+    Non-planar faces (faces for which ``face.is_plane`` is False) are not included, since they can't form planar contacts.
+    Previously, such faces were passed on by ``Brep.overlap``, and converted to (invalid) polygons.
+
+    The boundary of a face is the first polygon returned by ``face.to_polygons()``, which is its outer loop.
+    The inner loops are not part of the boundary, and are stored separately as holes.
+    They are only used to compute the holes of the contact polygons,
+    not for selecting candidate pairs or computing the outline of the contact polygons.
+
+    """
+
+    def __init__(self, brep: Brep) -> None:
+        self.faces = []
+        self.boundaries: list[list[Point]] = []
+        self.holes: list[list[list[Point]]] = []
+        normals = []
+        areas = []
+
+        for face in brep.faces:
+            if not face.is_plane:
+                continue
+            polygons: list[Polygon] = face.to_polygons()  # type: ignore
+            self.faces.append(face)
+            self.boundaries.append(polygons[0].points)
+            self.holes.append([polygon.points for polygon in polygons[1:]])
+            normals.append(polygons[0].normal.unitized())
+            areas.append(face.area)
+
+        n = len(self.faces)
+        self.normals: ndarray = asarray(normals, dtype=float64).reshape(n, 3)
+        self.areas: ndarray = asarray(areas, dtype=float64).reshape(n)
+        self.centroids: ndarray = empty((n, 3), dtype=float64)
+        self.extents: ndarray = empty((n, 6), dtype=float64)
+        for index, boundary in enumerate(self.boundaries):
+            points = asarray(boundary, dtype=float64)
+            self.centroids[index] = points.mean(axis=0)
+            self.extents[index, :3] = points.min(axis=0)
+            self.extents[index, 3:] = points.max(axis=0)
+
+    def __len__(self) -> int:
+        return len(self.faces)
+
+    @property
+    def nbytes(self) -> int:
+        points = sum(len(boundary) + sum(len(hole) for hole in holes) for boundary, holes in zip(self.boundaries, self.holes))
+        return 64 * points + self.normals.nbytes + self.centroids.nbytes + self.areas.nbytes + self.extents.nbytes
+
+    def candidates(self, other: "BrepFaceTable", tolerance: float = 1e-6, minimum_area: float = 1e-1) -> list[tuple[int, int]]:
+        """Find the pairs of faces of this table and another table that can be in contact.
+
+        Parameters
+        ----------
+        other : BrepFaceTable
+            The other table.
+        tolerance : float, optional
+            Maximum deviation from the perfectly flat interface plane.
+        minimum_area : float, optional
+            Minimum area of a "face-face" interface.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The indices of the faces in this table and in the other table.
+
+        Notes
+        -----
+        The faces of a pair are large enough, have opposite normals, lie in the same plane, and have overlapping extents.
+        This is a conservative test for all pairs at once.
+        Whether the faces actually overlap has to be verified with [`polygon_polygon_overlap`][polygon_polygon_overlap].
+
+        """
+        a = (self.areas >= minimum_area).nonzero()[0]
+        b = (other.areas >= minimum_area).nonzero()[0]
+        if not len(a) or not len(b):
+            return []
+
+        a_normals = self.normals[a]
+
+        # same relative tolerance as is_opposite_normal_normal
+        opposite = npabs(a_normals @ other.normals[b].T + 1) <= TOL.absolute + 1e-3
+
+        # the distances of the centroids of the "b" faces to the planes of the "a" faces
+        # polygon_polygon_overlap accepts both faces if they are within tolerance of the plane halfway between them
+        # and therefore allows a gap of twice the tolerance
+        distances = npabs(((other.centroids[b][None, :, :] - self.centroids[a][:, None, :]) * a_normals[:, None, :]).sum(axis=2))
+        coplanar = distances <= 2 * tolerance
+
+        a_extents = self.extents[a][:, None, :]
+        b_extents = other.extents[b][None, :, :]
+        overlapping = ((a_extents[..., :3] <= b_extents[..., 3:] + 2 * tolerance) & (b_extents[..., :3] <= a_extents[..., 3:] + 2 * tolerance)).all(axis=2)
+
+        rows, cols = (opposite & coplanar & overlapping).nonzero()
+        return list(zip(a[rows].tolist(), b[cols].tolist()))
+
+
 def brep_brep_contacts(
     a: Brep,
     b: Brep,
@@ -143,8 +293,11 @@ def brep_brep_contacts(
     minimum_area: float = 1e-1,
     deflection: Optional[float] = None,
     contacttype: Type[Contact] = Contact,
+    bestfit: bool = False,
+    a_table: Optional[BrepFaceTable] = None,
+    b_table: Optional[BrepFaceTable] = None,
 ) -> list[Contact]:
-    """Compute all face-face contact interfaces between two meshes.
+    """Compute all face-face contact interfaces between two breps.
 
     Parameters
     ----------
@@ -156,6 +309,16 @@ def brep_brep_contacts(
         Maximum deviation from the perfectly flat interface plane.
     minimum_area : float, optional
         Minimum area of a "face-face" interface.
+    deflection : float, optional
+        Deprecated, and not used.
+        The faces are converted to polygons directly, without tessellation.
+    bestfit : bool, optional
+        If True, the interface calculations of every pair of faces are done in the best-fit frame of the corner points of both faces.
+        Otherwise, the frame is derived from the normal and the longest edge of the face of the source brep.
+    a_table : BrepFaceTable, optional
+        A precomputed face table of the source brep.
+    b_table : BrepFaceTable, optional
+        A precomputed face table of the target brep.
 
     Returns
     -------
@@ -169,53 +332,40 @@ def brep_brep_contacts(
     This means that if the bestfit frame does not align with the normal of the base source frame,
     it will be inverted, such that it corresponds to whatever edge is created from this source to a target.
 
-    """
-    contacts: list[Contact] = []
-
-    deflection = deflection or Tolerance().lineardeflection
+    The candidate pairs of faces are selected from the face tables of both breps,
+    such that every face is converted to polygons only once per table.
+    Only planar faces are considered, and the outline of a contact is computed from the outer loops of the faces.
+    See [`BrepFaceTable`][BrepFaceTable].
+    To reuse the tables over multiple calls, use [`compas_model.elements.Element.facetable`][compas_model.elements.Element.facetable].
 
-    # the parameter name linear_deflection is specific to OCC
-    a_faces, b_faces = a.overlap(b, linear_deflection=deflection, tolerance=tolerance)  # type: ignore
-
-    if a_faces and b_faces:
-        for a_face in a_faces:
-            if a_face.area < minimum_area:
-                continue
-
-            a_poly: Polygon = a_face.to_polygon()
-            a_points = a_poly.points
-            a_normal = a_poly.normal.unitized()
-
-            for b_face in b_faces:
-                if b_face.area < minimum_area:
-                    continue
+    """
+    if deflection is not None:
+        warnings.warn("The deflection parameter of brep_brep_contacts is deprecated and has no effect.", DeprecationWarning, stacklevel=2)
 
-                b_poly: Polygon = b_face.to_polygon()
-                b_points = b_poly.points
-                b_normal = b_poly.normal.unitized()
+    contacts: list[Contact] = []
 
-                # normals should actually be exactly opposite
-                # parallelity is not enough
+    a_table = a_table if a_table is not None else BrepFaceTable(a)
+    b_table = b_table if b_table is not None else BrepFaceTable(b)
 
-                if not is_opposite_normal_normal(a_normal, b_normal):
-                    continue
+    pairs = [(i, j, a_table.normals[i].tolist()) for i, j in a_table.candidates(b_table, tolerance=tolerance, minimum_area=minimum_area)]
+    frames = _pair_frames([(a_table.boundaries[i], b_table.boundaries[j], normal) for i, j, normal in pairs]) if bestfit else [None] * len(pairs)
 
-                result = polygon_polygon_overlap(a_points, b_points, a_normal, tolerance, minimum_area)
+    for (i, j, a_normal), frame in zip(pairs, frames):
+        a_points = a_table.boundaries[i]
+        b_points = b_table.boundaries[j]
 
-                # this is not always an accurate representation of the interface
-                # if the polygon has holes
-                # the interface is incorrect
+        result = polygon_polygon_overlap(a_points, b_points, a_normal, tolerance, minimum_area, frame=frame)  # type: ignore
 
-                if result:
-                    points, frame, area, matrix_to_local, matrix_to_world = result
+        if result:
+            points, frame, area, matrix_to_local, matrix_to_world = result
 
-                    # if the result exists, but the faces have holes
-                    # compute the holes in the intersection polygon
+            # if the result exists, but the faces have holes
+            # compute the holes in the intersection polygon
 
-                    holes = brepface_brepface_overlap_holes(a_face, b_face, matrix_to_local, matrix_to_world, minimum_area)
+            holes = _overlap_holes(a_points, a_table.holes[i], b_points, b_table.holes[j], matrix_to_local, matrix_to_world, minimum_area)
 
-                    contact = contacttype(points=points, frame=frame, size=area, holes=holes)
-                    contacts.append(contact)
+            contact = contacttype(points=points, frame=frame, size=area, holes=holes)
+            contacts.append(contact)
 
     return contacts
 
@@ -226,6 +376,7 @@ def polygon_polygon_overlap(
     normal: Vector,
     tolerance: float,
     minimum_area: float,
+    frame: Optional[Frame] = None,
 ) -> Optional[tuple[list[Point], Frame, float, Transformation, Transformation]]:
     """Compute the overlap between two polygons defined by their corner points.
 
@@ -241,6 +392,12 @@ def polygon_polygon_overlap(
         Maximum deviation from the perfectly flat interface plane.
     minimum_area
         Minimum area of the overlap polygon.
+    frame
+        A shared frame for the interface calculations, for example the best-fit frame of the points of both polygons.
+        By default, the frame is derived from the normal and the longest edge of the first polygon,
+        with its origin on the plane halfway between the centroids of both polygons.
+        As with a best-fit frame, the polygons are then accepted if both are within tolerance of this midplane,
+        which allows a gap of up to twice the tolerance between them.
 
     Returns
     -------
@@ -251,12 +408,17 @@ def polygon_polygon_overlap(
 
     """
     # this ensures that a shared frame is used to do the interface calculations
-    frame = Frame(*bestfit_frame_numpy(a_points + b_points))
+    if frame is None:
+        frame = polygon_frame(a_points, normal)
+        # move the origin to the plane halfway between both polygons
+        offset = 0.5 * frame.zaxis.dot(subtract_vectors(centroid_points(b_points), frame.point))
+        frame.point = frame.point + frame.zaxis * offset
 
     # the frame should be oriented along the normal of the "a" face
     # this will align the interface frame with the resulting interaction edge
     # which is important for calculations with solvers such as CRA
-    if frame.zaxis.dot(normal) < 0:
+    elif frame.zaxis.dot(normal) < 0:
+        frame = frame.copy()
         frame.invert()
 
     # compute the transformation to frame coordinates
@@ -325,15 +487,21 @@ def brepface_brepface_overlap_holes(
 
     """
     a_polygons = a.to_polygons()
-    a_boundary = transform_points(a_polygons[0].points, matrix_to_local)
-    a_holes = [transform_points(polygon.points, matrix_to_local) for polygon in a_polygons[1:]]
-
     b_polygons = b.to_polygons()
-    b_boundary = transform_points(b_polygons[0].points, matrix_to_local)
-    b_holes = [transform_points(polygon.points, matrix_to_local) for polygon in b_polygons[1:]]
-
-    a_shapely = ShapelyPolygon(a_boundary, holes=a_holes)
-    b_shapely = ShapelyPolygon(b_boundary, holes=b_holes)
+    return _overlap_holes(
+        a_polygons[0].points,
+        [polygon.points for polygon in a_polygons[1:]],
+        b_polygons[0].points,
+        [polygon.points for polygon in b_polygons[1:]],
+        matrix_to_local,
+        matrix_to_world,
+        minimum_area,
+    )
+
+
+def _overlap_holes(a_boundary, a_holes, b_boundary, b_holes, matrix_to_local, matrix_to_world, minimum_area) -> Optional[list[Polygon]]:
+    a_shapely = ShapelyPolygon(transform_points(a_boundary, matrix_to_local), holes=[transform_points(hole, matrix_to_local) for hole in a_holes])
+    b_shapely = ShapelyPolygon(transform_points(b_boundary, matrix_to_local), holes=[transform_points(hole, matrix_to_local) for hole in b_holes])
 
     intersection: ShapelyPolygon = a_shapely.intersection(b_shapely)  # type: ignore
     area = intersection.area
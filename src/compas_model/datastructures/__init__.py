@@ -1,4 +1,5 @@
 from .kdtree import KDTree
+from .disjointset import DisjointSet
 
 from .bvh import (
     AABBNode,
@@ -9,6 +10,7 @@ from .bvh import (
 __all__ = [
     "AABBNode",
     "BVH",
+    "DisjointSet",
     "KDTree",
     "OBBNode",
 ]
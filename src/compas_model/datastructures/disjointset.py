@@ -0,0 +1,160 @@
+from typing import Hashable
+from typing import Iterable
+from typing import Optional
+
+
+class DisjointSet:
+    """A disjoint-set (union-find) structure over hashable items.
+
+    Parameters
+    ----------
+    items : Iterable[Hashable], optional
+        The initial items, each in a set of its own.
+
+    Attributes
+    ----------
+    number_of_sets : int, read-only
+        The number of disjoint sets.
+
+    Notes
+    -----
+    The structure uses union by size and path halving,
+    such that a sequence of operations takes nearly constant amortised time per operation.
+    Items can be added and sets can be merged, but sets cannot be split.
+
+    Examples
+    --------
+    >>> sets = DisjointSet(range(4))
+    >>> sets.union(0, 1)
+    True
+    >>> sets.union(1, 0)
+    False
+    >>> sets.connected(0, 1), sets.connected(0, 2)
+    (True, False)
+    >>> sets.sets()
+    [[0, 1], [2], [3]]
+
+    """
+
+    def __init__(self, items: Optional[Iterable[Hashable]] = None) -> None:
+        self._parent: dict = {}
+        self._size: dict = {}
+        self._count = 0
+        if items is not None:
+            for item in items:
+                self.add(item)
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._parent
+
+    @property
+    def number_of_sets(self) -> int:
+        return self._count
+
+    def add(self, item: Hashable) -> None:
+        """Add an item in a set of its own.
+
+        Parameters
+        ----------
+        item : Hashable
+            The item. Items that are already in the structure are ignored.
+
+        Returns
+        -------
+        None
+
+        """
+        if item not in self._parent:
+            self._parent[item] = item
+            self._size[item] = 1
+            self._count += 1
+
+    def find(self, item: Hashable) -> Hashable:
+        """Find the representative item of the set containing an item.
+
+        Parameters
+        ----------
+        item : Hashable
+            The item.
+
+        Returns
+        -------
+        Hashable
+
+        Raises
+        ------
+        KeyError
+            If the item is not in the structure.
+
+        """
+        parent = self._parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: Hashable, b: Hashable) -> bool:
+        """Merge the sets containing two items.
+
+        Parameters
+        ----------
+        a : Hashable
+            The first item.
+        b : Hashable
+            The second item.
+
+        Returns
+        -------
+        bool
+            True if the sets were merged, False if the items were already in the same set.
+
+        Raises
+        ------
+        KeyError
+            If one of the items is not in the structure.
+
+        """
+        a = self.find(a)
+        b = self.find(b)
+        if a == b:
+            return False
+        if self._size[a] < self._size[b]:
+            a, b = b, a
+        self._parent[b] = a
+        self._size[a] += self._size.pop(b)
+        self._count -= 1
+        return True
+
+    def connected(self, a: Hashable, b: Hashable) -> bool:
+        """Verify that two items are in the same set.
+
+        Parameters
+        ----------
+        a : Hashable
+            The first item.
+        b : Hashable
+            The second item.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.find(a) == self.find(b)
+
+    def sets(self) -> list[list]:
+        """Collect the items of every set.
+
+        Returns
+        -------
+        list[list[Hashable]]
+            The sets, ordered by their first item, with the items in the order in which they were added.
+
+        """
+        sets: dict = {}
+        for item in self._parent:
+            sets.setdefault(self.find(item), []).append(item)
+        return list(sets.values())
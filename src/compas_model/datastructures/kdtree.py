@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 from typing import Optional
+from typing import Sequence
 
 from compas.geometry import Point
 from compas.geometry import distance_point_point_sqrd
@@ -35,10 +36,11 @@ class KDTree:
 
     Parameters
     ----------
-    objects : sequence[[float, float, float] | Point], optional
-        A list of objects to populate the tree with.
-        If objects are provided, the tree is built automatically.
-        Otherwise, use :meth:`build`.
+    elements : list[Element]
+        A list of elements to populate the tree with.
+    points : sequence[[float, float, float] | Point], optional
+        The reference points of the elements, in the same order as the elements.
+        If no points are provided, the reference points of the elements are used.
 
     Attributes
     ----------
@@ -59,9 +61,11 @@ class KDTree:
 
     """
 
-    def __init__(self, elements: list["Element"]):
+    def __init__(self, elements: list["Element"], points: Optional[Sequence[Point]] = None):
         self.elements = elements
-        self.root = self._build([(element.aabb.frame.point, index) for index, element in enumerate(elements)])
+        if points is None:
+            points = [element.point for element in elements]
+        self.root = self._build([(point, index) for index, point in enumerate(points)])
 
     def _build(self, objects: list[tuple["Element", int]], axis: int = 0) -> Node:
         if not objects:
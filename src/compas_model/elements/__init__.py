@@ -1,3 +1,4 @@
+from .cache import ElementCache
 from .element import reset_computed
 from .element import Element
 from .element import Feature
@@ -8,8 +9,11 @@ from .column import ColumnFeature
 from .plate import PlateElement
 from .plate import PlateFeature
 from .group import Group
+from .prototypes import PrototypeRegistry
+from .prototypes import PROTOTYPES
 
 __all__ = [
+    "ElementCache",
     "reset_computed",
     "Element",
     "Feature",
@@ -20,4 +24,6 @@ __all__ = [
     "PlateElement",
     "PlateFeature",
     "Group",
+    "PrototypeRegistry",
+    "PROTOTYPES",
 ]
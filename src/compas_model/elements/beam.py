@@ -8,6 +8,7 @@ from compas.geometry import Point
 from compas.geometry import Transformation
 from compas_model.elements.element import Element
 from compas_model.elements.element import Feature
+from compas_model.elements.element import reset_computed
 
 
 class BeamFeature(Feature):
@@ -81,6 +82,7 @@ class BeamElement(Element):
         return self.box.xsize
 
     @width.setter
+    @reset_computed
     def width(self, width: float):
         self.box.xsize = width
 
@@ -89,6 +91,7 @@ class BeamElement(Element):
         return self.box.ysize
 
     @depth.setter
+    @reset_computed
     def depth(self, depth: float):
         self.box.ysize = depth
 
@@ -97,6 +100,7 @@ class BeamElement(Element):
         return self.box.zsize
 
     @length.setter
+    @reset_computed
     def length(self, length: float):
         self.box.zsize = length
         self.box.frame = Frame(point=[0, 0, self.box.zsize / 2], xaxis=[1, 0, 0], yaxis=[0, 1, 0])
@@ -114,6 +118,21 @@ class BeamElement(Element):
         """
         return self.box.to_mesh()
 
+    def compute_prototypekey(self) -> Optional[tuple]:
+        """Compute the key of the shared prototype of the beam geometry from the dimensions, location and orientation of its box.
+
+        Returns
+        -------
+        tuple | None
+            None if the beam has features.
+
+        """
+        if self.features:
+            return None
+        frame = self.box.frame
+        return (self.__dtype__, self.box.xsize, self.box.ysize, self.box.zsize, *frame.point, *frame.xaxis, *frame.yaxis)
+
+    @reset_computed
     def extend(self, distance: float) -> None:
         """Extend the beam.
 
@@ -178,12 +197,12 @@ class BeamElement(Element):
         """
         raise NotImplementedError
 
-    def compute_point(self) -> Point:
-        """Compute the reference point of the beam from the centroid of its geometry.
+    def compute_elementpoint(self) -> Point:
+        """Compute the reference point of the beam from the center of its box.
 
         Returns
         -------
         Point
 
         """
-        return Point(*self.modelgeometry.centroid())
+        return self.box.frame.point.copy()
@@ -0,0 +1,436 @@
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+from itertools import count
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterator
+from typing import Optional
+
+from compas.datastructures import Mesh
+from compas.datastructures import VolMesh
+from compas.geometry import Brep
+
+if TYPE_CHECKING:
+    from compas_model.elements import Element
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the memory footprint of a cached value, in bytes.
+
+    The estimate is based on the number of vertices and faces of meshes and breps,
+    and is only meant for comparing entries with each other and with a memory budget.
+
+    Parameters
+    ----------
+    value : Any
+        The cached value.
+
+    Returns
+    -------
+    int
+
+    """
+    if isinstance(value, VolMesh):
+        return 64 * value.number_of_vertices() + 128 * value.number_of_faces() + 64 * value.number_of_cells()
+    if isinstance(value, Mesh):
+        return 64 * value.number_of_vertices() + 128 * value.number_of_faces()
+    if isinstance(value, Brep):
+        return 1024 * len(value.faces)
+    coordinates = getattr(value, "_coordinates", None)
+    if coordinates is not None:
+        return 64 + coordinates.nbytes
+    nbytes = getattr(value, "nbytes", None)
+    if nbytes is not None:
+        return 64 + nbytes
+    return 64
+
+
+class _CacheTable:
+    __slots__ = ("values", "sizes", "counts", "size", "hits", "misses", "evictions", "heap", "ticks")
+
+    # a global clock for breaking ties between equal use counts, in order of last use
+    clock = count()
+
+    def __init__(self) -> None:
+        # plain dicts keep the values in insertion order with less memory per entry than an ordered dict
+        self.values: dict = {}
+        self.sizes: dict = {}
+        # the use counts of the values, only tracked while the cache has a budget
+        self.counts: dict = {}
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # a heap of (count, tick, element) entries for LFU eviction, created on first use
+        # entries of which the tick is not the current tick of the element are stale and skipped
+        self.heap: Optional[list] = None
+        self.ticks: dict = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def clear(self) -> None:
+        self.values.clear()
+        self.sizes.clear()
+        self.counts.clear()
+        self.size = 0
+        self.heap = None
+        self.ticks = {}
+
+    def touch(self, element) -> None:
+        if self.heap is not None:
+            tick = next(self.clock)
+            self.ticks[element] = tick
+            heappush(self.heap, (self.counts.get(element, 1), tick, element))
+
+    def pop(self, element) -> bool:
+        if element not in self.values:
+            return False
+        del self.values[element]
+        self.counts.pop(element, None)
+        self.ticks.pop(element, None)
+        self.size -= self.sizes.pop(element)
+        return True
+
+    def victims(self, policy: str, excess: int, protect=None) -> list:
+        victims = []
+        if policy == "lfu":
+            if self.heap is None or len(self.heap) > 2 * len(self.values) + 64:
+                # (re)build the heap from the current use counts, with ties in LRU order
+                self.ticks = {element: next(self.clock) for element in self.values}
+                self.heap = [(self.counts.get(element, 1), tick, element) for element, tick in self.ticks.items()]
+                heapify(self.heap)
+            kept = []
+            while self.heap and excess > 0:
+                entry = heappop(self.heap)
+                element = entry[2]
+                if self.ticks.get(element) != entry[1]:
+                    continue
+                if element is protect:
+                    kept.append(entry)
+                    continue
+                victims.append(element)
+                excess -= self.sizes[element]
+            for entry in kept:
+                heappush(self.heap, entry)
+        else:
+            # the least recently used values are at the front of the dict
+            for element in self.values:
+                if element is protect:
+                    continue
+                victims.append(element)
+                excess -= self.sizes[element]
+                if excess <= 0:
+                    break
+        return victims
+
+
+class ElementCache:
+    """Side table for the computed attributes of elements, organised per category.
+
+    The computed attributes of the elements of a model (AABB, OBB, model geometry, meshes, ...)
+    are not stored on the elements themselves, but in one table per category, keyed by element.
+    This keeps the elements small, and allows all cached values of one category to be dropped at once.
+
+    Parameters
+    ----------
+    budget : int, optional
+        The memory budget of the cache, in (estimated) bytes.
+        If None (default), the size of the cache is not bounded.
+    policies : dict[str, str], optional
+        The eviction policy per category: ``"lru"`` (least recently used, default) or ``"lfu"`` (least frequently used).
+
+    Attributes
+    ----------
+    categories : tuple[str, ...]
+        The categories of computed attributes that can be cached.
+    budget : int | None
+        The memory budget of the cache, in (estimated) bytes.
+    policies : dict[str, str]
+        The eviction policy per category.
+    size : int, read-only
+        The estimated size of all cached values, in bytes.
+
+    Notes
+    -----
+    If the estimated size of the cache exceeds the budget,
+    values are evicted from the category with the largest total size first, according to the policy of that category,
+    until the cache fits within the budget again.
+    The order and frequency of use of the cached values are only tracked while the cache has a budget,
+    such that reading a cached value without a budget is a plain lookup.
+    With the ``"lfu"`` policy, the least frequently used values are found with a heap of use counts that is maintained on access,
+    such that an eviction doesn't require sorting all values of the category.
+    Evicted values are recomputed on demand when the corresponding attribute of an element is accessed again.
+
+    """
+
+    __slots__ = ("_tables", "_budget", "policies")
+
+    categories = (
+        "elementgeometry",
+        "modelgeometry",
+        "modeltransformation",
+        "modelview",
+        "point",
+        "elementpoint",
+        "aabb",
+        "obb",
+        "collision_mesh",
+        "surface_mesh",
+        "volumetric_mesh",
+        "facetable",
+    )
+
+    def __init__(self, budget: Optional[int] = None, policies: Optional[dict[str, str]] = None) -> None:
+        self._tables: dict[str, _CacheTable] = {}
+        self._budget = budget
+        self.policies: dict[str, str] = dict(policies or {})
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self._tables.values())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tables)
+
+    @property
+    def budget(self) -> Optional[int]:
+        return self._budget
+
+    @budget.setter
+    def budget(self, budget: Optional[int]) -> None:
+        self._budget = budget
+        self.shrink()
+
+    @property
+    def size(self) -> int:
+        return sum(table.size for table in self._tables.values())
+
+    def get(self, category: str, element: "Element") -> Optional[Any]:
+        """Get the cached value of an element in a category.
+
+        Parameters
+        ----------
+        category : str
+            The category of the value.
+        element : Element
+            The element.
+
+        Returns
+        -------
+        Any | None
+            The cached value, or None if there is no cached value.
+
+        """
+        table = self._tables.get(category)
+        if table is None:
+            return None
+        value = table.values.get(element)
+        if value is None:
+            table.misses += 1
+            return None
+        table.hits += 1
+        if self._budget is not None:
+            self._use(table, element)
+        return value
+
+    def _use(self, table: _CacheTable, element: "Element") -> None:
+        # the order and frequency of use of the values only matter for eviction, which requires a budget
+        table.counts[element] = table.counts.get(element, 1) + 1
+        table.values[element] = table.values.pop(element)
+        table.touch(element)
+
+    def set(self, category: str, element: "Element", value: Any) -> None:
+        """Set the cached value of an element in a category.
+
+        Parameters
+        ----------
+        category : str
+            The category of the value.
+        element : Element
+            The element.
+        value : Any
+            The value.
+
+        Returns
+        -------
+        None
+
+        """
+        table = self._tables.get(category)
+        if table is None:
+            table = self._tables[category] = _CacheTable()
+        table.pop(element)
+        size = estimate_size(value)
+        table.values[element] = value
+        table.sizes[element] = size
+        table.size += size
+        table.touch(element)
+        if self._budget is not None:
+            self.shrink(protect=(category, element))
+
+    def discard(self, element: "Element", category: Optional[str] = None) -> None:
+        """Remove the cached values of an element.
+
+        Parameters
+        ----------
+        element : Element
+            The element.
+        category : str, optional
+            Only remove the value in this category.
+            By default, the values in all categories are removed.
+
+        Returns
+        -------
+        None
+
+        """
+        if category is not None:
+            table = self._tables.get(category)
+            if table is not None:
+                table.pop(element)
+        else:
+            for table in self._tables.values():
+                table.pop(element)
+
+    def evict(self, category: Optional[str] = None) -> None:
+        """Remove all cached values in a category.
+
+        Parameters
+        ----------
+        category : str, optional
+            The category.
+            By default, all categories are cleared.
+
+        Returns
+        -------
+        None
+
+        """
+        categories = list(self._tables) if category is None else [category]
+        for name in categories:
+            table = self._tables.get(name)
+            if table is not None:
+                table.evictions += len(table)
+                table.clear()
+
+    def shrink(self, protect: Optional[tuple[str, "Element"]] = None) -> int:
+        """Evict values until the estimated size of the cache fits within the budget.
+
+        Parameters
+        ----------
+        protect : tuple[str, Element], optional
+            A category and element of which the value should not be evicted.
+
+        Returns
+        -------
+        int
+            The number of evicted values.
+
+        """
+        if self._budget is None:
+            return 0
+
+        count = 0
+        excess = self.size - self._budget
+        exhausted = set()
+
+        while excess > 0:
+            candidates = [(table.size, name) for name, table in self._tables.items() if name not in exhausted and table.size > 0]
+            if not candidates:
+                break
+            _, name = max(candidates)
+            table = self._tables[name]
+            victims = table.victims(self.policies.get(name, "lru"), excess, protect[1] if protect and protect[0] == name else None)
+            for element in victims:
+                excess -= table.sizes[element]
+                table.pop(element)
+            table.evictions += len(victims)
+            count += len(victims)
+            exhausted.add(name)
+
+        return count
+
+    def count(self, category: str) -> int:
+        """Count the number of cached values in a category.
+
+        Parameters
+        ----------
+        category : str
+            The category.
+
+        Returns
+        -------
+        int
+
+        """
+        table = self._tables.get(category)
+        return len(table) if table is not None else 0
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Collect statistics about the use of the cache, per category.
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            For every category, the number of ``entries``, their estimated ``size``,
+            and the number of ``hits``, ``misses`` and ``evictions``.
+
+        """
+        return {
+            name: {
+                "entries": len(table),
+                "size": table.size,
+                "hits": table.hits,
+                "misses": table.misses,
+                "evictions": table.evictions,
+            }
+            for name, table in self._tables.items()
+        }
+
+
+class CachedAttribute:
+    """Descriptor for a computed attribute of an element, stored in the cache of the element.
+
+    The cache of an element is the cache of its model,
+    or a private cache if the element is not part of a model.
+
+    Parameters
+    ----------
+    category : str
+        The cache category of the attribute.
+
+    """
+
+    __slots__ = ("category",)
+
+    def __init__(self, category: str) -> None:
+        self.category = category
+
+    def __get__(self, element: Optional["Element"], owner=None):
+        if element is None:
+            return self
+        # inlined version of element._getcache and cache.get, since this is on the path of every read of a computed attribute
+        model = element.model
+        cache = model._cache if model is not None else element._localcache
+        if cache is None:
+            return None
+        table = cache._tables.get(self.category)
+        if table is None:
+            return None
+        value = table.values.get(element)
+        if value is None:
+            table.misses += 1
+            return None
+        table.hits += 1
+        if cache._budget is not None:
+            cache._use(table, element)
+        return value
+
+    def __set__(self, element: "Element", value: Any) -> None:
+        if value is None:
+            cache = element._getcache()
+            if cache is not None:
+                cache.discard(element, self.category)
+        else:
+            element._getcache(create=True).set(self.category, element, value)  # type: ignore
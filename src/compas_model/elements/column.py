@@ -8,6 +8,7 @@ from compas.geometry import Point
 from compas.geometry import Transformation
 from compas_model.elements import Element
 from compas_model.elements.element import Feature
+from compas_model.elements.element import reset_computed
 
 # from compas_model.interactions import BooleanModifier
 # from compas_model.interactions import Modifier
@@ -82,6 +83,7 @@ class ColumnElement(Element):
         return self.box.xsize
 
     @width.setter
+    @reset_computed
     def width(self, width: float):
         self.box.xsize = width
 
@@ -90,6 +92,7 @@ class ColumnElement(Element):
         return self.box.ysize
 
     @depth.setter
+    @reset_computed
     def depth(self, depth: float):
         self.box.ysize = depth
 
@@ -98,6 +101,7 @@ class ColumnElement(Element):
         return self.box.zsize
 
     @height.setter
+    @reset_computed
     def height(self, height: float):
         self.box.zsize = height
         self.box.frame = Frame(point=[0, 0, self.box.zsize / 2], xaxis=[1, 0, 0], yaxis=[0, 1, 0])
@@ -119,6 +123,21 @@ class ColumnElement(Element):
         """
         return self.box.to_mesh()
 
+    def compute_prototypekey(self) -> Optional[tuple]:
+        """Compute the key of the shared prototype of the column geometry from the dimensions, location and orientation of its box.
+
+        Returns
+        -------
+        tuple | None
+            None if the column has features.
+
+        """
+        if self.features:
+            return None
+        frame = self.box.frame
+        return (self.__dtype__, self.box.xsize, self.box.ysize, self.box.zsize, *frame.point, *frame.xaxis, *frame.yaxis)
+
+    @reset_computed
     def extend(self, distance: float) -> None:
         """Extend the beam.
 
@@ -185,15 +204,15 @@ class ColumnElement(Element):
         """
         raise NotImplementedError
 
-    def compute_point(self) -> Point:
-        """Compute the reference point of the column from the centroid of its geometry.
+    def compute_elementpoint(self) -> Point:
+        """Compute the reference point of the column from the center of its box.
 
         Returns
         -------
         Point
 
         """
-        return Point(*self.modelgeometry.centroid())
+        return self.box.frame.point.copy()
 
     # =============================================================================
     # Modifier methods (WIP)
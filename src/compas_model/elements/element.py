@@ -2,6 +2,8 @@ from functools import reduce
 from functools import wraps
 from operator import mul
 from typing import TYPE_CHECKING
+from typing import Generator
+from typing import Hashable
 from typing import Optional
 from typing import Sequence
 from typing import Type
@@ -16,12 +18,18 @@ from compas.geometry import Brep
 from compas.geometry import Frame
 from compas.geometry import Point
 from compas.geometry import Transformation
+from compas_model.algorithms import BrepFaceTable
 from compas_model.algorithms import brep_brep_contacts
 from compas_model.algorithms import mesh_mesh_contacts
+from compas_model.geometry import GeometryView
 from compas_model.interactions import Contact
 from compas_model.materials import Material
 from compas_model.modifiers import Modifier
 
+from .cache import CachedAttribute
+from .cache import ElementCache
+from .prototypes import PROTOTYPES
+
 if TYPE_CHECKING:
     from compas_model.models import ElementNode
     from compas_model.models import Model
@@ -31,15 +39,11 @@ def reset_computed(f):
     @wraps(f)
     def wrapper(*args, **kwargs):
         self: Element = args[0]
-        self._aabb = None
-        self._obb = None
-        self._collision_mesh = None
-        self._elementgeometry = None
-        self._modelgeometry = None
-        self._modeltransformation = None
-        self._point = None
-        self._surface_mesh = None
-        self._volumetric_mesh = None
+        cache = self._getcache()
+        if cache is not None:
+            cache.discard(self)
+        if self.model is not None and self.model._arrays is not None:
+            self.model._arrays.invalidate(self)
         return f(*args, **kwargs)
 
     return wrapper
@@ -107,8 +111,12 @@ class Element(Data):
         The coordinate frame corresponding to the model transformation of the element: ``Frame.from_transformation(self.modeltransformation)``
     elementgeometry : Mesh | Brep, readonly
         The geometry of the element in element coordinates.
+        Elements with a prototype key share this geometry with all other elements with the same key.
     modelgeometry : Mesh | Brep, readonly
         The geometry of the element in model coordinates: ``self.elementgeometry.transformed(self.modeltransformation)``.
+    modelview : GeometryView, readonly
+        A view of the geometry of the element in model coordinates that doesn't copy the element geometry.
+        If modifiers act on the element, this is a view of the model geometry.
     aabb : Box, readonly
         The Axis Aligned Bounding Box (AABB) of the model geometry of the element.
     obb : Box, readonly
@@ -116,16 +124,26 @@ class Element(Data):
     collision_mesh : Mesh, readonly
         The collision mesh of the model geometry of the element.
     point : Point, readonly
-        The reference location of the element.
-        This is, for example, the centroid of the model geometry.
+        The reference location of the element in model coordinates.
+        By default, this is the element point transformed by the model transformation,
+        which does not require the computation of the model geometry.
+    elementpoint : Point, readonly
+        The reference location of the element in element coordinates.
+        This is, for example, the centroid of the parametric shape of the element.
     surface_mesh : Mesh, readonly
         A triangle mesh representing the surface boundary of the model geometry of the element, for example for FEA.
     volumetric_mesh : VolMesh, readonly
         A tetrahedral mesh representing the internal volume of the model geometry of the element, for example for FEA.
+    facetable : BrepFaceTable | None, readonly
+        The polygons, normals, areas and holes of the planar faces of the model geometry of the element, for contact calculations.
+        None if the model geometry is not a brep.
 
     Notes
     -----
-
+    The computed attributes of an element are stored in a side table, the [`ElementCache`][compas_model.elements.ElementCache] of its model,
+    rather than on the element itself.
+    The cached values of one category (for example all surface meshes) can therefore be evicted at once,
+    using [`Model.cache`][compas_model.models.Model.cache].
 
     """
 
@@ -133,6 +151,19 @@ class Element(Data):
     treenode: "ElementNode"
     graphnode: int
 
+    _elementgeometry = CachedAttribute("elementgeometry")
+    _modelgeometry = CachedAttribute("modelgeometry")
+    _modeltransformation = CachedAttribute("modeltransformation")
+    _modelview = CachedAttribute("modelview")
+    _point = CachedAttribute("point")
+    _elementpoint = CachedAttribute("elementpoint")
+    _aabb = CachedAttribute("aabb")
+    _obb = CachedAttribute("obb")
+    _collision_mesh = CachedAttribute("collision_mesh")
+    _surface_mesh = CachedAttribute("surface_mesh")
+    _volumetric_mesh = CachedAttribute("volumetric_mesh")
+    _facetable = CachedAttribute("facetable")
+
     @property
     def __data__(self) -> dict:
         return {
@@ -164,16 +195,9 @@ class Element(Data):
         if material:
             self.material = material
 
-        self._elementgeometry = None
-        self._modelgeometry = None
-        self._modeltransformation = None
-
-        self._point = None
-        self._aabb = None
-        self._obb = None
-        self._collision_mesh = None
-        self._surface_mesh = None
-        self._volumetric_mesh = None
+        # computed attributes are stored in the cache of the model
+        # or in this private cache if the element is not part of a model
+        self._localcache: Optional[ElementCache] = None
 
         self._is_dirty = True
 
@@ -184,6 +208,20 @@ class Element(Data):
     def __str__(self) -> str:
         return f"<Element {self.name}>"
 
+    @property
+    def name(self) -> str:
+        return self._name or self.__class__.__name__
+
+    @name.setter
+    def name(self, name: str) -> None:
+        # keep the name index of the model up to date
+        # the model can be only partially reconstructed while it is copied or unpickled
+        model = getattr(self, "model", None)
+        index = getattr(model, "_index", None)
+        if index is not None:
+            index.rename(self, name)
+        self._name = name
+
     @property
     def geometry(self) -> Optional[Union[Mesh, Brep]]:
         return self._geometry
@@ -201,6 +239,14 @@ class Element(Data):
     @reset_computed
     def transformation(self, transformation: Transformation) -> None:
         self._transformation = transformation
+        # the model transformations of the descendants depend on this transformation
+        if self.treenode is not None and self.model is not None:
+            for node in self.treenode.traverse():
+                if node is self.treenode:
+                    continue
+                self.model._cache.discard(node.element)
+                if self.model._arrays is not None:
+                    self.model._arrays.invalidate(node.element)
 
     @property
     def frame(self) -> Frame:
@@ -245,10 +291,21 @@ class Element(Data):
     # Computed attributes
     # ==========================================================================
 
+    def _getcache(self, create: bool = False) -> Optional[ElementCache]:
+        if self.model is not None:
+            return self.model._cache
+        if self._localcache is None and create:
+            self._localcache = ElementCache()
+        return self._localcache
+
     @property
     def elementgeometry(self) -> Union[Brep, Mesh]:
         if self._elementgeometry is None:
-            self._elementgeometry = self.compute_elementgeometry()
+            key = self.compute_prototypekey()
+            if key is None:
+                self._elementgeometry = self.compute_elementgeometry()
+            else:
+                self._elementgeometry = PROTOTYPES.get(key, self.compute_elementgeometry)
         return self._elementgeometry
 
     @property
@@ -263,17 +320,25 @@ class Element(Data):
             self._modelgeometry = self.compute_modelgeometry()
         return self._modelgeometry
 
+    @property
+    def modelview(self) -> GeometryView:
+        if self._modelview is None:
+            self._modelview = self.compute_modelview()
+        return self._modelview
+
     @property
     def aabb(self) -> Box:
-        if not self._aabb:
-            self._aabb = self.compute_aabb()
-        return self._aabb
+        aabb = self._aabb
+        if not aabb:
+            aabb = self._aabb = self.compute_aabb()
+        return aabb
 
     @property
     def obb(self) -> Box:
-        if not self._obb:
-            self._obb = self.compute_obb()
-        return self._obb
+        obb = self._obb
+        if not obb:
+            obb = self._obb = self.compute_obb()
+        return obb
 
     @property
     def dimensions(self) -> tuple[float, float, float]:
@@ -281,27 +346,44 @@ class Element(Data):
 
     @property
     def collision_mesh(self) -> Mesh:
-        if not self._collision_mesh:
-            self._collision_mesh = self.compute_collision_mesh()
-        return self._collision_mesh
+        collision_mesh = self._collision_mesh
+        if not collision_mesh:
+            collision_mesh = self._collision_mesh = self.compute_collision_mesh()
+        return collision_mesh
 
     @property
     def point(self) -> Point:
-        if not self._point:
-            self._point = self.compute_point()
-        return self._point
+        point = self._point
+        if not point:
+            point = self._point = self.compute_point()
+        return point
+
+    @property
+    def elementpoint(self) -> Point:
+        elementpoint = self._elementpoint
+        if not elementpoint:
+            elementpoint = self._elementpoint = self.compute_elementpoint()
+        return elementpoint
 
     @property
     def surface_mesh(self) -> Mesh:
-        if not self._surface_mesh:
-            self._surface_mesh = self.compute_surface_mesh()
-        return self._surface_mesh
+        surface_mesh = self._surface_mesh
+        if not surface_mesh:
+            surface_mesh = self._surface_mesh = self.compute_surface_mesh()
+        return surface_mesh
 
     @property
     def volumetric_mesh(self) -> VolMesh:
-        if not self._volumetric_mesh:
-            self._volumetric_mesh = self.compute_volumetric_mesh()
-        return self._volumetric_mesh
+        volumetric_mesh = self._volumetric_mesh
+        if not volumetric_mesh:
+            volumetric_mesh = self._volumetric_mesh = self.compute_volumetric_mesh()
+        return volumetric_mesh
+
+    @property
+    def facetable(self) -> Optional[BrepFaceTable]:
+        if self._facetable is None:
+            self._facetable = self.compute_facetable()
+        return self._facetable
 
     # ==========================================================================
     # Abstract methods
@@ -325,6 +407,21 @@ class Element(Data):
         """
         raise NotImplementedError
 
+    def compute_prototypekey(self) -> Optional[Hashable]:
+        """Compute the key identifying the shared prototype of the element geometry.
+
+        Elements with the same key share one instance of their element geometry,
+        and only differ in their transformation.
+
+        Returns
+        -------
+        Hashable | None
+            The key, consisting of the element type and its parametric data.
+            None if the element geometry should not be shared (default).
+
+        """
+        return None
+
     def compute_modeltransformation(self) -> Transformation:
         """Compute the transformation to model coordinates of this element
         based on its position in the spatial hierarchy of the model.
@@ -364,17 +461,29 @@ class Element(Data):
         xform = self.modeltransformation
         modelgeometry = self.elementgeometry.transformed(xform)
 
-        for nbr in self.model.graph.neighbors_in(self.graphnode):
-            modifiers: list[Modifier] = self.model.graph.edge_attribute((nbr, self.graphnode), name="modifiers")  # type: ignore
-            if modifiers:
-                source = self.model.graph.node_element(nbr)
-                for modifier in modifiers:
-                    modelgeometry = modifier.apply(source, modelgeometry)
+        for source, modifier in self.modifiers():
+            modelgeometry = modifier.apply(source, modelgeometry)
 
         # self.is_dirty = False
 
         return modelgeometry
 
+    def compute_modelview(self) -> GeometryView:
+        """Compute a view of the geometry of the element in model coordinates.
+
+        If no modifiers act on the element, the view refers to the element geometry and the model transformation,
+        and the element geometry is not copied.
+        Otherwise, the view refers to the model geometry.
+
+        Returns
+        -------
+        GeometryView
+
+        """
+        if self._modelgeometry is not None or any(True for _ in self.modifiers()):
+            return GeometryView(self.modelgeometry)
+        return GeometryView(self.elementgeometry, self.modeltransformation)
+
     def compute_aabb(self, inflate: float = 1.0) -> Box:
         """Computes the Axis Aligned Bounding Box (AABB) of the geometry of the element.
 
@@ -423,8 +532,28 @@ class Element(Data):
         """
         raise NotImplementedError
 
-    def compute_point(self) -> Point:
-        """Computes a reference point for the element geometry (e.g. the centroid).
+    def compute_elementpoint(self) -> Point:
+        """Computes a reference point for the element in element coordinates.
+
+        The default implementation uses the centroid of the element geometry.
+        Elements with a parametric shape should override this with a cheaper computation.
+
+        Returns
+        -------
+        Point
+            The reference point in element coordinates.
+
+        """
+        return Point(*self.elementgeometry.centroid())
+
+    def compute_point(self, precise: bool = False) -> Point:
+        """Computes a reference point for the element in model coordinates.
+
+        Parameters
+        ----------
+        precise : bool, optional
+            If True, use the centroid of the model geometry, including the effect of all modifiers.
+            Otherwise, transform the (cached) element point to model coordinates.
 
         Returns
         -------
@@ -432,7 +561,9 @@ class Element(Data):
             The reference point.
 
         """
-        raise NotImplementedError
+        if precise:
+            return Point(*self.modelgeometry.centroid())
+        return self.elementpoint.transformed(self.modeltransformation)
 
     def compute_surface_mesh(self, meshsize_min: Optional[float] = None, meshsize_max: Optional[float] = None) -> Mesh:
         """Computes the triangulated surface mesh of the element's model geometry.
@@ -470,6 +601,20 @@ class Element(Data):
         """
         raise NotImplementedError
 
+    def compute_facetable(self) -> Optional[BrepFaceTable]:
+        """Computes the table of the planar faces of the element's model geometry, for contact calculations.
+
+        Returns
+        -------
+        :class:`compas_model.algorithms.BrepFaceTable` | None
+            The face table, or None if the model geometry is not a brep.
+
+        """
+        modelgeometry = self.modelgeometry
+        if isinstance(modelgeometry, Brep):
+            return BrepFaceTable(modelgeometry)
+        return None
+
     def compute_contacts(
         self,
         other: "Element",
@@ -508,6 +653,8 @@ class Element(Data):
                 tolerance=tolerance,
                 minimum_area=minimum_area,
                 contacttype=contacttype,
+                a_table=self.facetable,
+                b_table=other.facetable,
             )
         raise NotImplementedError
 
@@ -521,6 +668,28 @@ class Element(Data):
         """
         raise NotImplementedError
 
+    def modifiers(self) -> Generator[tuple["Element", Modifier], None, None]:
+        """Iterate over the modifiers acting on this element.
+
+        Yields
+        ------
+        tuple[Element, Modifier]
+            The source element of the modifier, and the modifier.
+
+        """
+        if self.model is None:
+            return
+        graph = self.model.graph
+        for nbr in graph.adjacency[self.graphnode]:
+            # the edge to this element, also if there is an edge in the opposite direction
+            if self.graphnode not in graph.edge[nbr]:
+                continue
+            modifiers: list[Modifier] = graph.edge_attribute((nbr, self.graphnode), name="modifiers")  # type: ignore
+            if modifiers:
+                source = graph.node_element(nbr)
+                for modifier in modifiers:
+                    yield source, modifier
+
     # ==========================================================================
     # Transformations
     # ==========================================================================
@@ -565,6 +734,7 @@ class Element(Data):
     # Methods
     # ==========================================================================
 
+    @reset_computed
     def add_feature(self, feature: Feature) -> None:
         """Add a feature to the list of features of the element.
 
@@ -577,5 +747,10 @@ class Element(Data):
         -------
         None
 
+        Notes
+        -----
+        The computed attributes of the element are reset,
+        such that the element no longer refers to a shared prototype of its element geometry.
+
         """
         self.features.append(feature)
@@ -6,6 +6,7 @@ from compas.geometry import Point
 from compas.geometry import Polygon
 from compas.geometry import Transformation
 from compas.geometry import Vector
+from compas.geometry import centroid_points
 from compas.itertools import pairwise
 from compas_model.elements.element import Element
 from compas_model.elements.element import Feature
@@ -104,7 +105,7 @@ class PlateElement(Element):
     # =============================================================================
 
     def compute_aabb(self, inflate: float = 1.0) -> Box:
-        box = self.modelgeometry.aabb()
+        box = self.modelview.aabb()
         if inflate != 1.0:
             box.xsize *= inflate
             box.ysize *= inflate
@@ -113,7 +114,7 @@ class PlateElement(Element):
         return box
 
     def compute_obb(self, inflate: float = 1.0) -> Box:
-        box = self.modelgeometry.obb()
+        box = self.modelview.obb()
         if inflate != 1.0:
             box.xsize *= inflate
             box.ysize *= inflate
@@ -121,5 +122,12 @@ class PlateElement(Element):
         self._obb = box
         return box
 
-    def compute_point(self) -> Point:
-        return Point(*self.modelgeometry.centroid())
+    def compute_elementpoint(self) -> Point:
+        """Compute the reference point of the plate from the centroids of its bottom and top polygons.
+
+        Returns
+        -------
+        Point
+
+        """
+        return Point(*centroid_points([self.bottom.centroid, self.top.centroid]))
@@ -0,0 +1,84 @@
+from typing import Callable
+from typing import Hashable
+from typing import Union
+from weakref import WeakValueDictionary
+
+from compas.datastructures import Mesh
+from compas.geometry import Brep
+
+
+class PrototypeRegistry:
+    """Registry of shared, immutable element geometry prototypes.
+
+    Elements with identical parametric data can share a single instance of their element geometry.
+    The registry maps a prototype key, consisting of the element type and its parametric data,
+    to the geometry that was computed first for that key.
+
+    Attributes
+    ----------
+    hits : int
+        The number of times a prototype was reused.
+    misses : int
+        The number of times a prototype had to be computed.
+
+    Notes
+    -----
+    Prototypes are stored with weak references.
+    A prototype is dropped from the registry as soon as no element refers to it anymore.
+
+    Shared prototypes should be treated as read-only.
+    Any modification of a prototype affects all elements referring to it.
+
+    """
+
+    def __init__(self) -> None:
+        self._prototypes: WeakValueDictionary = WeakValueDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._prototypes)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._prototypes
+
+    def get(self, key: Hashable, factory: Callable[[], Union[Mesh, Brep]]) -> Union[Mesh, Brep]:
+        """Get the prototype for the given key, or compute it with the factory if it doesn't exist yet.
+
+        Parameters
+        ----------
+        key : Hashable
+            The prototype key.
+        factory : Callable[[], Mesh | Brep]
+            A function computing the geometry of the prototype.
+
+        Returns
+        -------
+        Mesh | Brep
+
+        """
+        geometry = self._prototypes.get(key)
+        if geometry is None:
+            self.misses += 1
+            geometry = factory()
+            self._prototypes[key] = geometry
+        else:
+            self.hits += 1
+        return geometry
+
+    def clear(self) -> None:
+        """Remove all prototypes from the registry.
+
+        Elements that already refer to a prototype keep their reference.
+
+        Returns
+        -------
+        None
+
+        """
+        self._prototypes.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+PROTOTYPES = PrototypeRegistry()
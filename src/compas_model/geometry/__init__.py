@@ -1,4 +1,5 @@
 from .bbox import combine_aabbs
+from .bbox import combine_aabb_extents
 from .bbox import combine_obbs
 from .bbox import pca_box
 
@@ -24,9 +25,17 @@ from .minkowski2 import minkowski_difference_xy
 
 from .gjk2 import is_collision_poly_poly_xy
 
+from .polygon import polygon_frame
+from .polygon import bestfit_frames_numpy
+
+from .views import GeometryView
+
 
 __all__ = [
+    "GeometryView",
+    "bestfit_frames_numpy",
     "combine_aabbs",
+    "combine_aabb_extents",
     "combine_obbs",
     "intersection_ray_triangle",
     "intersections_line_aabb",
@@ -46,4 +55,5 @@ __all__ = [
     "minkowski_difference_xy",
     "minkowski_sum_xy",
     "pca_box",
+    "polygon_frame",
 ]
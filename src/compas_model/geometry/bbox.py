@@ -1,5 +1,6 @@
 from numpy import array
 from numpy import asarray
+from numpy import ndarray
 from scipy.linalg import svd
 
 from compas.geometry import Box
@@ -105,6 +106,23 @@ def combine_aabbs(boxes: list[Box]) -> Box:
 
     """
     extents = array([[box.xmin, box.ymin, box.zmin, box.xmax, box.ymax, box.zmax] for box in boxes])
+    return combine_aabb_extents(extents)
+
+
+def combine_aabb_extents(extents: ndarray) -> Box:
+    """Combine the extents of multiple axis-aligned bounding boxes into a single axis-aligned bounding box.
+
+    Parameters
+    ----------
+    extents : ndarray
+        An (n, 6) array of box extents: ``[xmin, ymin, zmin, xmax, ymax, zmax]``.
+
+    Returns
+    -------
+    Box
+
+    """
+    extents = asarray(extents, dtype=float).reshape(-1, 6)
     mins = extents.min(axis=0)
     maxs = extents.max(axis=0)
     xmin, ymin, zmin = mins[:3]
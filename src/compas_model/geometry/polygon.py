@@ -0,0 +1,113 @@
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+from numpy import asarray
+from numpy import cross
+from numpy import empty
+from numpy import float64
+from numpy import ndarray
+from numpy.linalg import svd
+
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+from compas.geometry import centroid_points
+from compas.geometry import cross_vectors
+from compas.geometry import dot_vectors
+from compas.geometry import normal_polygon
+from compas.geometry import normalize_vector
+from compas.geometry import subtract_vectors
+
+
+def polygon_frame(points: Sequence[Union[Point, list[float]]], normal: Optional[Union[Vector, list[float]]] = None) -> Frame:
+    """Compute a local coordinate frame of a planar polygon from its normal and a reference edge.
+
+    Parameters
+    ----------
+    points : Sequence[Point | list[float]]
+        The corner points of the polygon.
+    normal : Vector | list[float], optional
+        The normal of the polygon.
+        If no normal is provided, it is computed from the points.
+
+    Returns
+    -------
+    Frame
+        A frame with the centroid of the corner points as origin,
+        the normal as Z axis, and the longest edge of the polygon as the direction of the X axis.
+
+    Notes
+    -----
+    This is a cheap alternative to [`compas.geometry.bestfit_frame_numpy`][compas.geometry.bestfit_frame_numpy]
+    for polygons of which the normal is known already, for example the faces of a mesh or a brep.
+
+    Examples
+    --------
+    >>> frame = polygon_frame([[0, 0, 0], [2, 0, 0], [2, 1, 0], [0, 1, 0]])
+    >>> frame.point
+    Point(x=1.0, y=0.5, z=0.0)
+    >>> frame.xaxis, frame.zaxis
+    (Vector(x=1.0, y=0.0, z=0.0), Vector(x=0.0, y=0.0, z=1.0))
+
+    """
+    zaxis = normalize_vector(normal if normal is not None else normal_polygon(points))
+
+    xaxis = None
+    length = 0.0
+    for a, b in zip(points, list(points[1:]) + [points[0]]):
+        edge = subtract_vectors(b, a)
+        # remove the component along the normal
+        edge = subtract_vectors(edge, [axis * dot_vectors(edge, zaxis) for axis in zaxis])
+        size = dot_vectors(edge, edge)
+        if size > length:
+            xaxis = edge
+            length = size
+
+    if xaxis is None:
+        xaxis = [1.0, 0.0, 0.0] if abs(zaxis[0]) < 0.9 else [0.0, 1.0, 0.0]
+        xaxis = subtract_vectors(xaxis, [axis * dot_vectors(xaxis, zaxis) for axis in zaxis])
+
+    xaxis = normalize_vector(xaxis)
+    yaxis = cross_vectors(zaxis, xaxis)
+    return Frame(centroid_points(points), xaxis, yaxis)
+
+
+def bestfit_frames_numpy(pointsets: Sequence[Sequence[Union[Point, list[float]]]]) -> tuple[ndarray, ndarray, ndarray, ndarray]:
+    """Compute the best-fit frames of multiple sets of points at once.
+
+    Parameters
+    ----------
+    pointsets : Sequence[Sequence[Point | list[float]]]
+        The sets of points.
+
+    Returns
+    -------
+    tuple[ndarray, ndarray, ndarray, ndarray]
+        The origins, X axes, Y axes and Z axes of the frames, as (n, 3) arrays.
+
+    Notes
+    -----
+    The frames are the same as the frames computed by [`compas.geometry.bestfit_frame_numpy`][compas.geometry.bestfit_frame_numpy],
+    up to the orientation of the axes,
+    but the singular value decompositions of all sets with the same number of points are computed in a single, stacked call.
+
+    """
+    n = len(pointsets)
+    origins = empty((n, 3), dtype=float64)
+    xaxes = empty((n, 3), dtype=float64)
+    yaxes = empty((n, 3), dtype=float64)
+
+    groups: dict[int, list[int]] = {}
+    for index, points in enumerate(pointsets):
+        groups.setdefault(len(points), []).append(index)
+
+    for indices in groups.values():
+        points = asarray([pointsets[index] for index in indices], dtype=float64)
+        centroids = points.mean(axis=1)
+        _, _, vt = svd(points - centroids[:, None, :], full_matrices=False)
+        origins[indices] = centroids
+        xaxes[indices] = vt[:, 0]
+        yaxes[indices] = vt[:, 1]
+
+    return origins, xaxes, yaxes, cross(xaxes, yaxes)
@@ -0,0 +1,135 @@
+from typing import Optional
+from typing import Union
+
+from numpy import asarray
+from numpy import ndarray
+from numpy import ones
+
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas.geometry import Brep
+from compas.geometry import Point
+from compas.geometry import Transformation
+from compas.geometry import oriented_bounding_box_numpy
+
+from .bbox import combine_aabb_extents
+
+
+class GeometryView:
+    """A transformed view of a geometry object that does not copy the underlying geometry.
+
+    Parameters
+    ----------
+    geometry : Mesh | Brep
+        The geometry in local coordinates.
+    transformation : Transformation, optional
+        The transformation from local to target coordinates.
+        If None, the view coincides with the geometry.
+
+    Attributes
+    ----------
+    geometry : Mesh | Brep
+        The geometry in local coordinates.
+    transformation : Transformation | None
+        The transformation from local to target coordinates.
+
+    Notes
+    -----
+    The coordinates of the vertices are only computed when requested,
+    as a single matrix product over all vertices, and cached afterwards.
+    A transformed copy of the geometry can be created explicitly with [`to_geometry`][to_geometry].
+
+    Examples
+    --------
+    >>> from compas.geometry import Box, Translation
+    >>> from compas_model.geometry import GeometryView
+    >>> view = GeometryView(Box(1).to_mesh(), Translation.from_vector([1, 0, 0]))
+    >>> view.centroid()
+    Point(x=1.0, y=0.0, z=0.0)
+
+    """
+
+    def __init__(self, geometry: Union[Mesh, Brep], transformation: Optional[Transformation] = None) -> None:
+        self.geometry = geometry
+        self.transformation = transformation
+        self._coordinates = None
+
+    def __repr__(self) -> str:
+        return "{}(geometry={!r}, transformation={!r})".format(type(self).__name__, self.geometry, self.transformation)
+
+    def local_coordinates(self) -> ndarray:
+        """Compute the coordinates of the vertices of the geometry in local coordinates.
+
+        Returns
+        -------
+        ndarray
+            An (n, 3) array of vertex coordinates.
+
+        """
+        if isinstance(self.geometry, Mesh):
+            return asarray(self.geometry.vertices_attributes("xyz"), dtype=float).reshape(-1, 3)
+        return asarray([vertex.point for vertex in self.geometry.vertices], dtype=float).reshape(-1, 3)
+
+    def coordinates(self) -> ndarray:
+        """Compute the coordinates of the vertices of the geometry in target coordinates.
+
+        Returns
+        -------
+        ndarray
+            An (n, 3) array of vertex coordinates.
+
+        """
+        if self._coordinates is None:
+            xyz = self.local_coordinates()
+            if self.transformation is not None:
+                xyzw = ones((xyz.shape[0], 4))
+                xyzw[:, :3] = xyz
+                xyzw = xyzw @ asarray(self.transformation.matrix, dtype=float).T
+                xyz = xyzw[:, :3] / xyzw[:, 3:]
+            self._coordinates = xyz
+        return self._coordinates
+
+    def centroid(self) -> Point:
+        """Compute the centroid of the vertices of the transformed geometry.
+
+        Note that this is not necessarily the same as the (area or volume weighted) centroid of the geometry itself.
+
+        Returns
+        -------
+        Point
+
+        """
+        return Point(*self.coordinates().mean(axis=0))
+
+    def aabb(self) -> Box:
+        """Compute the axis-aligned bounding box of the transformed geometry.
+
+        Returns
+        -------
+        Box
+
+        """
+        xyz = self.coordinates()
+        return combine_aabb_extents([*xyz.min(axis=0), *xyz.max(axis=0)])
+
+    def obb(self) -> Box:
+        """Compute an oriented bounding box of the transformed geometry.
+
+        Returns
+        -------
+        Box
+
+        """
+        return Box.from_bounding_box(oriented_bounding_box_numpy(self.coordinates()))
+
+    def to_geometry(self) -> Union[Mesh, Brep]:
+        """Create a transformed copy of the geometry.
+
+        Returns
+        -------
+        Mesh | Brep
+
+        """
+        if self.transformation is None:
+            return self.geometry.copy()
+        return self.geometry.transformed(self.transformation)
@@ -1,5 +1,11 @@
 from .contact import Contact
+from .contacttable import ContactTable
+from .contacttable import ContactView
+from .interfacemesh import InterfaceMesh
 
 __all__ = [
     "Contact",
+    "ContactTable",
+    "ContactView",
+    "InterfaceMesh",
 ]
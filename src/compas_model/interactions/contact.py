@@ -6,7 +6,8 @@ from compas.geometry import Brep
 from compas.geometry import Frame
 from compas.geometry import Point
 from compas.geometry import Polygon
-from compas.geometry import bestfit_frame_numpy
+from compas.geometry import Transformation
+from compas_model.geometry import polygon_frame
 
 # only required param should be `points`, as in "contact points"
 # everything else can be computed from those points if needed
@@ -96,9 +97,7 @@ class Contact(Data):
     @property
     def frame(self) -> Frame:
         if self._frame is None:
-            self._frame = Frame(*bestfit_frame_numpy(self.points))
-            if self._frame.zaxis.dot(self.polygon.normal) < 0:
-                self._frame.invert()
+            self._frame = polygon_frame(self.points, self.polygon.normal)
         return self._frame
 
     @property
@@ -130,3 +129,43 @@ class Contact(Data):
         if self._size is None:
             self._size = self.polygon.area
         return self._size
+
+    def transform(self, transformation: Transformation) -> None:
+        """Transform the contact.
+
+        Parameters
+        ----------
+        transformation : :class:`compas.geometry.Transformation`
+            The transformation.
+
+        Returns
+        -------
+        None
+
+        """
+        self._polygon.transform(transformation)
+        if self._frame is not None:
+            self._frame.transform(transformation)
+        if self._mesh is not None:
+            self._mesh.transform(transformation)
+        if self._holes:
+            for hole in self._holes:
+                hole.transform(transformation)
+        self._brep = None
+
+    def transformed(self, transformation: Transformation) -> "Contact":
+        """Return a transformed copy of the contact.
+
+        Parameters
+        ----------
+        transformation : :class:`compas.geometry.Transformation`
+            The transformation.
+
+        Returns
+        -------
+        Contact
+
+        """
+        contact = self.copy()
+        contact.transform(transformation)
+        return contact
@@ -0,0 +1,229 @@
+from typing import TYPE_CHECKING
+from typing import Iterable
+from typing import Iterator
+
+from numpy import array
+from numpy import asarray
+from numpy import cumsum
+from numpy import empty
+from numpy import float64
+from numpy import int64
+from numpy import ndarray
+from numpy import zeros
+
+from compas.geometry import Frame
+from compas.geometry import Polygon
+
+from .contact import Contact
+
+if TYPE_CHECKING:
+    from compas.datastructures import Graph
+
+
+class ContactView:
+    """Lightweight, read-only view of one contact in a contact table.
+
+    Parameters
+    ----------
+    table : ContactTable
+        The table.
+    index : int
+        The index of the contact in the table.
+
+    Attributes
+    ----------
+    points : ndarray
+        The corner points of the contact polygon, as an (k, 3) view of the vertex array of the table.
+    polygon : :class:`compas.geometry.Polygon`
+        The contact polygon.
+    frame : :class:`compas.geometry.Frame`
+        The local coordinate frame of the contact.
+    size : float
+        The area of the contact polygon.
+    edge : tuple[int, int]
+        The edge of the interaction graph to which the contact belongs.
+
+    """
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: "ContactTable", index: int) -> None:
+        self.table = table
+        self.index = index
+
+    def __repr__(self) -> str:
+        return "ContactView(index={}, edge={})".format(self.index, self.edge)
+
+    @property
+    def points(self) -> ndarray:
+        return self.table.points[self.table.offsets[self.index] : self.table.offsets[self.index + 1]]
+
+    @property
+    def polygon(self) -> Polygon:
+        return Polygon(self.points.tolist())
+
+    @property
+    def frame(self) -> Frame:
+        return Frame(self.table.origins[self.index].tolist(), self.table.xaxes[self.index].tolist(), self.table.yaxes[self.index].tolist())
+
+    @property
+    def size(self) -> float:
+        return float(self.table.areas[self.index])
+
+    @property
+    def edge(self) -> tuple[int, int]:
+        u, v = self.table.edges[self.table.edge_ids[self.index]].tolist()
+        return u, v
+
+    def to_contact(self) -> Contact:
+        """Create an independent contact object from the data in the table.
+
+        Returns
+        -------
+        :class:`compas_model.interactions.Contact`
+
+        """
+        return Contact(points=self.points.tolist(), frame=self.frame, size=self.size)
+
+
+class ContactTable:
+    """Columnar store of the contacts of the interactions of a model.
+
+    Parameters
+    ----------
+    edges : Iterable[tuple[int, int]], optional
+        The edges of the interaction graph.
+    contacts : Iterable[list[Contact]], optional
+        For every edge, the list of its contacts.
+
+    Attributes
+    ----------
+    edges : ndarray
+        An (m, 2) array with the edges of the interaction graph that have contacts.
+    edge_offsets : ndarray
+        An (m + 1,) array with the offsets of the contacts of every edge in the contact arrays.
+    edge_ids : ndarray
+        An (n,) array with for every contact the index of its edge in ``edges``.
+    offsets : ndarray
+        An (n + 1,) array with the offsets of the polygon vertices of every contact in ``points``.
+    points : ndarray
+        A (p, 3) array with the polygon vertices of all contacts.
+    origins : ndarray
+        An (n, 3) array with the origins of the contact frames.
+    xaxes : ndarray
+        An (n, 3) array with the X axes of the contact frames.
+    yaxes : ndarray
+        An (n, 3) array with the Y axes of the contact frames.
+    zaxes : ndarray
+        An (n, 3) array with the Z axes (normals) of the contact frames.
+    areas : ndarray
+        An (n,) array with the areas of the contact polygons.
+
+    Notes
+    -----
+    The contacts of one edge are stored contiguously.
+    Contact meshes, breps and holes are not part of the table.
+
+    The table is a derived copy of the contacts in the edge attributes of the interaction graph,
+    which remain the source of truth.
+    It provides fast, vectorised access to the contact geometry,
+    but it doesn't replace the contact objects and therefore adds to the memory use of a model rather than reducing it.
+
+    Examples
+    --------
+    >>> from compas_model.interactions import Contact
+    >>> table = ContactTable([(0, 1)], [[Contact([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])]])
+    >>> table.areas.tolist()
+    [1.0]
+    >>> float(table.zaxes[0, 2])
+    1.0
+
+    """
+
+    def __init__(self, edges: Iterable[tuple[int, int]] = (), contacts: Iterable[list[Contact]] = ()) -> None:
+        edgelist = []
+        contactlist: list[Contact] = []
+        counts = []
+        for edge, edgecontacts in zip(edges, contacts):
+            if not edgecontacts:
+                continue
+            edgelist.append(edge)
+            counts.append(len(edgecontacts))
+            contactlist.extend(edgecontacts)
+
+        n = len(contactlist)
+        self.edges: ndarray = array(edgelist, dtype=int64).reshape(-1, 2)
+        self.edge_offsets: ndarray = zeros(len(edgelist) + 1, dtype=int64)
+        self.edge_offsets[1:] = cumsum(counts)
+        self.edge_ids: ndarray = array([i for i, count in enumerate(counts) for _ in range(count)], dtype=int64)
+
+        self.offsets: ndarray = zeros(n + 1, dtype=int64)
+        self.offsets[1:] = cumsum([len(contact.points) for contact in contactlist])
+        self.points: ndarray = empty((self.offsets[-1], 3), dtype=float64)
+        self.origins: ndarray = empty((n, 3), dtype=float64)
+        self.xaxes: ndarray = empty((n, 3), dtype=float64)
+        self.yaxes: ndarray = empty((n, 3), dtype=float64)
+        self.zaxes: ndarray = empty((n, 3), dtype=float64)
+        self.areas: ndarray = empty(n, dtype=float64)
+
+        for i, contact in enumerate(contactlist):
+            self.points[self.offsets[i] : self.offsets[i + 1]] = asarray(contact.points, dtype=float64).reshape(-1, 3)
+            frame = contact.frame
+            self.origins[i] = frame.point
+            self.xaxes[i] = frame.xaxis
+            self.yaxes[i] = frame.yaxis
+            self.zaxes[i] = frame.zaxis
+            self.areas[i] = contact.size
+
+        self._edgerows = {(u, v): row for row, (u, v) in enumerate(edgelist)}
+
+    def __len__(self) -> int:
+        return len(self.areas)
+
+    def __getitem__(self, index: int) -> ContactView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Contact index out of range.")
+        return ContactView(self, index)
+
+    def __iter__(self) -> Iterator[ContactView]:
+        for index in range(len(self)):
+            yield ContactView(self, index)
+
+    @classmethod
+    def from_graph(cls, graph: "Graph") -> "ContactTable":
+        """Construct a contact table from the ``contacts`` attributes of the edges of an interaction graph.
+
+        Parameters
+        ----------
+        graph : :class:`compas_model.models.InteractionGraph`
+
+        Returns
+        -------
+        ContactTable
+
+        """
+        edges = list(graph.edges())
+        return cls(edges, [graph.edge[u][v].get("contacts") for u, v in edges])
+
+    def edge_contacts(self, edge: tuple[int, int]) -> list[ContactView]:
+        """The contacts of an edge of the interaction graph.
+
+        Parameters
+        ----------
+        edge : tuple[int, int]
+            The edge, in either direction.
+
+        Returns
+        -------
+        list[ContactView]
+
+        """
+        u, v = edge
+        row = self._edgerows.get((u, v))
+        if row is None:
+            row = self._edgerows.get((v, u))
+        if row is None:
+            return []
+        return [ContactView(self, index) for index in range(self.edge_offsets[row], self.edge_offsets[row + 1])]
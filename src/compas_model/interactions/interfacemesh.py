@@ -0,0 +1,223 @@
+from typing import Iterable
+from typing import Optional
+
+from numpy import arange
+from numpy import array
+from numpy import asarray
+from numpy import concatenate
+from numpy import cross
+from numpy import cumsum
+from numpy import float64
+from numpy import full
+from numpy import int64
+from numpy import ndarray
+from numpy import sort
+from numpy import stack
+from numpy import take_along_axis
+from numpy import unique
+from numpy import where
+from numpy import zeros
+from shapely import get_coordinates
+from shapely.geometry import Polygon as ShapelyPolygon
+
+from compas.datastructures import Mesh
+
+from .contact import Contact
+
+
+def _refine(vertices: ndarray, faces: ndarray, target_size: float) -> tuple[ndarray, ndarray]:
+    # split the edges that are longer than the target size at their midpoints, until no edge is longer,
+    # and split every triangle into two, three or four triangles, depending on the number of its split edges
+    # the midpoints of the edges are shared by the neighbouring triangles, such that the triangulation stays conforming
+    while True:
+        edges = sort(concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]]), axis=1)
+        edges, inverse = unique(edges, axis=0, return_inverse=True)
+        split = ((vertices[edges[:, 1]] - vertices[edges[:, 0]]) ** 2).sum(axis=1) > target_size**2
+        if not split.any():
+            return vertices, faces
+
+        midpoints = full(len(edges), -1, dtype=int64)
+        midpoints[split] = len(vertices) + arange(split.sum())
+        vertices = concatenate([vertices, 0.5 * (vertices[edges[split, 0]] + vertices[edges[split, 1]])])
+
+        # the midpoints of the edges ab, bc and ca of every triangle
+        corners = faces
+        middles = midpoints[inverse.reshape(3, -1)].T
+        count = (middles >= 0).sum(axis=1)
+
+        # rotate the triangles with one split edge such that it is ab,
+        # and the triangles with two split edges such that ab and bc are split
+        rotation = where(count == 1, (middles >= 0).argmax(axis=1), 0)
+        rotation = where(count == 2, ((middles < 0).argmax(axis=1) + 1) % 3, rotation)
+        order = (rotation[:, None] + arange(3)) % 3
+        corners = take_along_axis(corners, order, axis=1)
+        middles = take_along_axis(middles, order, axis=1)
+        a, b, c = corners.T
+        ab, bc, ca = middles.T
+
+        one = count == 1
+        two = count == 2
+        three = count == 3
+        faces = concatenate(
+            [
+                faces[count == 0],
+                stack([a, ab, c], axis=1)[one],
+                stack([ab, b, c], axis=1)[one],
+                stack([ab, b, bc], axis=1)[two],
+                stack([a, ab, bc], axis=1)[two],
+                stack([a, bc, c], axis=1)[two],
+                stack([a, ab, ca], axis=1)[three],
+                stack([ab, b, bc], axis=1)[three],
+                stack([ca, bc, c], axis=1)[three],
+                stack([ab, bc, ca], axis=1)[three],
+            ]
+        )
+
+
+def _triangulate(contact: Contact, target_size: Optional[float] = None) -> tuple[ndarray, ndarray]:
+    try:
+        from shapely import constrained_delaunay_triangles
+    except ImportError:
+        raise ImportError("Triangulating contact polygons requires shapely 2.1 or higher.")
+
+    frame = contact.frame
+    origin = asarray(frame.point, dtype=float64)
+    axes = asarray([frame.xaxis, frame.yaxis], dtype=float64)
+
+    def local(points):
+        return (asarray(points, dtype=float64).reshape(-1, 3) - origin) @ axes.T
+
+    holes = [local(hole.points) for hole in contact._holes or []]
+    polygon = ShapelyPolygon(local(contact.points), holes=holes)
+    if not polygon.is_valid or polygon.area == 0:
+        return zeros((0, 3)), zeros((0, 3), dtype=int64)
+
+    # closed rings of four coordinates per triangle
+    coordinates = get_coordinates(constrained_delaunay_triangles(polygon)).reshape(-1, 4, 2)[:, :3]
+    vertices, faces = unique(coordinates.reshape(-1, 2), axis=0, return_inverse=True)
+    faces = faces.reshape(-1, 3)
+
+    # orient the triangles along the normal of the contact frame
+    u = vertices[faces[:, 1]] - vertices[faces[:, 0]]
+    v = vertices[faces[:, 2]] - vertices[faces[:, 0]]
+    flip = u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0] < 0
+    faces[flip] = faces[flip][:, ::-1]
+
+    if target_size:
+        vertices, faces = _refine(vertices, faces, target_size)
+
+    return origin + vertices @ axes, faces.astype(int64)
+
+
+class InterfaceMesh:
+    """Combined triangle mesh of the contact polygons of multiple contacts.
+
+    Parameters
+    ----------
+    contacts : Iterable[Contact]
+        The contacts.
+    edges : Iterable[tuple[int, int]], optional
+        For every contact, the edge of the interaction graph to which it belongs.
+    target_size : float, optional
+        The target length of the edges of the triangles.
+        If provided, the edges of the triangles that are longer than the target size are split at their midpoints,
+        until no edge is longer than the target size.
+
+    Attributes
+    ----------
+    vertices : ndarray
+        A (v, 3) array with the vertices of all contacts.
+    faces : ndarray
+        An (f, 3) array with the triangles of all contacts, as indices into ``vertices``.
+    vertex_offsets : ndarray
+        An (n + 1,) array with the offsets of the vertices of every contact in ``vertices``.
+    face_offsets : ndarray
+        An (n + 1,) array with the offsets of the triangles of every contact in ``faces``.
+    edges : ndarray
+        An (n, 2) array with the interaction edges of the contacts, or an empty array if no edges were provided.
+
+    Notes
+    -----
+    The contact polygons are triangulated in the local frames of the contacts with a constrained Delaunay triangulation,
+    such that the boundaries of the polygons and of their holes are edges of the triangulation.
+    The triangles are oriented along the Z axes of the contact frames.
+    Contacts don't share vertices.
+
+    With a target size, only the triangles with edges longer than the target size are split,
+    into two, three or four triangles, depending on the number of long edges.
+    The number of triangles therefore grows with the area of the contacts divided by the square of the target size,
+    and not with the size of the smallest triangles.
+
+    The triangulation requires shapely 2.1 or higher.
+
+    Examples
+    --------
+    >>> contact = Contact([[0, 0, 0], [2, 0, 0], [2, 1, 0], [0, 1, 0]])
+    >>> interfaces = InterfaceMesh([contact], target_size=1.0)
+    >>> interfaces.face_offsets.tolist()
+    [0, 14]
+    >>> round(float(interfaces.areas().sum()), 6)
+    2.0
+
+    """
+
+    def __init__(self, contacts: Iterable[Contact], edges: Optional[Iterable[tuple[int, int]]] = None, target_size: Optional[float] = None) -> None:
+        vertices = []
+        faces = []
+        nv = [0]
+        nf = [0]
+        count = 0
+        for contact in contacts:
+            xyz, triangles = _triangulate(contact, target_size=target_size)
+            faces.append(triangles + count)
+            vertices.append(xyz)
+            count += len(xyz)
+            nv.append(len(xyz))
+            nf.append(len(triangles))
+
+        self.vertices: ndarray = concatenate(vertices) if vertices else zeros((0, 3))
+        self.faces: ndarray = concatenate(faces) if faces else zeros((0, 3), dtype=int64)
+        self.vertex_offsets: ndarray = cumsum(nv).astype(int64)
+        self.face_offsets: ndarray = cumsum(nf).astype(int64)
+        self.edges: ndarray = array(list(edges) if edges is not None else [], dtype=int64).reshape(-1, 2)
+
+    def __len__(self) -> int:
+        return len(self.face_offsets) - 1
+
+    def contact_faces(self, index: int) -> ndarray:
+        """The triangles of one contact.
+
+        Parameters
+        ----------
+        index : int
+            The index of the contact.
+
+        Returns
+        -------
+        ndarray
+            A (k, 3) view of the face array, with indices into the combined vertex array.
+
+        """
+        return self.faces[self.face_offsets[index] : self.face_offsets[index + 1]]
+
+    def areas(self) -> ndarray:
+        """Compute the areas of the triangles.
+
+        Returns
+        -------
+        ndarray
+            An (f,) array.
+
+        """
+        a, b, c = (self.vertices[self.faces[:, i]] for i in range(3))
+        return 0.5 * (cross(b - a, c - a) ** 2).sum(axis=1) ** 0.5
+
+    def to_mesh(self) -> Mesh:
+        """Convert the combined triangles to a single mesh.
+
+        Returns
+        -------
+        :class:`compas.datastructures.Mesh`
+
+        """
+        return Mesh.from_vertices_and_faces(self.vertices.tolist(), self.faces.tolist())
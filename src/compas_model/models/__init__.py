@@ -1,12 +1,20 @@
+from .elementarrays import ElementArrays
+from .elementindex import ElementIndex
 from .elementtree import ElementNode
 from .elementtree import ElementTree
 from .interactiongraph import InteractionGraph
 from .model import Model
+from .npz import ModelArchive
+from .query import ElementQuery
 
 
 __all__ = [
+    "ElementArrays",
+    "ElementIndex",
     "ElementNode",
+    "ElementQuery",
     "ElementTree",
     "InteractionGraph",
     "Model",
+    "ModelArchive",
 ]
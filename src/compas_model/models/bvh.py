@@ -4,22 +4,31 @@ from typing import Optional
 from typing import Type
 from typing import Union
 
+from numpy import ndarray
+
 from compas.geometry import Box
 from compas.geometry import Point
 from compas_model.datastructures import BVH
 from compas_model.datastructures import AABBNode
 from compas_model.datastructures import OBBNode
+from compas_model.geometry import combine_aabb_extents
 from compas_model.geometry import combine_aabbs
 from compas_model.geometry import combine_obbs
 
 if TYPE_CHECKING:
     from compas_model.elements import Element
+    from compas_model.models.elementarrays import ElementArrays
 
 
 class ElementAABBNode(AABBNode):
     objects: list[tuple[int, Point, "Element"]]
 
+    tree: "ElementBVH"  # type: ignore
+
     def compute_box(self) -> Box:
+        aabbs = getattr(self.tree, "aabbs", None)
+        if aabbs is not None:
+            return combine_aabb_extents(aabbs[[o[0] for o in self.objects]])
         if len(self.objects) == 1:
             return self.objects[0][2].aabb
         return combine_aabbs([o[2].aabb for o in self.objects])
@@ -43,6 +52,9 @@ class ElementBVH(BVH):
         **kwargs,
     ):
         super().__init__(nodetype, max_depth, leafsize, **kwargs)
+        self.aabbs: Optional[ndarray] = None
+        self.arrays: Optional["ElementArrays"] = None
+        self.version: Optional[int] = None
 
     @classmethod
     def from_elements(
@@ -58,6 +70,50 @@ class ElementBVH(BVH):
         tree._add_objects(objects, parent=tree)
         return tree
 
+    @classmethod
+    def from_arrays(
+        cls,
+        arrays: "ElementArrays",
+        nodetype: Optional[Union[Type[ElementAABBNode], Type[ElementOBBNode]]] = ElementAABBNode,
+        max_depth: Optional[int] = None,
+        leafsize: int = 1,
+    ) -> "ElementBVH":
+        """Construct a BVH from the structure-of-arrays cache of the elements of a model.
+
+        Parameters
+        ----------
+        arrays : ElementArrays
+            The element arrays.
+        nodetype : Type[ElementAABBNode] | Type[ElementOBBNode], optional
+            The type of bounding volume node used in the tree.
+        max_depth : int, optional
+            The maximum depth of the tree.
+        leafsize : int, optional
+            The number of elements contained in a leaf node.
+
+        Returns
+        -------
+        ElementBVH
+
+        Notes
+        -----
+        With AABB nodes, the boxes of the nodes are computed from the AABB array directly,
+        without accessing the bounding boxes of the individual elements.
+        The tree stores the arrays and their version, such that it can be identified as out of date
+        once rows of the arrays are recomputed.
+
+        """
+        arrays.update()
+        objects: list[tuple[int, Point, "Element"]] = [(row, Point(*point), element) for row, (point, element) in enumerate(zip(arrays.points, arrays.elements))]
+
+        tree = cls(nodetype=nodetype, max_depth=max_depth, leafsize=leafsize)
+        tree.arrays = arrays
+        tree.version = arrays.version
+        if issubclass(nodetype, ElementAABBNode):  # type: ignore
+            tree.aabbs = arrays.aabbs
+        tree._add_objects(objects, parent=tree)
+        return tree
+
     def nearest_neighbors(
         self,
         element: "Element",
@@ -0,0 +1,165 @@
+from typing import TYPE_CHECKING
+from typing import Iterable
+from typing import Optional
+
+from numpy import asarray
+from numpy import empty
+from numpy import ndarray
+
+from compas_model.elements import Element
+from compas_model.elements import Group
+
+if TYPE_CHECKING:
+    from compas_model.models import Model
+
+
+class ElementArrays:
+    """Structure-of-arrays cache of the spatial data of the elements of a model.
+
+    Parameters
+    ----------
+    elements : Iterable[Element], optional
+        The elements to include in the arrays.
+        Groups are skipped, since they have no geometry of their own.
+
+    Attributes
+    ----------
+    elements : list[Element]
+        The elements, in the order of the rows of the arrays.
+    index : dict[str, int]
+        A map from element guids to rows.
+    aabbs : ndarray
+        An (n, 6) array with the extents of the AABBs of the elements: ``[xmin, ymin, zmin, xmax, ymax, zmax]``.
+    points : ndarray
+        An (n, 3) array with the reference points of the elements.
+    transformations : ndarray
+        An (n, 4, 4) array with the model transformation matrices of the elements.
+    is_dirty : bool, read-only
+        True if one or more rows are out of date.
+    version : int, read-only
+        A counter that is incremented every time rows are recomputed.
+
+    Notes
+    -----
+    The rows of an element are marked as dirty when the computed attributes of the element are reset,
+    for example after a change of its transformation.
+    Dirty rows are recomputed in bulk with [`update`][update].
+    Structures derived from the arrays, such as a BVH, can compare the version at which they were built
+    with the current version to find out if they are out of date.
+
+    """
+
+    def __init__(self, elements: Optional[Iterable[Element]] = None) -> None:
+        self.elements: list[Element] = []
+        self.index: dict[str, int] = {}
+        self.aabbs: ndarray = empty((0, 6))
+        self.points: ndarray = empty((0, 3))
+        self.transformations: ndarray = empty((0, 4, 4))
+        self._dirty: set[int] = set()
+        self._version = 0
+        if elements is not None:
+            self.build(elements)
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    @property
+    def is_dirty(self) -> bool:
+        return bool(self._dirty)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @classmethod
+    def from_model(cls, model: "Model") -> "ElementArrays":
+        """Construct the arrays from the elements of a model.
+
+        Parameters
+        ----------
+        model : Model
+
+        Returns
+        -------
+        ElementArrays
+
+        """
+        return cls(model.elements())
+
+    def build(self, elements: Iterable[Element]) -> None:
+        """Fill the arrays with the data of the given elements.
+
+        Parameters
+        ----------
+        elements : Iterable[Element]
+
+        Returns
+        -------
+        None
+
+        """
+        self.elements = [element for element in elements if not isinstance(element, Group)]
+        self.index = {str(element.guid): row for row, element in enumerate(self.elements)}
+
+        n = len(self.elements)
+        self.aabbs = empty((n, 6))
+        self.points = empty((n, 3))
+        self.transformations = empty((n, 4, 4))
+        self._dirty = set(range(n))
+        self.update()
+
+    def update(self) -> None:
+        """Recompute the rows of the elements that have been marked as dirty.
+
+        Returns
+        -------
+        None
+
+        """
+        if not self._dirty:
+            return
+
+        rows = sorted(self._dirty)
+        elements = [self.elements[row] for row in rows]
+
+        self.aabbs[rows] = [[box.xmin, box.ymin, box.zmin, box.xmax, box.ymax, box.zmax] for box in (element.aabb for element in elements)]
+        self.points[rows] = [element.point for element in elements]
+        self.transformations[rows] = asarray([element.modeltransformation.matrix for element in elements], dtype=float)
+
+        self._dirty.clear()
+        self._version += 1
+
+    def invalidate(self, element: Element) -> None:
+        """Mark the row of an element as dirty.
+
+        Parameters
+        ----------
+        element : Element
+
+        Returns
+        -------
+        None
+
+        """
+        row = self.index.get(str(element.guid))
+        if row is not None:
+            self._dirty.add(row)
+
+    def row(self, element: Element) -> int:
+        """Get the row of an element.
+
+        Parameters
+        ----------
+        element : Element
+
+        Returns
+        -------
+        int
+
+        Raises
+        ------
+        KeyError
+            If the element is not part of the arrays.
+
+        """
+        return self.index[str(element.guid)]
@@ -0,0 +1,218 @@
+from heapq import merge
+from typing import Iterable
+from typing import Optional
+from typing import Type
+
+from compas_model.elements import Element
+
+
+class ElementIndex:
+    """Secondary indexes of the elements of a model, by name and by type.
+
+    Parameters
+    ----------
+    elements : Iterable[Element], optional
+        The elements to index, in model order.
+
+    Notes
+    -----
+    The index is maintained by the model when elements are added, removed, replaced or renamed.
+    Elements are indexed by their (resolved) name,
+    which is the name of the class of the element if no name was set explicitly.
+
+    Lookups by name are O(k), with k the number of elements with the same name.
+    Lookups by type are O(t + k), with t the number of distinct element types in the model,
+    and k the number of matching elements.
+    In both cases, elements are returned in model order.
+
+    """
+
+    def __init__(self, elements: Optional[Iterable[Element]] = None) -> None:
+        self._order: dict[str, int] = {}
+        self._names: dict[str, dict[str, Element]] = {}
+        self._types: dict[type, dict[str, Element]] = {}
+        self._count = 0
+        if elements:
+            for element in elements:
+                self.add(element)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _position(self, element: Element) -> int:
+        return self._order[str(element.guid)]
+
+    def add(self, element: Element) -> None:
+        """Add an element to the index.
+
+        Parameters
+        ----------
+        element : Element
+            The element.
+
+        Returns
+        -------
+        None
+
+        """
+        guid = str(element.guid)
+        self._order[guid] = self._count
+        self._count += 1
+        self._names.setdefault(element.name, {})[guid] = element
+        self._types.setdefault(type(element), {})[guid] = element
+
+    def remove(self, element: Element) -> None:
+        """Remove an element from the index.
+
+        Parameters
+        ----------
+        element : Element
+            The element.
+
+        Returns
+        -------
+        None
+
+        """
+        guid = str(element.guid)
+        if self._order.pop(guid, None) is None:
+            return
+        self._discard(self._names, element.name, guid)
+        self._discard(self._types, type(element), guid)
+
+    def replace(self, element: Element, new: Element) -> None:
+        """Replace an element by a new element with the same guid, keeping its position.
+
+        Parameters
+        ----------
+        element : Element
+            The element.
+        new : Element
+            The new element.
+
+        Returns
+        -------
+        None
+
+        """
+        guid = str(element.guid)
+        self._discard(self._names, element.name, guid)
+        self._discard(self._types, type(element), guid)
+        self._insert(self._names, new.name, guid, new)
+        self._insert(self._types, type(new), guid, new)
+
+    def rename(self, element: Element, name: Optional[str]) -> None:
+        """Update the index for a change of name of an element.
+
+        Parameters
+        ----------
+        element : Element
+            The element, with its current name.
+        name : str | None
+            The new name of the element.
+
+        Returns
+        -------
+        None
+
+        """
+        guid = str(element.guid)
+        if guid not in self._order:
+            return
+        self._discard(self._names, element.name, guid)
+        self._insert(self._names, name or element.__class__.__name__, guid, element)
+
+    def _discard(self, table: dict, key, guid: str) -> None:
+        bucket = table.get(key)
+        if bucket is not None:
+            bucket.pop(guid, None)
+            if not bucket:
+                del table[key]
+
+    def _insert(self, table: dict, key, guid: str, element: Element) -> None:
+        # keep the buckets in model order
+        bucket = table.setdefault(key, {})
+        last = next(reversed(bucket), None)
+        bucket[guid] = element
+        if last is not None and last != guid and self._order[last] > self._order[guid]:
+            table[key] = dict(sorted(bucket.items(), key=lambda item: self._order[item[0]]))
+
+    def named(self, name: str) -> list[Element]:
+        """Find the elements with a given name.
+
+        Parameters
+        ----------
+        name : str
+            The name.
+
+        Returns
+        -------
+        list[Element]
+
+        """
+        bucket = self._names.get(name)
+        return list(bucket.values()) if bucket else []
+
+    def first_named(self, name: str) -> Optional[Element]:
+        """Find the first element with a given name.
+
+        Parameters
+        ----------
+        name : str
+            The name.
+
+        Returns
+        -------
+        Element | None
+
+        """
+        bucket = self._names.get(name)
+        return next(iter(bucket.values())) if bucket else None
+
+    def of_type(self, elementtype: Type[Element]) -> list[Element]:
+        """Find the elements of a given type, including subclasses of the type.
+
+        Parameters
+        ----------
+        elementtype : Type[Element]
+            The type.
+
+        Returns
+        -------
+        list[Element]
+
+        """
+        buckets = [bucket for cls, bucket in self._types.items() if issubclass(cls, elementtype)]
+        if not buckets:
+            return []
+        if len(buckets) == 1:
+            return list(buckets[0].values())
+        return list(merge(*(bucket.values() for bucket in buckets), key=self._position))
+
+    def count_of_type(self, elementtype: Type[Element]) -> int:
+        """Count the elements of a given type, including subclasses of the type.
+
+        Parameters
+        ----------
+        elementtype : Type[Element]
+            The type.
+
+        Returns
+        -------
+        int
+
+        """
+        return sum(len(bucket) for cls, bucket in self._types.items() if issubclass(cls, elementtype))
+
+    def types(self) -> list[type]:
+        """The distinct types of the indexed elements.
+
+        Returns
+        -------
+        list[type]
+
+        """
+        return list(self._types)
@@ -1,4 +1,5 @@
 from typing import Optional
+from typing import Sequence
 from typing import Union
 
 from compas.datastructures import Tree
@@ -97,3 +98,94 @@ class ElementTree(Tree):
         element.treenode = treenode
         parentnode.add(treenode)  # type: ignore
         return treenode
+
+    def add_elements(
+        self,
+        elements: Sequence[Element],
+        parents: Sequence[int],
+        names: Optional[Sequence[Optional[str]]] = None,
+        attributes: Optional[Sequence[Optional[dict]]] = None,
+        parent: Optional[Union[Element, ElementNode]] = None,
+    ) -> list[ElementNode]:
+        """Add multiple elements to the tree in one pass, using a flat representation of the hierarchy.
+
+        Parameters
+        ----------
+        elements : Sequence[Element]
+            The elements.
+        parents : Sequence[int]
+            For every element, the index of its parent element in ``elements``, or -1 if the parent is ``parent``.
+        names : Sequence[str | None], optional
+            The names of the tree nodes.
+        attributes : Sequence[dict | None], optional
+            The attributes of the tree nodes.
+        parent : Element | ElementNode, optional
+            The parent of the elements with parent index -1.
+            If None, these elements are added to the root.
+
+        Returns
+        -------
+        list[ElementNode]
+            The tree nodes of the elements.
+
+        Raises
+        ------
+        ValueError
+            If the number of parents doesn't match the number of elements.
+        ValueError
+            If the parent element is not part of the tree.
+
+        Notes
+        -----
+        The children of every node are added in the order of the elements.
+        The nodes are linked directly, without recursion or membership checks,
+        such that the hierarchy is reconstructed in linear time.
+
+        """
+        if len(parents) != len(elements):
+            raise ValueError("The number of parents doesn't match the number of elements.")
+
+        if parent is None:
+            parentnode = self.root
+        elif isinstance(parent, Element):
+            parentnode = parent.treenode
+            if parentnode is None:
+                raise ValueError("The parent element is not part of this model.")
+        else:
+            parentnode = parent
+
+        nodes: list[ElementNode] = []
+        for index, element in enumerate(elements):
+            name = names[index] if names else None
+            attr = (attributes[index] if attributes else None) or {}
+            node = ElementNode(element=element, name=name, **attr)
+            element.treenode = node
+            nodes.append(node)
+
+        for node, index in zip(nodes, parents):
+            other = parentnode if index < 0 else nodes[index]
+            other._children.append(node)
+            node._parent = other
+
+        return nodes
+
+    def flatten(self) -> tuple[list[ElementNode], list[int]]:
+        """Flatten the hierarchy of the tree into a list of nodes and the indices of their parents.
+
+        Returns
+        -------
+        tuple[list[ElementNode], list[int]]
+            The element nodes in depth-first preorder,
+            and for every node the index of its parent node in this list, or -1 if the parent is the root.
+
+        """
+        nodes: list[ElementNode] = []
+        parents: list[int] = []
+        stack = [(child, -1) for child in reversed(self.root.children)]
+        while stack:
+            node, parent = stack.pop()
+            index = len(nodes)
+            nodes.append(node)
+            parents.append(parent)
+            stack.extend((child, index) for child in reversed(node.children))
+        return nodes, parents
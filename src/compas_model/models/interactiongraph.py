@@ -1,6 +1,28 @@
 from typing import TYPE_CHECKING
+from typing import Optional
+from typing import Sequence
+
+from numpy import abs as npabs
+from numpy import arange
+from numpy import argmin
+from numpy import argsort
+from numpy import array
+from numpy import concatenate
+from numpy import cumsum
+from numpy import float64
+from numpy import full
+from numpy import int64
+from numpy import ndarray
+from numpy import ones
+from numpy import sort
+from numpy.linalg import eigh
+from scipy.sparse import coo_matrix
+from scipy.sparse import csr_matrix
+from scipy.sparse import diags
+from scipy.sparse.linalg import eigsh
 
 from compas.datastructures import Graph
+from compas_model.datastructures import DisjointSet
 from compas_model.elements import Element  # noqa: F401
 
 if TYPE_CHECKING:
@@ -17,16 +39,41 @@ class InteractionGraph(Graph):
     default_edge_attributes : dict, optional
         The default attributes for edges.
 
+    Attributes
+    ----------
+    node_index : dict[int, int], read-only
+        A map from nodes to the rows/columns of the sparse matrices of the graph.
+    index_node : list[int], read-only
+        The nodes in the order of the rows/columns of the sparse matrices of the graph.
+    edge_index : dict[tuple[int, int], int], read-only
+        A map from edges to the rows of the incidence matrix of the graph.
+    version : tuple[int, int, int], read-only
+        Counters of the changes of the nodes, the edges, and the edge attributes of the graph.
+        Changes of mutable attribute values in place are not counted.
+
     Notes
     -----
     The main purpose of this class customisation is to modify the data serialisation behaviour
     of the graph in the context of element interaction modelling in a model.
 
+    Sparse matrices of the connectivity of the graph are cached.
+    The cache is invalidated when nodes or edges are added or removed,
+    except for the unweighted adjacency matrix,
+    which is updated incrementally as long as only edges have been added or removed since it was computed.
+
     """
 
     model: "Model"
 
     def __init__(self, **kwargs) -> None:
+        self._nodeversion = 0
+        self._edgeversion = 0
+        self._attributeversion = 0
+        # the edge changes since the adjacency matrix was computed, or None if there is no matrix to update
+        self._changes: Optional[list[tuple[int, int, int]]] = None
+        self._matrices: dict = {}
+        self._undirected: dict[tuple[int, int], tuple[int, int]] = {}
+        self._components: dict[Optional[str], DisjointSet] = {}
         super().__init__(**kwargs)
         self.update_default_node_attributes(element=None)
         self.update_default_edge_attributes(modifiers=None, contacts=None)
@@ -43,9 +90,7 @@ class InteractionGraph(Graph):
         for node in self.nodes():
             lines.append("{}".format(node))
             for nbr in self.neighbors(node):
-                edge = node, nbr
-                if not self.has_edge(edge):
-                    edge = nbr, node
+                edge = self.find_edge(node, nbr)
 
                 lines.append(
                     "- {}: {} {}".format(
@@ -56,11 +101,193 @@ class InteractionGraph(Graph):
                 )
         return "\n".join(lines) + "\n"
 
+    # =============================================================================
+    # Topology changes
+    # =============================================================================
+
+    def _node_changed(self) -> None:
+        self._nodeversion += 1
+        # the adjacency matrix has to be rebuilt anyway
+        self._changes = None
+
+    def _components_merge(self, u: int, v: int, attr: dict) -> None:
+        for name, components in self._components.items():
+            if name is None or attr.get(name):
+                components.add(u)
+                components.add(v)
+                components.union(u, v)
+
+    def _components_update(self, key: tuple[int, int], name: str, value) -> None:
+        if value:
+            self._components[name].union(*key)
+        else:
+            # sets cannot be split
+            del self._components[name]
+
+    def _edge_changed(self, u: int, v: int, change: int) -> None:
+        self._edgeversion += 1
+        if self._changes is not None:
+            self._changes.append((u, v, change))
+
+    def add_node(self, key=None, attr_dict=None, **kwattr) -> int:
+        exists = key is not None and key in self.node
+        key = super().add_node(key=key, attr_dict=attr_dict, **kwattr)
+        if not exists:
+            self._node_changed()
+            for components in self._components.values():
+                components.add(key)
+        return key
+
+    def add_edge(self, u: int, v: int, attr_dict=None, **kwattr) -> tuple[int, int]:
+        adjacent = u in self.adjacency and v in self.adjacency[u]
+        exists = u in self.edge and v in self.edge[u]
+        edge = super().add_edge(u, v, attr_dict=attr_dict, **kwattr)
+        if not exists:
+            self._undirected.setdefault((u, v) if u <= v else (v, u), (u, v))
+            self._edge_changed(u, v, 0 if adjacent else 1)
+        if self._components:
+            self._components_merge(u, v, self.edge[u][v])
+        return edge
+
+    def delete_edge(self, edge: tuple[int, int]) -> None:
+        u, v = edge
+        super().delete_edge(edge)
+        key = (u, v) if u <= v else (v, u)
+        if v in self.edge and u in self.edge[v]:
+            self._undirected[key] = v, u
+        else:
+            self._undirected.pop(key, None)
+        self._edge_changed(u, v, 0 if v in self.adjacency.get(u, ()) else -1)
+        self._components.clear()
+
+    def find_edge(self, u: int, v: int) -> Optional[tuple[int, int]]:
+        """Find the edge between two nodes, irrespective of its direction.
+
+        Parameters
+        ----------
+        u : int
+            The first node.
+        v : int
+            The second node.
+
+        Returns
+        -------
+        tuple[int, int] | None
+            The edge as it is stored in the graph, or None if the nodes are not connected.
+
+        Notes
+        -----
+        The lookup uses an index of the edges keyed by the ordered pair of their nodes,
+        and therefore requires a single hash probe.
+
+        """
+        return self._undirected.get((u, v) if u <= v else (v, u))
+
+    def edge_attribute(self, key: tuple[int, int], name: str, value=None):
+        if value is None:
+            return super().edge_attribute(key, name)
+        self._attributeversion += 1
+        super().edge_attribute(key, name, value=value)
+        if name in self._components:
+            self._components_update(key, name, value)
+
+    def edge_attributes(self, key: tuple[int, int], names=None, values=None):
+        if names and values:
+            # set the values one by one, such that the versions and components are updated like for a single attribute
+            for name, value in zip(names, values):
+                self.edge_attribute(key, name, value)
+            return
+        return super().edge_attributes(key, names=names, values=values)
+
+    def unset_edge_attribute(self, key: tuple[int, int], name: str) -> None:
+        self._attributeversion += 1
+        super().unset_edge_attribute(key, name)
+        self._components.pop(name, None)
+
+    @property
+    def version(self) -> tuple[int, int, int]:
+        return self._nodeversion, self._edgeversion, self._attributeversion
+
     def add_element(self, element: Element) -> int:
         node = self.add_node(element=str(element.guid))
         element.graphnode = node
         return node
 
+    def add_elements(self, elements: Sequence[Element]) -> list[int]:
+        """Add nodes for multiple elements at once.
+
+        Parameters
+        ----------
+        elements : Sequence[Element]
+            The elements.
+
+        Returns
+        -------
+        list[int]
+            The identifiers of the new nodes.
+
+        """
+        nodes = []
+        key = self._max_node
+        for element in elements:
+            key += 1
+            self.node[key] = {"element": str(element.guid)}
+            self.edge[key] = {}
+            self.adjacency[key] = {}
+            element.graphnode = key
+            nodes.append(key)
+        self._max_node = key
+        self._node_changed()
+        for components in self._components.values():
+            for node in nodes:
+                components.add(node)
+        return nodes
+
+    def delete_node(self, key: int) -> None:
+        """Delete a node and its incident edges from the graph.
+
+        Parameters
+        ----------
+        key : int
+            The identifier of the node.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Unlike the default implementation, only the neighbours of the node are visited,
+        instead of all edges of the graph.
+
+        """
+        for nbr in self.adjacency.get(key, ()):
+            self._undirected.pop((key, nbr) if key <= nbr else (nbr, key), None)
+            if nbr != key:
+                self.edge[nbr].pop(key, None)
+                self.adjacency[nbr].pop(key, None)
+        self.edge.pop(key, None)
+        self.adjacency.pop(key, None)
+        self.node.pop(key, None)
+        self._node_changed()
+        self._components.clear()
+
+    def delete_nodes(self, keys: Sequence[int]) -> None:
+        """Delete multiple nodes and their incident edges from the graph.
+
+        Parameters
+        ----------
+        keys : Sequence[int]
+            The identifiers of the nodes.
+
+        Returns
+        -------
+        None
+
+        """
+        for key in keys:
+            self.delete_node(key)
+
     def node_element(self, node: int) -> Element:
         """Get the element associated with the node.
 
@@ -77,11 +304,413 @@ class InteractionGraph(Graph):
         guid: str = self.node_attribute(node, "element")  # type: ignore
         return self.model._elements[guid]
 
-    def clear_edges(self):
-        """Clear all the edges and connectivity information of the graph."""
-        for u, v in list(self.edges()):
-            del self.edge[u][v]
-            if v in self.adjacency[u]:
-                del self.adjacency[u][v]
-            if u in self.adjacency[v]:
-                del self.adjacency[v][u]
+    def clear_edges(self) -> None:
+        """Clear all the edges and connectivity information of the graph.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The edge and adjacency dicts of all nodes are replaced by new, empty dicts,
+        which takes O(n) time for a graph with n nodes, independently of the number of edges.
+
+        """
+        for key in self.node:
+            self.edge[key] = {}
+            self.adjacency[key] = {}
+        self._undirected.clear()
+        self._edgeversion += 1
+        self._changes = None
+        self._components.clear()
+
+    def add_edges_from(self, edges: Sequence[Sequence[int]], attributes: Optional[Sequence[Optional[dict]]] = None) -> list[tuple[int, int]]:
+        """Add multiple edges at once.
+
+        Parameters
+        ----------
+        edges : Sequence[Sequence[int]]
+            The edges, as pairs of nodes, for example an (m, 2) array.
+        attributes : Sequence[dict | None], optional
+            For every edge, a dict of attributes.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The edges.
+
+        Raises
+        ------
+        KeyError
+            If one of the nodes is not in the graph.
+        ValueError
+            If the number of attribute dicts doesn't match the number of edges.
+
+        Notes
+        -----
+        Attributes of edges that already exist are updated.
+        Unlike [`add_edge`][add_edge], this method does not add missing nodes.
+
+        """
+        edges = [(u, v) for u, v in (edges.tolist() if hasattr(edges, "tolist") else edges)]  # type: ignore
+        if attributes is not None and len(attributes) != len(edges):
+            raise ValueError("The number of attribute dicts doesn't match the number of edges.")
+        for u, v in edges:
+            if u not in self.node:
+                raise KeyError(u)
+            if v not in self.node:
+                raise KeyError(v)
+
+        edge = self.edge
+        adjacency = self.adjacency
+        undirected = self._undirected
+        for index, (u, v) in enumerate(edges):
+            attr = edge[u].get(v)
+            if attr is None:
+                attr = edge[u][v] = {}
+                undirected.setdefault((u, v) if u <= v else (v, u), (u, v))
+            if attributes is not None and attributes[index]:
+                attr.update(attributes[index])
+            adjacency[u][v] = None
+            adjacency[v][u] = None
+            if self._components:
+                self._components_merge(u, v, attr)
+
+        self._edgeversion += 1
+        self._changes = None
+        return edges
+
+    # =============================================================================
+    # Sparse matrices
+    # =============================================================================
+
+    def _cached(self, name: str, edges: bool = True):
+        cached = self._matrices.get(name)
+        if cached is None:
+            return None
+        value, nodeversion, edgeversion = cached
+        if nodeversion != self._nodeversion or (edges and edgeversion != self._edgeversion):
+            return None
+        return value
+
+    def _cache(self, name: str, value):
+        self._matrices[name] = value, self._nodeversion, self._edgeversion
+        return value
+
+    @property
+    def index_node(self) -> list[int]:
+        nodes = self._cached("index_node", edges=False)
+        if nodes is None:
+            nodes = self._cache("index_node", list(self.node))
+        return nodes
+
+    @property
+    def node_index(self) -> dict[int, int]:
+        index = self._cached("node_index", edges=False)
+        if index is None:
+            index = self._cache("node_index", {node: row for row, node in enumerate(self.index_node)})
+        return index
+
+    @property
+    def edge_index(self) -> dict[tuple[int, int], int]:
+        index = self._cached("edge_index")
+        if index is None:
+            index = self._cache("edge_index", {edge: row for row, edge in enumerate(self.edges())})
+        return index
+
+    def adjacency_matrix(self, weight: Optional[str] = None) -> csr_matrix:
+        """Compute the adjacency matrix of the graph.
+
+        Parameters
+        ----------
+        weight : str, optional
+            The name of a numerical edge attribute to use as the value of the entries of the matrix.
+            By default, all entries are 1.
+
+        Returns
+        -------
+        :class:`scipy.sparse.csr_matrix`
+            A symmetric (n, n) matrix, with rows and columns ordered according to [`node_index`][node_index].
+
+        """
+        if weight is not None:
+            return self._weighted_adjacency_matrix(weight)
+
+        matrix = self._matrices.get("adjacency")
+        if matrix is not None:
+            matrix, nodeversion, edgeversion = matrix
+            if nodeversion == self._nodeversion:
+                if edgeversion == self._edgeversion:
+                    return matrix
+                if self._changes is not None:
+                    matrix = self._update_adjacency_matrix(matrix)
+                    self._changes = []
+                    return self._cache("adjacency", matrix)
+
+        index = self.node_index
+        rows = []
+        cols = []
+        for u, nbrs in self.adjacency.items():
+            for v in nbrs:
+                rows.append(index[u])
+                cols.append(index[v])
+        n = len(index)
+        matrix = coo_matrix((ones(len(rows)), (rows, cols)), shape=(n, n)).tocsr()
+        self._changes = []
+        return self._cache("adjacency", matrix)
+
+    def _update_adjacency_matrix(self, matrix: csr_matrix) -> csr_matrix:
+        index = self.node_index
+        rows = []
+        cols = []
+        data = []
+        for u, v, change in self._changes:  # type: ignore
+            if change:
+                rows.append(index[u])
+                cols.append(index[v])
+                data.append(change)
+                if u != v:
+                    rows.append(index[v])
+                    cols.append(index[u])
+                    data.append(change)
+        if not data:
+            return matrix
+        n = len(index)
+        delta = coo_matrix((array(data, dtype=float64), (rows, cols)), shape=(n, n))
+        matrix = (matrix + delta).tocsr()
+        matrix.eliminate_zeros()
+        return matrix
+
+    def _weighted_adjacency_matrix(self, weight: str) -> csr_matrix:
+        name = "adjacency:{}".format(weight)
+        matrix = self._cached(name)
+        if matrix is None:
+            index = self.node_index
+            rows = []
+            cols = []
+            data = []
+            for u, v in self.edges():
+                value = self.edge[u][v].get(weight, self.default_edge_attributes.get(weight))
+                rows += [index[u], index[v]]
+                cols += [index[v], index[u]]
+                data += [value, value]
+            n = len(index)
+            matrix = self._cache(name, coo_matrix((array(data, dtype=float64), (rows, cols)), shape=(n, n)).tocsr())
+        return matrix
+
+    def incidence_matrix(self) -> csr_matrix:
+        """Compute the (oriented) incidence matrix of the graph.
+
+        Returns
+        -------
+        :class:`scipy.sparse.csr_matrix`
+            An (m, n) matrix with for every edge ``(u, v)`` a row with -1 in the column of ``u`` and +1 in the column of ``v``.
+            The rows are ordered according to [`edge_index`][edge_index],
+            and the columns according to [`node_index`][node_index].
+
+        """
+        matrix = self._cached("incidence")
+        if matrix is None:
+            index = self.node_index
+            edges = list(self.edge_index)
+            m = len(edges)
+            rows = concatenate([range(m), range(m)]).astype(int64)
+            cols = array([index[u] for u, _ in edges] + [index[v] for _, v in edges], dtype=int64)
+            data = concatenate([full(m, -1.0), full(m, 1.0)])
+            matrix = self._cache("incidence", coo_matrix((data, (rows, cols)), shape=(m, len(index))).tocsr())
+        return matrix
+
+    def to_csr(self, weight: Optional[str] = None) -> csr_matrix:
+        """Convert the connectivity of the graph to a sparse matrix in compressed sparse row format.
+
+        This is the same as the adjacency matrix of the graph.
+
+        Parameters
+        ----------
+        weight : str, optional
+            The name of a numerical edge attribute to use as the value of the entries of the matrix.
+
+        Returns
+        -------
+        :class:`scipy.sparse.csr_matrix`
+
+        See Also
+        --------
+        - [`adjacency_matrix`][adjacency_matrix]
+        - [`incidence_matrix`][incidence_matrix]
+
+        """
+        return self.adjacency_matrix(weight=weight)
+
+    # =============================================================================
+    # Connected components
+    # =============================================================================
+
+    def _connectivity(self, attribute: Optional[str] = None) -> DisjointSet:
+        components = self._components.get(attribute)
+        if components is None:
+            components = DisjointSet(self.node)
+            for u, nbrs in self.edge.items():
+                for v, attr in nbrs.items():
+                    if attribute is None or attr.get(attribute):
+                        components.union(u, v)
+            self._components[attribute] = components
+        return components
+
+    def connected_components(self, attribute: Optional[str] = None) -> list[list[int]]:
+        """Compute the connected components of the graph.
+
+        Parameters
+        ----------
+        attribute : str, optional
+            The name of an edge attribute.
+            If provided, only edges for which the value of the attribute is truthy connect nodes,
+            for example only edges with ``"contacts"``.
+
+        Returns
+        -------
+        list[list[int]]
+            The nodes of every component, ordered by the first node of the component.
+
+        Notes
+        -----
+        The components are labelled with a union-find structure over the edges of the graph.
+        Once computed, the structure is kept up to date incrementally when nodes and (qualifying) edges are added,
+        or when the attribute is set to a truthy value.
+        Deleting nodes or edges, or setting the attribute to a falsy value, discards it.
+        Changes of attribute values in place, for example appending to a list of contacts, are not tracked.
+
+        Examples
+        --------
+        >>> graph = InteractionGraph()
+        >>> nodes = [graph.add_node() for _ in range(4)]
+        >>> edge = graph.add_edge(0, 1)
+        >>> edge = graph.add_edge(2, 3, contacts=[None])
+        >>> graph.connected_components()
+        [[0, 1], [2, 3]]
+        >>> graph.connected_components("contacts")
+        [[0], [1], [2, 3]]
+
+        """
+        return self._connectivity(attribute).sets()
+
+    def number_of_components(self, attribute: Optional[str] = None) -> int:
+        """Count the connected components of the graph.
+
+        Parameters
+        ----------
+        attribute : str, optional
+            The name of an edge attribute that should be truthy for edges to connect nodes.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._connectivity(attribute).number_of_sets
+
+    def in_same_component(self, u: int, v: int, attribute: Optional[str] = None) -> bool:
+        """Verify that two nodes are in the same connected component.
+
+        Parameters
+        ----------
+        u : int
+            The first node.
+        v : int
+            The second node.
+        attribute : str, optional
+            The name of an edge attribute that should be truthy for edges to connect nodes.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._connectivity(attribute).connected(u, v)
+
+    # =============================================================================
+    # Partitioning
+    # =============================================================================
+
+    def partition(self, number: int, weights: Optional[dict[int, float]] = None, weight: Optional[str] = None) -> tuple[list[list[int]], list[tuple[int, int]]]:
+        """Partition the nodes of the graph into a number of parts, with few edges between the parts.
+
+        Parameters
+        ----------
+        number : int
+            The number of parts.
+        weights : dict[int, float], optional
+            A weight per node, for balancing the parts.
+            By default, all nodes have weight 1, and the parts have (approximately) the same number of nodes.
+        weight : str, optional
+            The name of a numerical edge attribute to use as the cost of cutting an edge.
+            By default, all edges have the same cost.
+
+        Returns
+        -------
+        tuple[list[list[int]], list[tuple[int, int]]]
+            The nodes of every part, in the order of [`index_node`][index_node],
+            and the edges between nodes in different parts.
+
+        Raises
+        ------
+        ValueError
+            If the number of parts is smaller than 1.
+
+        Notes
+        -----
+        The graph is partitioned by recursive spectral bisection.
+        Every bisection splits the nodes of a part according to their value in the Fiedler vector
+        of the Laplacian of the subgraph of the part,
+        at the position where the total weight of the nodes on both sides best matches the number of parts that should be created on that side.
+        The number of parts doesn't have to be a power of two.
+
+        If there are fewer nodes than parts, some of the parts are empty.
+
+        """
+        if number < 1:
+            raise ValueError("The number of parts should be at least 1.")
+
+        nodes = self.index_node
+        adjacency = self.adjacency_matrix(weight=weight)
+        if weights is None:
+            nodeweights = ones(len(nodes))
+        else:
+            nodeweights = array([weights.get(node, 1.0) for node in nodes], dtype=float64)
+
+        parts: list[ndarray] = []
+        stack = [(arange(len(nodes)), number)]
+        while stack:
+            rows, count = stack.pop()
+            if count == 1 or len(rows) == 0:
+                parts.append(rows)
+                continue
+            left = count // 2
+            first, second = self._bisect(adjacency[rows][:, rows], nodeweights[rows], left / count)
+            stack.append((rows[second], count - left))
+            stack.append((rows[first], left))
+
+        labels = {}
+        for label, rows in enumerate(parts):
+            for row in rows.tolist():
+                labels[nodes[row]] = label
+        cut = [(u, v) for u, v in self.edges() if labels[u] != labels[v]]
+        return [[nodes[row] for row in rows.tolist()] for rows in parts], cut
+
+    def _bisect(self, adjacency: csr_matrix, weights: ndarray, fraction: float) -> tuple[ndarray, ndarray]:
+        n = adjacency.shape[0]
+        if n < 3 or adjacency.nnz == 0:
+            order = arange(n)
+        else:
+            laplacian = diags(array(adjacency.sum(axis=1)).ravel()) - adjacency
+            if n <= 500:
+                values, vectors = eigh(laplacian.toarray())
+            else:
+                # shift-invert around a small negative value, at which the shifted laplacian is positive definite
+                values, vectors = eigsh(laplacian.tocsc(), k=2, sigma=-1e-3, which="LM")
+            fiedler = vectors[:, argsort(values)[1]]
+            order = argsort(fiedler, kind="stable")
+        totals = concatenate([[0.0], cumsum(weights[order])])
+        split = int(argmin(npabs(totals - fraction * totals[-1])))
+        return sort(order[:split]), sort(order[split:])
@@ -1,28 +1,69 @@
+from copy import deepcopy
+from typing import Callable
 from typing import Generator
+from typing import Iterable
 from typing import Iterator
 from typing import Optional
 from typing import Type
 from typing import TypeVar
 from typing import Union
 
+from numpy import asarray
+from numpy import ndarray
+from numpy import ones
+from numpy.linalg import inv
+
+from compas.data import Data
 from compas.datastructures import Datastructure
 from compas.geometry import Transformation
+from compas.tolerance import TOL
 from compas_model.datastructures import KDTree
 from compas_model.elements import Element
+from compas_model.elements import ElementCache
 from compas_model.elements import Group
 from compas_model.interactions import Contact
+from compas_model.interactions import ContactTable
+from compas_model.interactions import InterfaceMesh
 from compas_model.materials import Material
 from compas_model.modifiers import Modifier
 
 from .bvh import ElementAABBNode
 from .bvh import ElementBVH
+from .elementarrays import ElementArrays
+from .elementindex import ElementIndex
 from .elementtree import ElementNode
 from .elementtree import ElementTree
 from .interactiongraph import InteractionGraph
+from .npz import model_from_npz
+from .npz import model_to_npz
+from .query import ElementQuery
 
 ElementType = TypeVar("ElementType", bound=Element)
 
 
+def _copy_attribute(value):
+    # copy data objects, and lists of data objects, with their guids
+    if isinstance(value, Data):
+        return Data.copy(value, copy_guid=True)
+    if isinstance(value, list):
+        return [_copy_attribute(item) for item in value]
+    return deepcopy(value)
+
+
+def _equal_attribute(a, b) -> bool:
+    # compare data objects by their data, ignoring their guids
+    # transformations are compared by their matrices, independently of their (sub)type
+    if isinstance(a, Transformation) and isinstance(b, Transformation):
+        return TOL.is_allclose([value for row in a.matrix for value in row], [value for row in b.matrix for value in row])
+    if isinstance(a, Data) or isinstance(b, Data):
+        return type(a) is type(b) and _equal_attribute(a.__data__, b.__data__)
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal_attribute(a[key], b[key]) for key in a)
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(_equal_attribute(x, y) for x, y in zip(a, b))
+    return a == b
+
+
 class ModelError(Exception):
     pass
 
@@ -42,12 +83,35 @@ class Model(Datastructure):
         A graph containing the interactions between the elements of the model on its edges.
     bvh : ElementBVH, read-only
         To recompute the BVH, use [`compute_bvh`][compute_bvh].
+        The BVH is rebuilt on access if elements have moved since it was computed.
         The BVH is used to speed up collision detection: for example, during calculation of element contacts.
     kdtree : KDTree, read-only
         To recompute the tree, use [`compute_kdtree`][compute_kdtree].
         The KD tree is used for nearest neighbour searches: for example, during calculation of element contacts.
+    arrays : ElementArrays, read-only
+        A structure-of-arrays cache with the AABBs, reference points and model transformations of the elements.
+        Rows of elements with modified geometry or transformation are updated automatically on access.
+        To rebuild the arrays from scratch, use [`compute_arrays`][compute_arrays].
+    index : ElementIndex, read-only
+        Secondary indexes of the elements by name and by type.
+        The index is built on first access and maintained when elements are added, removed or renamed.
+    cache : ElementCache, read-only
+        The side table containing the computed attributes of the elements of the model, per category.
+        Use ``model.cache.evict(category)`` to drop all cached values of a category, for example ``"surface_mesh"``.
+        Use ``model.cache.budget`` to bound the (estimated) memory used by the cache.
+    contact_table : ContactTable, read-only
+        A columnar table of the contacts of all interactions, with their polygon vertices, frames and areas as arrays.
+        The table is recomputed on access if nodes, edges or edge attributes of the interaction graph have been changed.
+        Contacts modified in place are not detected; use [`compute_contact_table`][compute_contact_table] in that case.
+        The table is a copy; the contacts of the interaction edges remain the source of truth.
     transformation : Transformation
         The transformation from local to world coordinates.
+    treelayout : {"nested", "parents"}
+        The layout of the element tree in the serialised data of the model.
+        With ``"nested"`` (default), every tree node contains the data of its children.
+        With ``"parents"``, the tree is stored as a flat list of element guids with the indices of their parents,
+        which is more compact and faster to deserialise for large and deep hierarchies.
+        Both layouts are supported when the model is deserialised.
 
     Notes
     -----
@@ -67,7 +131,7 @@ class Model(Datastructure):
             "transformation": self.transformation,
             "elements": self._elements,
             "materials": self._materials,
-            "tree": self._tree.__data__,
+            "tree": self._tree.__data__ if self.treelayout == "nested" else self._treedata(),
             "graph": self._graph.__data__,
         }
         return data
@@ -82,6 +146,7 @@ class Model(Datastructure):
 
         for guid, element in model._elements.items():
             element.model = model
+            element._localcache = None
 
         model._graph = InteractionGraph.__from_data__(data["graph"])
         model._graph.model = model
@@ -91,27 +156,46 @@ class Model(Datastructure):
             element = model._graph.node_element(graphnode)
             element.graphnode = graphnode
 
-        def add(nodedata: dict, node: ElementNode) -> None:
-            if "children" in nodedata:
-                for childdata in nodedata["children"]:
-                    name = childdata["name"]
-                    guid = childdata["element"]
-                    attr = childdata.get("attributes") or {}
-
-                    element = model._elements[guid]
-                    childnode = ElementNode(element=element, name=name, **attr)
-                    element.treenode = childnode
-
-                    node.add(childnode)
-                    add(childdata, childnode)
-
-        nodedata = data["tree"]["root"]
-        node = model._tree.root
-
-        add(nodedata, node)
+        treedata = data["tree"]
+
+        if "parents" in treedata:
+            model.treelayout = "parents"
+            guids = treedata["elements"]
+            parents = treedata["parents"]
+            names = treedata.get("names")
+            attributes = treedata.get("attributes")
+        else:
+            guids = []
+            parents = []
+            names = []
+            attributes = []
+            stack = [(childdata, -1) for childdata in reversed(treedata["root"].get("children", []))]
+            while stack:
+                nodedata, parent = stack.pop()
+                index = len(guids)
+                guids.append(nodedata["element"])
+                parents.append(parent)
+                names.append(nodedata.get("name"))
+                attributes.append(nodedata.get("attributes"))
+                stack.extend((childdata, index) for childdata in reversed(nodedata.get("children", [])))
+
+        model._tree.add_elements([model._elements[guid] for guid in guids], parents, names=names, attributes=attributes)
 
         return model
 
+    def _treedata(self) -> dict:
+        # flat layout of the element tree, with parent indices instead of nested children
+        nodes, parents = self._tree.flatten()
+        data = {
+            "elements": [str(node.element.guid) for node in nodes],
+            "parents": parents,
+        }
+        if any(node._name is not None for node in nodes):
+            data["names"] = [node._name for node in nodes]
+        if any(node.attributes for node in nodes):
+            data["attributes"] = [node.attributes or None for node in nodes]
+        return data
+
     def __init__(self, name=None, **kwargs) -> None:
         super().__init__(name=name)
 
@@ -121,10 +205,16 @@ class Model(Datastructure):
 
         self._tree = ElementTree()
         self._graph = InteractionGraph()
+        self.treelayout = "nested"
         self._graph.model = self
 
         self._bvh = None
         self._kdtree = None
+        self._arrays = None
+        self._index = None
+        self._contacttable = None
+        self._contactposes: dict[tuple[int, int], tuple[ndarray, ndarray, bool]] = {}
+        self._cache = ElementCache()
 
     def __str__(self):
         output = "=" * 80 + "\n"
@@ -138,6 +228,59 @@ class Model(Datastructure):
         output += "=" * 80 + "\n"
         return output
 
+    # =============================================================================
+    # Serialization
+    # =============================================================================
+
+    def to_npz(self, filepath: str, compress: bool = False, root: Optional[Element] = None) -> None:
+        """Write the model to a binary, columnar NPZ file.
+
+        Parameters
+        ----------
+        filepath : str
+            The path of the output file.
+        compress : bool, optional
+            If True, compress the arrays.
+        root : Element, optional
+            Only write this element, its descendants, and the interactions between them.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        - [`from_npz`][from_npz]
+        - [`extract`][extract]
+
+        """
+        model = self if root is None else self.extract(root=root)
+        model_to_npz(model, filepath, compress=compress)
+
+    @classmethod
+    def from_npz(cls, filepath: str, root: Optional[Union[Element, str]] = None) -> "Model":
+        """Read a model from a binary, columnar NPZ file.
+
+        Parameters
+        ----------
+        filepath : str
+            The path of the file.
+        root : Element | str, optional
+            Only load this element, its descendants, and the interactions between them.
+            The element can be identified by its guid.
+
+        Returns
+        -------
+        Model
+
+        See Also
+        --------
+        - [`to_npz`][to_npz]
+        - [`compas_model.models.ModelArchive`][compas_model.models.ModelArchive]
+
+        """
+        return model_from_npz(filepath, cls=cls, root=root)
+
     # =============================================================================
     # Attributes
     # =============================================================================
@@ -152,9 +295,14 @@ class Model(Datastructure):
 
     @property
     def bvh(self) -> ElementBVH:
-        if not self._bvh:
-            self._bvh = self.compute_bvh()
-        return self._bvh
+        bvh = self._bvh
+        if bvh is None:
+            return self.compute_bvh()
+        # the boxes of the nodes are computed from the rows of the arrays, which are updated in place
+        arrays = self.arrays
+        if bvh.arrays is not arrays or bvh.version != arrays.version:
+            bvh = self.compute_bvh(nodetype=bvh.nodetype, max_depth=bvh.max_depth, leafsize=bvh.leafsize)
+        return bvh
 
     @property
     def kdtree(self) -> KDTree:
@@ -162,6 +310,24 @@ class Model(Datastructure):
             self._kdtree = self.compute_kdtree()
         return self._kdtree
 
+    @property
+    def index(self) -> ElementIndex:
+        if self._index is None:
+            self._index = ElementIndex(self._elements.values())
+        return self._index
+
+    @property
+    def cache(self) -> ElementCache:
+        return self._cache
+
+    @property
+    def arrays(self) -> ElementArrays:
+        if self._arrays is None:
+            self._arrays = self.compute_arrays()
+        elif self._arrays.is_dirty:
+            self._arrays.update()
+        return self._arrays
+
     @property
     def transformation(self) -> Optional[Transformation]:
         return self._transformation
@@ -169,6 +335,11 @@ class Model(Datastructure):
     @transformation.setter
     def transformation(self, transformation: Transformation) -> None:
         self._transformation = transformation
+        # the model transformations of all elements depend on this transformation
+        self._cache.evict()
+        if self._arrays is not None:
+            for element in self._arrays.elements:
+                self._arrays.invalidate(element)
 
     # =============================================================================
     # Datastructure "abstract" methods
@@ -247,7 +418,11 @@ class Model(Datastructure):
                 )
 
         self._bvh = None
+        self._kdtree = None
+        self._arrays = None
         self._elements[guid] = element
+        if self._index is not None:
+            self._index.add(element)
 
         self.graph.add_element(element)
         self.tree.add_element(element, parent)
@@ -256,6 +431,7 @@ class Model(Datastructure):
             self.assign_material(material=material, element=element)
 
         element.model = self
+        element._localcache = None
         return element
 
     def add_elements(
@@ -285,15 +461,68 @@ class Model(Datastructure):
         Raises
         ------
         ValueError
-            If the parent node is not a GroupNode.
+            If the parent element is not part of the model.
         ValueError
             If a material is provided that is not part of the model.
+        Exception
+            If one of the elements is already in the model, or appears more than once in the list.
+
+        Notes
+        -----
+        The elements are added as a single transaction.
+        The whole batch is validated before anything is added,
+        graph nodes and tree nodes are inserted in bulk,
+        and the spatial indexes of the model are reset only once.
+        If the insertion fails, all changes are rolled back and the model is left as it was.
 
         """
-        # try
-        # roll back if not all were added
-        for element in elements:
-            self.add_element(element, parent, material)
+        if material and not self.has_material(material):
+            raise ValueError("The material is not part of the model: {}".format(material))
+
+        if parent is not None and (parent.model is not self or parent.treenode is None):
+            raise ValueError("The parent element is not part of this model.")
+
+        guids = [str(element.guid) for element in elements]
+        if len(set(guids)) != len(guids) or any(guid in self._elements for guid in guids):
+            raise Exception("Element already in the model.")
+
+        parentnode = self._tree.root if parent is None else parent.treenode
+        nchildren = len(parentnode.children)
+        max_node = self._graph._max_node
+
+        try:
+            self._graph.add_elements(elements)
+            self._tree.add_elements(elements, [-1] * len(elements), parent=parentnode)
+            for guid, element in zip(guids, elements):
+                self._elements[guid] = element
+                element.model = self
+                element._localcache = None
+                if material:
+                    element.material = material
+        except Exception:
+            # roll back
+            for node in parentnode.children[nchildren:]:
+                node._parent = None
+            del parentnode._children[nchildren:]
+            for guid, element in zip(guids, elements):
+                self._elements.pop(guid, None)
+                if element.graphnode is not None and element.graphnode > max_node:
+                    self._graph.node.pop(element.graphnode, None)
+                    self._graph.edge.pop(element.graphnode, None)
+                    self._graph.adjacency.pop(element.graphnode, None)
+                element.model = None  # type: ignore
+                element.treenode = None  # type: ignore
+                element.graphnode = None  # type: ignore
+            self._graph._max_node = max_node
+            raise
+
+        if self._index is not None:
+            for element in elements:
+                self._index.add(element)
+
+        self._bvh = None
+        self._kdtree = None
+        self._arrays = None
         return elements
 
     def remove_element(self, element: Element) -> None:
@@ -308,15 +537,89 @@ class Model(Datastructure):
         -------
         None
 
+        Notes
+        -----
+        The descendants of the element in the element tree are removed as well.
+
         """
-        guid = str(element.guid)
-        if guid not in self._elements:
+        if str(element.guid) not in self._elements:
             raise Exception("Element not in the model.")
 
-        del self._elements[guid]
+        self.remove_elements([element])
 
-        self.graph.delete_node(element.graphnode)
-        self.tree.remove(element.treenode)
+    def remove_elements(self, elements: Iterable[Element]) -> list[Element]:
+        """Remove multiple elements from the model, with their descendants in the element tree.
+
+        Parameters
+        ----------
+        elements : Iterable[Element]
+            The elements to remove.
+
+        Returns
+        -------
+        list[Element]
+            All removed elements, including the descendants of the given elements.
+
+        Raises
+        ------
+        Exception
+            If one of the elements is not part of the model.
+
+        Notes
+        -----
+        The elements are removed in a single pass.
+        Every tree node that loses children rebuilds its list of children only once,
+        only the neighbours of the removed graph nodes are visited,
+        and the spatial indexes of the model are reset only once.
+
+        """
+        elements = list(elements)
+        for element in elements:
+            if str(element.guid) not in self._elements:
+                raise Exception("Element not in the model.")
+
+        removed: dict[str, Element] = {}
+        stack = list(elements)
+        while stack:
+            element = stack.pop()
+            guid = str(element.guid)
+            if guid in removed:
+                continue
+            removed[guid] = element
+            stack.extend(node.element for node in element.treenode.children)
+
+        # detach the top-level subtrees from their parents
+        parents: dict[int, ElementNode] = {}
+        for element in removed.values():
+            parent = element.treenode.parent
+            if parent is not None and (parent.is_root or str(parent.element.guid) not in removed):
+                parents[id(parent)] = parent
+        for parent in parents.values():
+            children = []
+            for node in parent.children:
+                if str(node.element.guid) not in removed:
+                    children.append(node)
+                else:
+                    node._parent = None
+            parent._children[:] = children
+
+        nodes = {element.graphnode for element in removed.values()}
+        self._graph.delete_nodes(list(nodes))
+        if self._contactposes:
+            self._contactposes = {(u, v): pose for (u, v), pose in self._contactposes.items() if u not in nodes and v not in nodes}
+
+        for guid, element in removed.items():
+            del self._elements[guid]
+            if self._index is not None:
+                self._index.remove(element)
+            self._cache.discard(element)
+            element.model = None  # type: ignore
+
+        self._bvh = None
+        self._kdtree = None
+        self._arrays = None
+
+        return list(removed.values())
 
     def has_element(self, element: Element) -> bool:
         """Returns True if the model contains the given element.
@@ -347,7 +650,7 @@ class Model(Datastructure):
         bool
 
         """
-        return any(element.name == name for element in self.elements())
+        return name in self.index
 
     def find_element_with_name(self, name: str) -> Optional[Element]:
         """Returns True if the model contains an element with the given name.
@@ -362,9 +665,7 @@ class Model(Datastructure):
         Element or None
 
         """
-        for element in self.elements():
-            if element.name == name:
-                return element
+        return self.index.first_named(name)
 
     def find_element_with_name_or_fail(self, name: str) -> Element:
         element = self.find_element_with_name(name)
@@ -372,6 +673,40 @@ class Model(Datastructure):
             raise ModelElementNotFound
         return element
 
+    def query(self) -> ElementQuery:
+        """Start a query over the elements of the model.
+
+        Returns
+        -------
+        ElementQuery
+
+        Examples
+        --------
+        >>> from compas_model.elements import BeamElement
+        >>> model = Model()
+        >>> group = model.add_group("storey")
+        >>> beam = model.add_element(BeamElement(), parent=group)
+        >>> model.query().of_type(BeamElement).descendants_of(group).to_list() == [beam]
+        True
+
+        """
+        return ElementQuery(self)
+
+    def find_all_elements_with_name(self, name: str) -> list[Element]:
+        """Find all model elements with a given name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the elements.
+
+        Returns
+        -------
+        list[Element]
+
+        """
+        return self.index.named(name)
+
     def find_all_elements_of_type(self, elementtype: Type[Element]) -> list[Element]:
         """Find all model elements of a given type.
 
@@ -385,11 +720,7 @@ class Model(Datastructure):
         list[Element]
 
         """
-        elements = []
-        for element in self.elements():
-            if isinstance(element, elementtype):
-                elements.append(element)
-        return elements
+        return self.index.of_type(elementtype)
 
     def remove_elements_of_type(self, elementtype: Type[Element]) -> list[Element]:
         """Remove all model elements of a given type.
@@ -402,12 +733,12 @@ class Model(Datastructure):
         Returns
         -------
         list[Element]
-            The removed elements.
+            The removed elements of the given type.
+            The descendants of these elements in the element tree are removed as well.
 
         """
         elements = self.find_all_elements_of_type(elementtype)
-        for element in elements:
-            self.remove_element(element)
+        self.remove_elements(elements)
         return elements
 
     # =============================================================================
@@ -566,6 +897,307 @@ class Model(Datastructure):
     # Other models
     # =============================================================================
 
+    def extract(self, root: Optional[Element] = None, elements: Optional[Iterable[Element]] = None) -> "Model":
+        """Extract part of the model as a new, independent model.
+
+        Parameters
+        ----------
+        root : Element, optional
+            Extract this element and all its descendants.
+        elements : Iterable[Element], optional
+            Extract these elements.
+
+        Returns
+        -------
+        Model
+            A model of the same type, with copies of the extracted elements.
+            The copies have the same guids as the originals.
+
+        Raises
+        ------
+        ValueError
+            If not exactly one of ``root`` and ``elements`` is provided.
+        ModelElementNotFound
+            If one of the elements is not part of the model.
+
+        Notes
+        -----
+        The hierarchy of the extracted elements is preserved.
+        If the parent of an extracted element is not extracted, the element is attached to the nearest extracted ancestor,
+        or to the root of the tree of the new model.
+        Only the interactions between extracted elements are copied, with their contacts and modifiers,
+        and only the materials that are assigned to extracted elements.
+
+        """
+        if (root is None) == (elements is None):
+            raise ValueError("Either a root element or a collection of elements should be provided.")
+
+        if root is not None:
+            if not self.has_element(root):
+                raise ModelElementNotFound
+            selection = {str(node.element.guid) for node in root.treenode.traverse()}
+        else:
+            selection = set()
+            for element in elements:  # type: ignore
+                if not self.has_element(element):
+                    raise ModelElementNotFound
+                selection.add(str(element.guid))
+
+        model = type(self)(name=self._name)
+        if self._transformation is not None:
+            model._transformation = self._transformation.copy()
+
+        for element in self.elements():
+            guid = str(element.guid)
+            if guid in selection and element._material and element._material not in model._materials:
+                material = self._materials[element._material]
+                model._materials[element._material] = material.copy(copy_guid=True)
+
+        copies: dict[str, Element] = {}
+        stack: list[tuple[ElementNode, Optional[Element]]] = [(node, None) for node in reversed(self._tree.root.children)]  # type: ignore
+        while stack:
+            node, parent = stack.pop()
+            guid = str(node.element.guid)
+            if guid in selection:
+                copy = node.element.copy(copy_guid=True)
+                model.add_element(copy, parent=parent)
+                copy.treenode.name = node._name
+                copy.treenode.attributes.update(node.attributes)
+                copies[guid] = copy
+                parent = copy
+            stack.extend((child, parent) for child in reversed(node.children))
+
+        for u, v in self._graph.edges():
+            a = self._graph.node_element(u)
+            b = self._graph.node_element(v)
+            if str(a.guid) in selection and str(b.guid) in selection:
+                attr = {name: _copy_attribute(value) for name, value in self._graph.edge[u][v].items()}
+                model._graph.add_edge(copies[str(a.guid)].graphnode, copies[str(b.guid)].graphnode, attr_dict=attr)
+
+        return model
+
+    def _interactionmap(self) -> dict[tuple[str, str], tuple[str, str, dict]]:
+        # the interactions of the model keyed by the guids of their source and target elements
+        # edges in opposite directions between the same elements, such as a modifier and an interaction, are kept apart
+        interactions = {}
+        for u, v in self._graph.edges():
+            a = str(self._graph.node_element(u).guid)
+            b = str(self._graph.node_element(v).guid)
+            interactions[(a, b)] = (a, b, self._graph.edge[u][v])
+        return interactions
+
+    def diff(self, other: "Model") -> dict:
+        """Compute the differences between this model and another model, as a patch that transforms this model into the other.
+
+        Elements, materials and interactions are matched by the guids of the elements.
+        Interactions are directed: edges in opposite directions between the same two elements are different interactions.
+
+        Parameters
+        ----------
+        other : Model
+            The other model, typically an edited copy of this model.
+
+        Returns
+        -------
+        dict
+            A serialisable patch, containing only the non-empty items of the following:
+
+            * ``"transformation"``: the new transformation of the model.
+            * ``"materials"``: new materials.
+            * ``"added"``: new elements with the guid of their parent, with parents before children.
+            * ``"replaced"``: elements of which the type changed.
+            * ``"changed"``: for every changed element, the new values of the items of its data that changed.
+            * ``"moved"``: for every moved element, the guid of its new parent.
+            * ``"removed"``: the guids of removed elements, with children before parents.
+            * ``"interactions_added"``: new interactions, as the guids of their source and target elements, with their attributes.
+            * ``"interactions_changed"``: changed interactions, with the new values of their changed attributes.
+            * ``"interactions_removed"``: the guids of the source and target elements of removed interactions.
+
+        Notes
+        -----
+        The patch refers to the elements and attribute values of the other model.
+        They are copied when the patch is applied.
+
+        See Also
+        --------
+        - [`apply_patch`][apply_patch]
+
+        """
+        patch: dict = {}
+
+        if not _equal_attribute(self._transformation, other._transformation):
+            patch["transformation"] = other._transformation
+
+        materials = [material for guid, material in other._materials.items() if guid not in self._materials]
+        if materials:
+            patch["materials"] = materials
+
+        added = []
+        replaced = []
+        changed = {}
+        moved = {}
+        nodes, parents = other._tree.flatten()
+        for node, parent in zip(nodes, parents):
+            element = node.element
+            guid = str(element.guid)
+            parentguid = None if parent < 0 else str(nodes[parent].element.guid)
+            current = self._elements.get(guid)
+            if current is None:
+                added.append([element, parentguid])
+                continue
+            currentparent = current.treenode.parent
+            if (None if currentparent.is_root else str(currentparent.element.guid)) != parentguid:
+                moved[guid] = parentguid
+            if type(current) is not type(element):
+                replaced.append(element)
+                continue
+            data = current.__data__
+            delta = {key: value for key, value in element.__data__.items() if key not in data or not _equal_attribute(data[key], value)}
+            if delta:
+                changed[guid] = delta
+
+        nodes, _ = self._tree.flatten()
+        removed = [str(node.element.guid) for node in reversed(nodes) if str(node.element.guid) not in other._elements]
+
+        for key, value in (("added", added), ("replaced", replaced), ("changed", changed), ("moved", moved), ("removed", removed)):
+            if value:
+                patch[key] = value
+
+        interactions = self._interactionmap()
+        otherinteractions = other._interactionmap()
+
+        interactions_added = []
+        interactions_changed = []
+        for key, (a, b, attr) in otherinteractions.items():
+            if key not in interactions:
+                interactions_added.append([a, b, attr])
+                continue
+            current = interactions[key][2]
+            delta = {name: value for name, value in attr.items() if name not in current or not _equal_attribute(current[name], value)}
+            delta.update({name: None for name in current if name not in attr})
+            if delta:
+                interactions_changed.append([a, b, delta])
+
+        interactions_removed = []
+        for key, (a, b, _) in interactions.items():
+            if key not in otherinteractions and a in other._elements and b in other._elements:
+                interactions_removed.append([a, b])
+
+        for key, value in (
+            ("interactions_added", interactions_added),
+            ("interactions_changed", interactions_changed),
+            ("interactions_removed", interactions_removed),
+        ):
+            if value:
+                patch[key] = value
+
+        return patch
+
+    def apply_patch(self, patch: dict) -> None:
+        """Apply a patch computed with [`diff`][diff] to this model.
+
+        Parameters
+        ----------
+        patch : dict
+            The patch.
+
+        Returns
+        -------
+        None
+            The model is modified in-place.
+
+        Notes
+        -----
+        Moved elements are added as the last child of their new parent.
+        Elements with changes other than a change of transformation or name are replaced by a new element
+        with the same guid, constructed from the updated data of the original element.
+
+        """
+        if "transformation" in patch:
+            self.transformation = _copy_attribute(patch["transformation"])
+
+        for material in patch.get("materials", []):
+            self._materials[str(material.guid)] = material.copy(copy_guid=True)
+
+        for element, parentguid in patch.get("added", []):
+            parent = None if parentguid is None else self._elements[parentguid]
+            self.add_element(element.copy(copy_guid=True), parent=parent)
+
+        for element in patch.get("replaced", []):
+            self._replace_element(self._elements[str(element.guid)], element.copy(copy_guid=True))
+
+        for guid, delta in patch.get("changed", {}).items():
+            element = self._elements[guid]
+            delta = {key: _copy_attribute(value) for key, value in delta.items()}
+            if delta.keys() <= {"transformation", "name"}:
+                if "transformation" in delta:
+                    element.transformation = delta["transformation"]
+                if "name" in delta:
+                    element.name = delta["name"]
+            else:
+                data = element.__data__
+                data.update(delta)
+                new = type(element).__from_data__(data)
+                new._guid = element._guid
+                self._replace_element(element, new)
+
+        for guid, parentguid in patch.get("moved", {}).items():
+            node = self._elements[guid].treenode
+            parentnode = self._tree.root if parentguid is None else self._elements[parentguid].treenode
+            node.parent.remove(node)
+            parentnode.add(node)
+            # the model transformations of the moved subtree depend on the new ancestors
+            for descendant in node.traverse():
+                self._cache.discard(descendant.element)
+            self._bvh = None
+            self._kdtree = None
+            self._arrays = None
+
+        for guid in patch.get("removed", []):
+            self.remove_element(self._elements[guid])
+
+        # interactions are directed edges from the first to the second element
+        for a, b, attr in patch.get("interactions_added", []):
+            edge = self._elements[a].graphnode, self._elements[b].graphnode
+            if not self._graph.has_edge(edge):
+                self._graph.add_edge(*edge)
+            for name, value in attr.items():
+                self._graph.edge_attribute(edge, name=name, value=_copy_attribute(value))
+
+        for a, b, attr in patch.get("interactions_changed", []):
+            edge = self._elements[a].graphnode, self._elements[b].graphnode
+            for name, value in attr.items():
+                if value is None:
+                    self._graph.unset_edge_attribute(edge, name)
+                else:
+                    self._graph.edge_attribute(edge, name=name, value=_copy_attribute(value))
+
+        for a, b in patch.get("interactions_removed", []):
+            edge = self._elements[a].graphnode, self._elements[b].graphnode
+            if self._graph.has_edge(edge):
+                self._graph.delete_edge(edge)
+                self._contactposes.pop(edge, None)
+
+    def _replace_element(self, element: Element, new: Element) -> None:
+        # replace an element by a new element with the same guid, in the same tree and graph nodes
+        new.model = self
+        new._localcache = None
+        new.treenode = element.treenode
+        new.treenode.element = new
+        new.graphnode = element.graphnode
+        self._elements[str(element.guid)] = new
+        if self._index is not None:
+            self._index.replace(element, new)
+
+        self._bvh = None
+        self._kdtree = None
+        self._arrays = None
+
+        self._cache.discard(element)
+        element.model = None  # type: ignore
+        element.treenode = None  # type: ignore
+        element.graphnode = None  # type: ignore
+
     # =============================================================================
     # Contacts (with contacts a specific type of interaction)
     # =============================================================================
@@ -577,6 +1209,46 @@ class Model(Datastructure):
                 for contact in contacts:
                     yield contact
 
+    @property
+    def contact_table(self) -> ContactTable:
+        version = id(self._graph), self._graph.version
+        if self._contacttable is None or self._contacttable[0] != version:
+            self._contacttable = version, self.compute_contact_table()
+        return self._contacttable[1]
+
+    def compute_contact_table(self) -> ContactTable:
+        """Compute a columnar table of all contacts of the model.
+
+        Returns
+        -------
+        :class:`compas_model.interactions.ContactTable`
+
+        """
+        return ContactTable.from_graph(self._graph)
+
+    def compute_interface_mesh(self, target_size: Optional[float] = None) -> InterfaceMesh:
+        """Triangulate the contact polygons of all interactions into one combined mesh, for example for FE pre-processing.
+
+        Parameters
+        ----------
+        target_size : float, optional
+            The target length of the edges of the triangles.
+
+        Returns
+        -------
+        :class:`compas_model.interactions.InterfaceMesh`
+            The combined vertices and triangles, with the face ranges and the interaction edges of the contacts.
+            The contacts are in the same order as in the [`contact_table`][contact_table].
+
+        """
+        contacts = []
+        edges = []
+        for u, v in self._graph.edges():
+            for contact in self._graph.edge[u][v].get("contacts") or []:
+                contacts.append(contact)
+                edges.append((u, v))
+        return InterfaceMesh(contacts, edges=edges, target_size=target_size)
+
     # =============================================================================
     # Interactions
     # =============================================================================
@@ -624,7 +1296,9 @@ class Model(Datastructure):
                 "Something went wrong: the elements are not in the interaction graph."
             )
 
-        edge = self.graph.add_edge(node_a, node_b)
+        edge = self.graph.find_edge(node_a, node_b)
+        if edge is None:
+            edge = self.graph.add_edge(node_a, node_b)
         return edge
 
     def remove_interaction(self, a: Element, b: Element) -> None:
@@ -640,15 +1314,11 @@ class Model(Datastructure):
         None
 
         """
-        edge = a.graphnode, b.graphnode
-        if self.graph.has_edge(edge):
-            self.graph.delete_edge(edge)
-            return
-
-        edge = b.graphnode, a.graphnode
-        if self.graph.has_edge(edge):
+        edge = self.graph.find_edge(a.graphnode, b.graphnode)
+        if edge is not None:
             self.graph.delete_edge(edge)
-            return
+            self._contactposes.pop(edge, None)
+            self._contactposes.pop(edge[::-1], None)
 
     def has_interaction(self, a: Element, b: Element) -> bool:
         """Returns True if two elements have an interaction set between them.
@@ -665,12 +1335,83 @@ class Model(Datastructure):
         bool
 
         """
-        edge = a.graphnode, b.graphnode
-        result = self.graph.has_edge(edge)
-        if not result:
-            edge = b.graphnode, a.graphnode
-            result = self.graph.has_edge(edge)
-        return result
+        return self.graph.find_edge(a.graphnode, b.graphnode) is not None
+
+    def interaction_elements(self) -> list[Element]:
+        """The elements of the model in the order of the rows and columns of the sparse matrices of the interaction graph.
+
+        Returns
+        -------
+        list[Element]
+
+        See Also
+        --------
+        - [`compas_model.models.InteractionGraph.adjacency_matrix`][compas_model.models.InteractionGraph.adjacency_matrix]
+        - [`compas_model.models.InteractionGraph.incidence_matrix`][compas_model.models.InteractionGraph.incidence_matrix]
+
+        """
+        return [self._graph.node_element(node) for node in self._graph.index_node]
+
+    def connected_components(self, contacts: bool = False) -> list[list[Element]]:
+        """Group the elements of the model into sets of elements that are connected by interactions.
+
+        Parameters
+        ----------
+        contacts : bool, optional
+            If True, only interactions with contacts connect elements.
+
+        Returns
+        -------
+        list[list[Element]]
+            The elements of every component.
+            Elements without interactions form a component of their own.
+
+        See Also
+        --------
+        - [`compas_model.models.InteractionGraph.connected_components`][compas_model.models.InteractionGraph.connected_components]
+
+        """
+        graph = self._graph
+        components = graph.connected_components("contacts" if contacts else None)
+        return [[graph.node_element(node) for node in component] for component in components]
+
+    def partition(
+        self, number: int, weight: Optional[Callable[[Element], float]] = None
+    ) -> tuple[list[list[Element]], list[tuple[Element, Element]]]:
+        """Partition the elements of the model into a number of parts with few interactions between them.
+
+        Parameters
+        ----------
+        number : int
+            The number of parts.
+        weight : Callable[[Element], float], optional
+            A function computing the weight of an element, for balancing the parts.
+            By default, the parts have (approximately) the same number of elements.
+
+        Returns
+        -------
+        tuple[list[list[Element]], list[tuple[Element, Element]]]
+            The elements of every part, and the pairs of elements of the interactions between different parts.
+
+        Notes
+        -----
+        The parts can be turned into separate models with [`extract`][extract].
+        The interactions between parts are not included in these models.
+
+        See Also
+        --------
+        - [`compas_model.models.InteractionGraph.partition`][compas_model.models.InteractionGraph.partition]
+
+        """
+        graph = self._graph
+        weights = None
+        if weight is not None:
+            weights = {node: weight(graph.node_element(node)) for node in graph.nodes()}
+        parts, cut = graph.partition(number, weights=weights)
+        return (
+            [[graph.node_element(node) for node in part] for part in parts],
+            [(graph.node_element(u), graph.node_element(v)) for u, v in cut],
+        )
 
     # =============================================================================
     # Modifiers (temp)
@@ -709,8 +1450,16 @@ class Model(Datastructure):
         The protocol methods of the source element are used to compute the modification tool.
         The modifier applies the modification to the target using this tool.
 
+        Modifiers are directed: they are stored on the edge from source to target,
+        which is added if it doesn't exist yet, even if there is an interaction edge from target to source.
+
         """
-        edge = self.add_interaction(source, target)
+        if not self.has_element(source) or not self.has_element(target):
+            raise Exception("Please add both elements to the model first.")
+
+        u = source.graphnode
+        v = target.graphnode
+        edge = (u, v) if self.graph.has_edge((u, v)) else self.graph.add_edge(u, v)
         modifiers = self.graph.edge_attribute(edge, name="modifiers") or []
         modifiers.append(modifier)
         self.graph.edge_attribute(edge, name="modifiers", value=modifiers)
@@ -742,8 +1491,8 @@ class Model(Datastructure):
         ElementBVH
 
         """
-        self._bvh = ElementBVH.from_elements(
-            self.elements(),
+        self._bvh = ElementBVH.from_arrays(
+            self.arrays,
             nodetype=nodetype,
             max_depth=max_depth,
             leafsize=leafsize,
@@ -760,11 +1509,23 @@ class Model(Datastructure):
         :class:`KDTree`
 
         """
-        self._kdtree = KDTree(list(self.elements()))
+        arrays = self.arrays
+        self._kdtree = KDTree(arrays.elements, points=arrays.points)
         return self._kdtree
 
+    def compute_arrays(self) -> ElementArrays:
+        """Compute the structure-of-arrays cache of the spatial data of the elements.
+
+        Returns
+        -------
+        :class:`ElementArrays`
+
+        """
+        self._arrays = ElementArrays.from_model(self)
+        return self._arrays
+
     def compute_contacts(
-        self, tolerance=1e-6, minimum_area=1e-2, contacttype: Type[Contact] = Contact
+        self, tolerance=1e-6, minimum_area=1e-2, contacttype: Type[Contact] = Contact, clear: bool = False
     ) -> None:
         """Compute the contacts between the block elements of this model.
 
@@ -782,6 +1543,9 @@ class Model(Datastructure):
             The distance tolerance.
         minimum_area : float, optional
             The minimum contact size.
+        clear : bool, optional
+            If True, all existing interaction edges are removed first,
+            and the edges of the recomputed contacts are added in bulk.
 
         Returns
         -------
@@ -790,13 +1554,43 @@ class Model(Datastructure):
         """
         # somehow this should not take into account past calculations.
 
+        if clear:
+            self.graph.clear_edges()
+            self._contactposes.clear()
+            edges = []
+            attributes = []
+            seen = set()
+            bvh = self.bvh
+            for element in self.elements():
+                u = element.graphnode
+                for nbr in bvh.nearest_neighbors(element):
+                    v = nbr.graphnode
+                    key = (u, v) if u <= v else (v, u)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    contacts = element.compute_contacts(
+                        nbr,
+                        tolerance=tolerance,
+                        minimum_area=minimum_area,
+                        contacttype=contacttype,
+                    )
+                    if contacts:
+                        edges.append((u, v))
+                        attributes.append({"contacts": contacts})
+            self.graph.add_edges_from(edges, attributes)
+            return
+
+        bvh = self.bvh
         for element in self.elements():
             u = element.graphnode
 
-            for nbr in self.bvh.nearest_neighbors(element):
+            for nbr in bvh.nearest_neighbors(element):
                 v = nbr.graphnode
 
-                if not self.graph.has_edge((u, v), directed=False):
+                edge = self.graph.find_edge(u, v)
+
+                if edge is None:
                     # there is no interaction edge between the two elements
                     contacts = element.compute_contacts(
                         nbr,
@@ -809,7 +1603,6 @@ class Model(Datastructure):
 
                 else:
                     # there is an existing edge between the two elements
-                    edge = (u, v) if self.graph.has_edge((u, v)) else (v, u)
                     contacts = self.graph.edge_attribute(edge, name="contacts")
                     if not contacts:
                         contacts = element.compute_contacts(
@@ -823,6 +1616,117 @@ class Model(Datastructure):
                                 edge, name="contacts", value=contacts
                             )
 
+    def track_contacts(
+        self,
+        tolerance: float = 1e-6,
+        minimum_area: float = 1e-2,
+        contacttype: Type[Contact] = Contact,
+        pose_tolerance: float = 1e-6,
+    ) -> dict[str, int]:
+        """Update the contacts between the elements of this model after (small) changes of the poses of the elements.
+
+        The contacts of a pair of neighbouring elements are only recomputed if the pose of the elements relative to each other
+        changed more than a tolerance since the contacts were last computed.
+        Otherwise, the existing contacts are transformed with the change of the pose of the first element of the pair.
+
+        Parameters
+        ----------
+        tolerance : float, optional
+            The distance tolerance.
+        minimum_area : float, optional
+            The minimum contact size.
+        contacttype : Type[Contact], optional
+            The type of the computed contacts.
+        pose_tolerance : float, optional
+            The maximum displacement of the second element of a pair relative to the first, for reusing the contacts of the pair.
+
+        Returns
+        -------
+        dict[str, int]
+            The number of ``"reused"`` and ``"recomputed"`` pairs,
+            and the number of ``"separated"`` pairs that were tracked but are no longer neighbours.
+
+        Notes
+        -----
+        The displacement of the second element of a pair is measured at the corners of its AABB,
+        in the coordinate frame of the first element,
+        and is therefore an upper bound for the displacement of any point of its geometry.
+        The relative pose is measured against the pose at which the contacts were last computed,
+        such that small changes don't accumulate unnoticed over multiple updates.
+
+        Unlike [`compute_contacts`][compute_contacts], existing contacts of neighbouring elements are replaced if they are recomputed,
+        and also pairs of elements without contacts are tracked.
+        The contacts of tracked pairs that are no longer neighbours are cleared, and the pairs are no longer tracked.
+        The first call computes the contacts of all pairs.
+        Pairs of which the contacts were removed from the interaction graph in the meantime are recomputed.
+        Poses are not serialised with the model.
+
+        """
+        graph = self._graph
+        poses = self._contactposes
+        arrays = self.arrays
+        bvh = self.bvh
+        reused = 0
+        recomputed = 0
+        seen = set()
+
+        # groups have no geometry of their own, and are not part of the arrays
+        for element in arrays.elements:
+            for nbr in bvh.nearest_neighbors(element):
+                key = (element.graphnode, nbr.graphnode) if element.graphnode <= nbr.graphnode else (nbr.graphnode, element.graphnode)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                # compute and transform contacts in the direction of the interaction edge, if there is one
+                edge = graph.find_edge(*key)
+                u, v = edge or (element.graphnode, nbr.graphnode)
+                a = graph.node_element(u)
+                b = graph.node_element(v)
+                contacts = graph.edge_attribute(edge, "contacts") if edge else None
+
+                a_matrix = asarray(a.modeltransformation.matrix)
+                b_matrix = asarray(b.modeltransformation.matrix)
+                relative = inv(a_matrix) @ b_matrix
+
+                pose = poses.get((u, v))
+                if pose is not None and pose[2] == bool(contacts):
+                    a_old, relative_old, _ = pose
+                    corners = ones((8, 4))
+                    corners[:, :3] = b.aabb.points
+                    local = corners @ inv(a_matrix).T
+                    # the positions of the corners at the old relative pose
+                    previous = local @ (relative_old @ inv(relative)).T
+                    if ((local[:, :3] - previous[:, :3]) ** 2).sum(axis=1).max() <= pose_tolerance**2:
+                        if contacts:
+                            change = Transformation.from_matrix((a_matrix @ inv(a_old)).tolist())
+                            for contact in contacts:
+                                contact.transform(change)
+                            graph.edge_attribute(edge, "contacts", contacts)
+                        poses[(u, v)] = a_matrix, relative_old, pose[2]
+                        reused += 1
+                        continue
+
+                contacts = a.compute_contacts(b, tolerance=tolerance, minimum_area=minimum_area, contacttype=contacttype)
+                if edge:
+                    graph.edge_attribute(edge, "contacts", contacts)
+                elif contacts:
+                    graph.add_edge(u, v, contacts=contacts)
+                poses[(u, v)] = a_matrix, relative, bool(contacts)
+                recomputed += 1
+
+        # tracked pairs that are no longer neighbours have moved apart
+        separated = 0
+        for u, v in list(poses):
+            if ((u, v) if u <= v else (v, u)) in seen:
+                continue
+            del poses[(u, v)]
+            if graph.has_edge((u, v)) and graph.edge_attribute((u, v), "contacts"):
+                graph.edge_attribute((u, v), "contacts", [])
+            separated += 1
+
+        return {"reused": reused, "recomputed": recomputed, "separated": separated}
+
     # =============================================================================
     # Other Methods
     # =============================================================================
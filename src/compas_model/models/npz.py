@@ -0,0 +1,805 @@
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterator
+from typing import Mapping
+from typing import Optional
+from typing import Type
+from typing import Union
+from uuid import UUID
+from zipfile import ZIP_STORED
+
+from numpy import arange
+from numpy import argsort
+from numpy import array
+from numpy import asarray
+from numpy import bincount
+from numpy import concatenate
+from numpy import cumsum
+from numpy import empty
+from numpy import float64
+from numpy import frombuffer
+from numpy import full
+from numpy import int32
+from numpy import int64
+from numpy import isin
+from numpy import isnan
+from numpy import load
+from numpy import memmap
+from numpy import nan
+from numpy import ndarray
+from numpy import savez
+from numpy import savez_compressed
+from numpy import searchsorted
+from numpy import sort
+from numpy import uint8
+from numpy import zeros
+from numpy.lib.format import read_array_header_1_0
+from numpy.lib.format import read_array_header_2_0
+from numpy.lib.format import read_magic
+
+from compas.data import json_dumps
+from compas.data import json_loads
+from compas.data.encoders import cls_from_dtype
+from compas.geometry import Frame
+from compas.geometry import Polygon
+from compas.geometry import Transformation
+from compas_model.elements import Element
+from compas_model.interactions import Contact
+
+from .interactiongraph import InteractionGraph
+
+if TYPE_CHECKING:
+    from compas_model.models import Model
+
+
+FORMAT_VERSION = 1
+
+# flags of the transformation column
+# 0: the data of the element has no transformation
+# 1: the transformation of the element is None
+# 2: the transformation of the element is stored in the transformation array
+NO_TRANSFORMATION = 0
+NONE_TRANSFORMATION = 1
+ARRAY_TRANSFORMATION = 2
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _encode_json(obj: Any) -> ndarray:
+    return frombuffer(json_dumps(obj, compact=True).encode("utf-8"), dtype=uint8)
+
+
+def _decode_json(buffer: ndarray) -> Any:
+    return json_loads(buffer.tobytes().decode("utf-8"))
+
+
+def _encode_jsons(objs: list[Any]) -> tuple[ndarray, ndarray]:
+    chunks = [json_dumps(obj, compact=True).encode("utf-8") for obj in objs]
+    offsets = zeros(len(chunks) + 1, dtype=int64)
+    offsets[1:] = cumsum([len(chunk) for chunk in chunks])
+    return frombuffer(b"".join(chunks), dtype=uint8), offsets
+
+
+def _decode_jsons(buffer: ndarray, offsets: ndarray, index: int) -> Any:
+    return json_loads(buffer[offsets[index] : offsets[index + 1]].tobytes().decode("utf-8"))
+
+
+def _is_scalar(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _flatten(pointsets: list[list[Any]]) -> tuple[ndarray, ndarray]:
+    offsets = zeros(len(pointsets) + 1, dtype=int64)
+    offsets[1:] = cumsum([len(points) for points in pointsets])
+    points = empty((offsets[-1], 3), dtype=float64)
+    for i, pointset in enumerate(pointsets):
+        if len(pointset):
+            points[offsets[i] : offsets[i + 1]] = pointset
+    return points, offsets
+
+
+# =============================================================================
+# Writing
+# =============================================================================
+
+
+def _is_columnar(contacts: Optional[list[Contact]]) -> bool:
+    if not contacts:
+        return False
+    return all(type(contact) is Contact and contact._mesh is None and contact._name is None for contact in contacts)
+
+
+def model_to_npz(model: "Model", filepath: str, compress: bool = False) -> None:
+    """Write a model to a binary, columnar NPZ file.
+
+    Parameters
+    ----------
+    model : Model
+        The model.
+    filepath : str
+        The path of the output file.
+    compress : bool, optional
+        If True, compress the arrays.
+        Note that the arrays of compressed files can't be memory-mapped by [`ModelArchive`][ModelArchive].
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    Transformations, numeric element parameters, tree parent indices, graph edges and contact polygons are stored as typed arrays.
+    Remaining element parameters, edge attributes (such as modifiers), and contacts that don't fit the columnar layout
+    are stored as JSON strings, with one string per element or edge.
+
+    """
+    arrays: dict[str, ndarray] = {}
+
+    # elements
+
+    elements: list[Element] = list(model.elements())
+    rows = {str(element.guid): row for row, element in enumerate(elements)}
+    n = len(elements)
+
+    layouts: list[dict] = []
+    layout_index: dict[tuple, int] = {}
+    layout_params: list[list[list[float]]] = []
+    element_layouts = full(n, -1, dtype=int32)
+    element_layout_rows = full(n, -1, dtype=int32)
+    transformation_flags = zeros(n, dtype=uint8)
+    transformations = zeros((n, 4, 4), dtype=float64)
+    element_data: list[dict] = []
+
+    for row, element in enumerate(elements):
+        data = dict(element.__data__)
+
+        if "transformation" in data:
+            transformation = data.pop("transformation")
+            if transformation is None:
+                transformation_flags[row] = NONE_TRANSFORMATION
+            else:
+                transformation_flags[row] = ARRAY_TRANSFORMATION
+                transformations[row] = transformation.matrix
+
+        keys = tuple((key, "i" if isinstance(value, int) else "f") for key, value in data.items() if _is_scalar(value))
+        signature = (element.__dtype__, keys)
+        layout = layout_index.get(signature)
+        if layout is None:
+            layout = layout_index[signature] = len(layouts)
+            layouts.append({"type": element.__dtype__, "keys": [key for key, _ in keys], "ints": [key for key, kind in keys if kind == "i"]})
+            layout_params.append([])
+
+        element_layouts[row] = layout
+        element_layout_rows[row] = len(layout_params[layout])
+        layout_params[layout].append([data.pop(key) for key, _ in keys])
+        element_data.append(data)
+
+    arrays["element_guids"] = array([str(element.guid) for element in elements], dtype=str)
+    arrays["element_names"] = array([element._name or "" for element in elements], dtype=str)
+    arrays["element_named"] = array([element._name is not None for element in elements], dtype=bool)
+    # not all element types include the material in their data
+    arrays["element_materials"] = array([element._material or "" for element in elements], dtype=str)
+    arrays["element_layouts"] = element_layouts
+    arrays["element_layout_rows"] = element_layout_rows
+    arrays["element_transformation_flags"] = transformation_flags
+    arrays["element_transformations"] = transformations
+    arrays["element_json"], arrays["element_json_offsets"] = _encode_jsons(element_data)
+    for layout, params in enumerate(layout_params):
+        arrays["layout_params_{}".format(layout)] = asarray(params, dtype=float64).reshape(len(params), len(layouts[layout]["keys"]))
+
+    # tree
+
+    nodes, parents = model.tree.flatten()
+
+    arrays["tree_parents"] = array(parents, dtype=int32)
+    arrays["tree_elements"] = array([rows[str(node.element.guid)] for node in nodes], dtype=int32)
+    arrays["tree_names"] = array([node._name or "" for node in nodes], dtype=str)
+    arrays["tree_named"] = array([node._name is not None for node in nodes], dtype=bool)
+    tree_attributes = {position: node.attributes for position, node in enumerate(nodes) if node.attributes}
+
+    # graph
+
+    graph = model.graph
+    arrays["graph_nodes"] = array([element.graphnode for element in elements], dtype=int64)
+    node_attributes = {}
+    for row, element in enumerate(elements):
+        attr = {key: value for key, value in graph.node[element.graphnode].items() if key != "element"}
+        if attr:
+            node_attributes[row] = attr
+
+    edges = list(graph.edges())
+    edge_data: list[dict] = []
+    edge_contacts = zeros(len(edges) + 1, dtype=int64)
+    contacts: list[Contact] = []
+
+    for index, (u, v) in enumerate(edges):
+        attr = dict(graph.edge[u][v])
+        if _is_columnar(attr.get("contacts")):
+            contacts.extend(attr.pop("contacts"))
+        edge_contacts[index + 1] = len(contacts)
+        edge_data.append(attr)
+
+    arrays["graph_edges"] = array(edges, dtype=int64).reshape(-1, 2)
+    arrays["edge_json"], arrays["edge_json_offsets"] = _encode_jsons(edge_data)
+    arrays["edge_contacts"] = edge_contacts
+
+    # contacts
+
+    frames = full((len(contacts), 3, 3), nan, dtype=float64)
+    sizes = full(len(contacts), nan, dtype=float64)
+    holes: list[list[Polygon]] = []
+    for index, contact in enumerate(contacts):
+        if contact._frame is not None:
+            frames[index] = [contact._frame.point, contact._frame.xaxis, contact._frame.yaxis]
+        if contact._size is not None:
+            sizes[index] = contact._size
+        holes.append(contact._holes or [])
+
+    arrays["contact_points"], arrays["contact_offsets"] = _flatten([contact.points for contact in contacts])
+    arrays["contact_frames"] = frames
+    arrays["contact_sizes"] = sizes
+    arrays["hole_points"], arrays["hole_offsets"] = _flatten([hole.points for contactholes in holes for hole in contactholes])
+    arrays["contact_holes"] = zeros(len(contacts) + 1, dtype=int64)
+    arrays["contact_holes"][1:] = cumsum([len(contactholes) for contactholes in holes])
+
+    # meta
+
+    meta = {
+        "version": FORMAT_VERSION,
+        "type": model.__dtype__,
+        "name": model._name,
+        "transformation": model.transformation,
+        "materials": model._materials,
+        "layouts": layouts,
+        "tree": {"attributes": model.tree.attributes, "root": {"name": model.tree.root._name, "attributes": model.tree.root.attributes}},
+        "tree_attributes": tree_attributes,
+        "graph": {
+            "attributes": graph.attributes,
+            "default_node_attributes": graph.default_node_attributes,
+            "default_edge_attributes": graph.default_edge_attributes,
+            "max_node": graph._max_node,
+        },
+        "node_attributes": node_attributes,
+    }
+    arrays["meta"] = _encode_json(meta)
+
+    if compress:
+        savez_compressed(filepath, **arrays)
+    else:
+        savez(filepath, **arrays)
+
+
+# =============================================================================
+# Reading
+# =============================================================================
+
+
+def _decode_element(data: Mapping[str, ndarray], meta: dict, row: int) -> Element:
+    layout = meta["layouts"][int(data["element_layouts"][row])]
+    elementdata = _decode_jsons(data["element_json"], data["element_json_offsets"], row)
+
+    params = data["layout_params_{}".format(data["element_layouts"][row])][data["element_layout_rows"][row]]
+    ints = layout["ints"]
+    for key, value in zip(layout["keys"], params.tolist()):
+        elementdata[key] = int(value) if key in ints else value
+
+    flag = data["element_transformation_flags"][row]
+    if flag == NONE_TRANSFORMATION:
+        elementdata["transformation"] = None
+    elif flag == ARRAY_TRANSFORMATION:
+        elementdata["transformation"] = Transformation(data["element_transformations"][row].tolist())
+
+    cls: Type[Element] = cls_from_dtype(layout["type"])
+    element = cls.__from_data__(elementdata)
+    element._guid = UUID(str(data["element_guids"][row]))
+    if data["element_named"][row]:
+        element._name = str(data["element_names"][row])
+    if "element_materials" in data and data["element_materials"][row]:
+        element._material = str(data["element_materials"][row])
+    return element
+
+
+def _decode_contact(data: Mapping[str, ndarray], index: int) -> Contact:
+    offsets = data["contact_offsets"]
+    points = data["contact_points"][offsets[index] : offsets[index + 1]].tolist()
+
+    frame = None
+    framedata = data["contact_frames"][index]
+    if not isnan(framedata[0, 0]):
+        frame = Frame(*framedata.tolist())
+
+    size = None
+    if not isnan(data["contact_sizes"][index]):
+        size = float(data["contact_sizes"][index])
+
+    holes = None
+    start, end = data["contact_holes"][index], data["contact_holes"][index + 1]
+    if end > start:
+        hole_offsets = data["hole_offsets"]
+        hole_points = data["hole_points"]
+        holes = [Polygon(hole_points[hole_offsets[i] : hole_offsets[i + 1]].tolist()) for i in range(start, end)]
+
+    return Contact(points=points, frame=frame, size=size, holes=holes)
+
+
+def _decode_edge_attributes(data: Mapping[str, ndarray], index: int) -> dict:
+    attr = _decode_jsons(data["edge_json"], data["edge_json_offsets"], index)
+    start, end = data["edge_contacts"][index], data["edge_contacts"][index + 1]
+    if end > start:
+        attr["contacts"] = [_decode_contact(data, i) for i in range(start, end)]
+    return attr
+
+
+class _LazyArrays:
+    # read the arrays of an NPZ file only when they are first accessed,
+    # and map the arrays of uncompressed members into memory instead of reading them
+
+    def __init__(self, npz, filepath: str) -> None:
+        self._npz = npz
+        self._filepath = filepath
+        self._arrays: dict[str, ndarray] = {}
+
+    def __getitem__(self, name: str) -> ndarray:
+        array = self._arrays.get(name)
+        if array is None:
+            array = self._map(name)
+            if array is None:
+                array = self._npz[name]
+            self._arrays[name] = array
+        return array
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._arrays or name in self._npz.files
+
+    def _map(self, name: str) -> Optional[ndarray]:
+        info = self._npz.zip.getinfo("{}.npy".format(name))
+        if info.compress_type != ZIP_STORED:
+            return None
+        with open(self._filepath, "rb") as fp:
+            # the data of a member follows its local file header, of which the size depends on the lengths of the name and extra fields
+            fp.seek(info.header_offset)
+            header = fp.read(30)
+            fp.seek(info.header_offset + 30 + int.from_bytes(header[26:28], "little") + int.from_bytes(header[28:30], "little"))
+            version = read_magic(fp)
+            if version == (1, 0):
+                shape, fortran, dtype = read_array_header_1_0(fp)
+            elif version == (2, 0):
+                shape, fortran, dtype = read_array_header_2_0(fp)
+            else:
+                return None
+            offset = fp.tell()
+        if dtype.hasobject or not shape or 0 in shape:
+            return None
+        return memmap(self._filepath, dtype=dtype, mode="r", offset=offset, shape=shape, order="F" if fortran else "C")
+
+    def clear(self) -> None:
+        self._arrays.clear()
+
+
+class ModelArchive:
+    """Read-only, lazy view of a model stored in a binary, columnar NPZ file.
+
+    Opening an archive only reads the metadata of the model.
+    Elements and interactions are decoded when they are accessed.
+    The arrays of the file are read the first time they are needed.
+
+    Parameters
+    ----------
+    filepath : str
+        The path of the file.
+
+    Attributes
+    ----------
+    meta : dict
+        The metadata of the model.
+    guids : list[str], read-only
+        The guids of the elements, in storage order.
+
+    Notes
+    -----
+    The arrays of uncompressed files are memory-mapped, such that only the parts that are used are read from disk.
+    The arrays of compressed files are read in full on first access.
+    The index of guids to rows, the index of the children of the nodes of the element tree,
+    and the index of the interactions of the elements are built on first use.
+
+    Examples
+    --------
+    >>> with ModelArchive("model.npz") as archive:  # doctest: +SKIP
+    ...     storey = archive.find_element_with_name("storey 1")
+    ...     model = archive.load(root=storey)
+
+    """
+
+    def __init__(self, filepath: str) -> None:
+        self._npz = load(filepath, allow_pickle=False)
+        self._data = _LazyArrays(self._npz, filepath)
+        self._elements: dict[int, Element] = {}
+        self._edges: Optional[tuple[ndarray, ndarray, ndarray]] = None
+        self._guids: Optional[list[str]] = None
+        self._rows: Optional[dict[str, int]] = None
+        self._positions: Optional[ndarray] = None
+        self._children: Optional[tuple[ndarray, ndarray]] = None
+
+        self.meta: dict = _decode_json(self._data["meta"])
+        if self.meta["version"] > FORMAT_VERSION:
+            self.close()
+            raise ValueError("Unsupported file format version: {}".format(self.meta["version"]))
+
+    def __enter__(self) -> "ModelArchive":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._data["element_guids"])
+
+    @property
+    def guids(self) -> list[str]:
+        if self._guids is None:
+            self._guids = self._data["element_guids"].tolist()
+        return self._guids
+
+    @property
+    def _parents(self) -> ndarray:
+        return self._data["tree_parents"]
+
+    @property
+    def _treeelements(self) -> ndarray:
+        return self._data["tree_elements"]
+
+    def close(self) -> None:
+        """Close the underlying file.
+
+        Returns
+        -------
+        None
+
+        """
+        self._data.clear()
+        self._npz.close()
+
+    def _guid(self, row: int) -> str:
+        return str(self._data["element_guids"][row])
+
+    def _row(self, element: Union[Element, str]) -> int:
+        guid = element if isinstance(element, str) else str(element.guid)
+        if self._rows is None:
+            self._rows = {guid: row for row, guid in enumerate(self.guids)}
+        if guid not in self._rows:
+            raise KeyError("Element not in archive: {}".format(guid))
+        return self._rows[guid]
+
+    def _position(self, row: int) -> int:
+        # the position of the tree node of an element, from the inverse of the map of tree positions to element rows
+        if self._positions is None:
+            positions = empty(len(self._treeelements), dtype=int64)
+            positions[self._treeelements] = arange(len(positions))
+            self._positions = positions
+        return int(self._positions[row])
+
+    def _childpositions(self, position: int) -> ndarray:
+        # the children of all nodes, grouped per parent in a compressed sparse row layout
+        # with the children of the root (parent -1) in the first group
+        if self._children is None:
+            parents = asarray(self._parents, dtype=int64) + 1
+            order = argsort(parents, kind="stable")
+            offsets = zeros(len(parents) + 2, dtype=int64)
+            offsets[1:] = cumsum(bincount(parents, minlength=len(parents) + 1))
+            self._children = order, offsets
+        order, offsets = self._children
+        return order[offsets[position + 1] : offsets[position + 2]]
+
+    def _edgeindices(self, row: int) -> ndarray:
+        # the edges of all elements, grouped per element row in a compressed sparse row layout,
+        # with the edges of every element in storage order
+        if self._edges is None:
+            nodes = asarray(self._data["graph_nodes"], dtype=int64)
+            edges = asarray(self._data["graph_edges"], dtype=int64)
+            sorter = argsort(nodes)
+            rows = sorter[searchsorted(nodes, edges, sorter=sorter)].reshape(-1, 2)
+            loops = rows[:, 0] == rows[:, 1]
+            ends = concatenate([rows[:, 0], rows[~loops, 1]])
+            ids = concatenate([arange(len(rows)), arange(len(rows))[~loops]])
+            order = argsort(ends, kind="stable")
+            offsets = zeros(len(nodes) + 1, dtype=int64)
+            offsets[1:] = cumsum(bincount(ends, minlength=len(nodes)))
+            self._edges = rows, ids[order], offsets
+        rows, ids, offsets = self._edges
+        return sort(ids[offsets[row] : offsets[row + 1]])
+
+    def _subtree(self, position: int) -> list[int]:
+        # in preorder, the descendants of a node directly follow the node
+        positions = [position]
+        included = {position}
+        parents = self._parents
+        for other in range(position + 1, len(parents)):
+            if int(parents[other]) not in included:
+                break
+            positions.append(other)
+            included.add(other)
+        return positions
+
+    # =============================================================================
+    # Tree
+    # =============================================================================
+
+    def children(self, element: Optional[Union[Element, str]] = None) -> list[str]:
+        """The guids of the children of an element in the element tree.
+
+        Parameters
+        ----------
+        element : Element | str, optional
+            The element or its guid.
+            If None, the children of the root of the tree are returned.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        parent = -1 if element is None else self._position(self._row(element))
+        treeelements = self._treeelements
+        return [self._guid(treeelements[position]) for position in self._childpositions(parent).tolist()]
+
+    def descendants(self, element: Union[Element, str]) -> list[str]:
+        """The guids of the descendants of an element in the element tree, in depth-first order.
+
+        Parameters
+        ----------
+        element : Element | str
+            The element or its guid.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        positions = self._subtree(self._position(self._row(element)))
+        treeelements = self._treeelements
+        return [self._guid(treeelements[position]) for position in positions[1:]]
+
+    # =============================================================================
+    # Elements
+    # =============================================================================
+
+    def element(self, guid: str) -> Element:
+        """Decode the element with the given guid.
+
+        Decoded elements are cached by the archive.
+        They are not part of a model.
+
+        Parameters
+        ----------
+        guid : str
+            The guid of the element.
+
+        Returns
+        -------
+        Element
+
+        """
+        row = self._row(guid)
+        element = self._elements.get(row)
+        if element is None:
+            element = self._elements[row] = _decode_element(self._data, self.meta, row)
+        return element
+
+    def elements(self) -> Iterator[Element]:
+        """Iterate over the elements of the archive, decoding them one by one.
+
+        Yields
+        ------
+        Element
+
+        """
+        for row in range(len(self)):
+            element = self._elements.get(row)
+            if element is None:
+                element = self._elements[row] = _decode_element(self._data, self.meta, row)
+            yield element
+
+    def find_element_with_name(self, name: str) -> Optional[str]:
+        """Find the guid of the first element with the given name, without decoding any elements.
+
+        Parameters
+        ----------
+        name : str
+            The name of the element.
+
+        Returns
+        -------
+        str | None
+
+        """
+        names = self._data["element_names"]
+        named = self._data["element_named"]
+        for row in (names == name).nonzero()[0].tolist():
+            if named[row]:
+                return self._guid(row)
+        return None
+
+    # =============================================================================
+    # Interactions
+    # =============================================================================
+
+    def interactions(self, element: Union[Element, str]) -> list[tuple[str, str]]:
+        """The interactions of an element, as pairs of element guids.
+
+        Parameters
+        ----------
+        element : Element | str
+            The element or its guid.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+
+        """
+        indices = self._edgeindices(self._row(element))
+        rows = self._edges[0]  # type: ignore
+        return [(self._guid(u), self._guid(v)) for u, v in rows[indices].tolist()]
+
+    def interaction_attributes(self, a: Union[Element, str], b: Union[Element, str]) -> dict:
+        """Decode the attributes of the interaction between two elements, including their contacts and modifiers.
+
+        Parameters
+        ----------
+        a : Element | str
+            The first element or its guid.
+        b : Element | str
+            The second element or its guid.
+
+        Returns
+        -------
+        dict
+
+        """
+        u = self._row(a)
+        v = self._row(b)
+        indices = self._edgeindices(u)
+        rows = self._edges[0][indices]  # type: ignore
+        indices = indices[((rows[:, 0] == u) & (rows[:, 1] == v)) | ((rows[:, 0] == v) & (rows[:, 1] == u))]
+        if not len(indices):
+            raise KeyError("No interaction between {} and {}".format(a, b))
+        return _decode_edge_attributes(self._data, int(indices[0]))
+
+    # =============================================================================
+    # Models
+    # =============================================================================
+
+    def load(self, root: Optional[Union[Element, str]] = None, cls: Optional[Type["Model"]] = None) -> "Model":
+        """Decode the model, or only the subtree of one of its elements.
+
+        Parameters
+        ----------
+        root : Element | str, optional
+            The root element of the subtree to load.
+            If None, the complete model is loaded.
+        cls : Type[Model], optional
+            The type of model.
+            Defaults to the type stored in the file.
+
+        Returns
+        -------
+        Model
+            A new model.
+            If a subtree is loaded, it contains the root element with all its descendants,
+            the interactions between them, and the materials assigned to them.
+
+        Notes
+        -----
+        Unlike the other methods of the archive, this decodes all elements and interactions of the (sub)model at once.
+        Use [`element`][element] and [`interaction_attributes`][interaction_attributes] to decode them one by one.
+
+        """
+        meta = self.meta
+        data = self._data
+
+        if cls is None:
+            cls = cls_from_dtype(meta["type"])
+
+        model: "Model" = cls()  # type: ignore
+        if meta["name"] is not None:
+            model._name = meta["name"]
+        model._transformation = meta["transformation"]
+
+        parents = self._parents.tolist()
+        if root is None:
+            positions = list(range(len(parents)))
+        else:
+            positions = self._subtree(self._position(self._row(root)))
+
+        # elements
+
+        treeelements = self._treeelements
+        rows = [int(treeelements[position]) for position in positions]
+        elements = {row: _decode_element(data, meta, row) for row in sorted(rows)}
+        model._elements = {str(element.guid): element for element in elements.values()}
+        for element in elements.values():
+            element.model = model
+
+        # materials
+
+        materials = meta["materials"]
+        if root is not None:
+            # like Model.extract, only the materials assigned to the loaded elements
+            assigned = {element._material for element in elements.values() if element._material}
+            materials = {guid: material for guid, material in materials.items() if guid in assigned}
+        model._materials = {guid: material.copy(copy_guid=True) for guid, material in materials.items()}
+
+        # graph
+
+        graphmeta = meta["graph"]
+        graph = InteractionGraph(
+            default_node_attributes=graphmeta["default_node_attributes"],
+            default_edge_attributes=graphmeta["default_edge_attributes"],
+        )
+        graph.attributes.update(graphmeta["attributes"] or {})
+        graph.model = model
+
+        node_attributes = meta["node_attributes"]
+        nodes = data["graph_nodes"].tolist()
+        for row, element in elements.items():
+            attr = {"element": str(element.guid)}
+            attr.update(node_attributes.get(str(row)) or {})
+            graph.add_node(key=nodes[row], attr_dict=attr)
+            element.graphnode = nodes[row]
+
+        edges = data["graph_edges"]
+        if root is not None:
+            selected = array([nodes[row] for row in rows], dtype=int64)
+            indices = (isin(edges[:, 0], selected) & isin(edges[:, 1], selected)).nonzero()[0].tolist()
+        else:
+            indices = list(range(len(edges)))
+        graph.add_edges_from(edges[indices], [_decode_edge_attributes(data, index) for index in indices])
+
+        graph._max_node = graphmeta["max_node"]
+        model._graph = graph
+
+        # tree
+
+        model._tree.attributes.update(meta["tree"]["attributes"] or {})
+        model._tree.root.attributes.update(meta["tree"]["root"]["attributes"] or {})
+
+        tree_attributes = meta["tree_attributes"]
+        names = data["tree_names"]
+        named = data["tree_named"]
+        index = {position: i for i, position in enumerate(positions)}
+        model._tree.add_elements(
+            [elements[row] for row in rows],
+            [index.get(parents[position], -1) for position in positions],
+            names=[str(names[position]) if named[position] else None for position in positions],
+            attributes=[tree_attributes.get(str(position)) for position in positions],
+        )
+
+        return model
+
+
+def model_from_npz(filepath: str, cls: Optional[Type["Model"]] = None, root: Optional[Union[Element, str]] = None) -> "Model":
+    """Read a model from a binary, columnar NPZ file.
+
+    Parameters
+    ----------
+    filepath : str
+        The path of the file.
+    cls : Type[Model], optional
+        The type of model.
+        Defaults to the type stored in the file.
+    root : Element | str, optional
+        Only load the subtree of this element.
+
+    Returns
+    -------
+    Model
+
+    See Also
+    --------
+    - [`ModelArchive`][ModelArchive]
+
+    """
+    with ModelArchive(filepath) as archive:
+        return archive.load(root=root, cls=cls)
@@ -0,0 +1,311 @@
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Type
+from typing import Union
+
+from numpy import asarray
+from numpy import ndarray
+
+from compas.geometry import Box
+from compas_model.elements import Element
+from compas_model.materials import Material
+
+if TYPE_CHECKING:
+    from compas_model.models import Model
+
+
+class ElementQuery:
+    """Composable, lazily evaluated query over the elements of a model.
+
+    Every filter method returns a new query, such that partial queries can be reused.
+    The elements matching all filters are produced when the query is iterated.
+
+    Parameters
+    ----------
+    model : Model
+        The model.
+
+    Notes
+    -----
+    Before the query is evaluated, a source of candidate elements is selected based on the available indexes of the model,
+    in order of selectivity:
+
+    * the name index, if the query has a name filter;
+    * the type index, if the query has a type filter;
+    * the subtree of the tree node, if the query has an ancestry filter;
+    * the AABB array of the model, if the query has a spatial filter;
+    * all elements of the model otherwise.
+
+    The remaining filters are applied to the candidates one by one, and the matching elements are yielded as they are found:
+    in model order, or in depth-first order if the candidates are the descendants of an element.
+
+    Examples
+    --------
+    >>> from compas.geometry import Box
+    >>> from compas_model.elements import BeamElement
+    >>> from compas_model.models import Model
+    >>> model = Model()
+    >>> beam = model.add_element(BeamElement())
+    >>> list(model.query().of_type(BeamElement).within(Box(10))) == [beam]
+    True
+
+    """
+
+    def __init__(self, model: "Model") -> None:
+        self.model = model
+        self._names: list[str] = []
+        self._types: list[tuple[Type[Element], ...]] = []
+        self._materials: list[str] = []
+        self._ancestors: list[Element] = []
+        self._boxes: list[tuple[ndarray, bool]] = []
+        self._predicates: list[Callable[[Element], bool]] = []
+
+    def __iter__(self) -> Iterator[Element]:
+        return self.elements()
+
+    def _extend(self, **clauses: Any) -> "ElementQuery":
+        query = ElementQuery(self.model)
+        query._names = self._names + clauses.get("names", [])
+        query._types = self._types + clauses.get("types", [])
+        query._materials = self._materials + clauses.get("materials", [])
+        query._ancestors = self._ancestors + clauses.get("ancestors", [])
+        query._boxes = self._boxes + clauses.get("boxes", [])
+        query._predicates = self._predicates + clauses.get("predicates", [])
+        return query
+
+    # =============================================================================
+    # Filters
+    # =============================================================================
+
+    def named(self, name: str) -> "ElementQuery":
+        """Only include elements with the given name.
+
+        Parameters
+        ----------
+        name : str
+
+        Returns
+        -------
+        ElementQuery
+
+        """
+        return self._extend(names=[name])
+
+    def of_type(self, *elementtypes: Type[Element]) -> "ElementQuery":
+        """Only include elements of (one of) the given types, or of subclasses of these types.
+
+        Parameters
+        ----------
+        *elementtypes : Type[Element]
+
+        Returns
+        -------
+        ElementQuery
+
+        """
+        return self._extend(types=[elementtypes])
+
+    def with_material(self, material: Union[Material, str]) -> "ElementQuery":
+        """Only include elements with the given material.
+
+        Parameters
+        ----------
+        material : Material | str
+            The material, or its guid.
+
+        Returns
+        -------
+        ElementQuery
+
+        """
+        guid = material if isinstance(material, str) else str(material.guid)
+        return self._extend(materials=[guid])
+
+    def descendants_of(self, element: Element) -> "ElementQuery":
+        """Only include descendants of the given element in the element tree.
+
+        Parameters
+        ----------
+        element : Element
+
+        Returns
+        -------
+        ElementQuery
+
+        """
+        return self._extend(ancestors=[element])
+
+    def within(self, box: Union[Box, Iterable[float]], intersect: bool = False) -> "ElementQuery":
+        """Only include elements of which the AABB is contained in the given box.
+
+        Parameters
+        ----------
+        box : :class:`compas.geometry.Box` | list[float]
+            The box, or its extents ``[xmin, ymin, zmin, xmax, ymax, zmax]``.
+            The AABB of a box that is not axis-aligned is used.
+        intersect : bool, optional
+            If True, include elements of which the AABB intersects the box.
+
+        Returns
+        -------
+        ElementQuery
+
+        Notes
+        -----
+        Groups have no geometry of their own and are never included.
+
+        """
+        if isinstance(box, Box):
+            points = asarray(box.points, dtype=float)
+            extents = asarray([*points.min(axis=0), *points.max(axis=0)])
+        else:
+            extents = asarray(box, dtype=float)
+        return self._extend(boxes=[(extents, intersect)])
+
+    def where(self, predicate: Optional[Callable[[Element], bool]] = None, **attributes: Any) -> "ElementQuery":
+        """Only include elements matching a predicate, and/or with the given attribute values.
+
+        Parameters
+        ----------
+        predicate : Callable[[Element], bool], optional
+            A function returning True for elements that should be included.
+        **attributes : Any
+            Attribute names and values that the elements should have.
+
+        Returns
+        -------
+        ElementQuery
+
+        """
+        predicates = []
+        if predicate is not None:
+            predicates.append(predicate)
+        for name, value in attributes.items():
+            predicates.append(lambda element, name=name, value=value: getattr(element, name, None) == value)
+        return self._extend(predicates=predicates)
+
+    # =============================================================================
+    # Evaluation
+    # =============================================================================
+
+    def plan(self) -> str:
+        """Select the source of candidate elements of the query.
+
+        Returns
+        -------
+        {"name", "type", "tree", "space", "all"}
+
+        """
+        if self._names or self._types:
+            sizes = []
+            index = self.model.index
+            if self._names:
+                sizes.append((min(len(index.named(name)) for name in self._names), "name"))
+            if self._types:
+                sizes.append((min(index.count_of_type(types) for types in self._types), "type"))
+            return min(sizes)[1]
+        if self._ancestors:
+            return "tree"
+        if self._boxes:
+            return "space"
+        return "all"
+
+    def _candidates(self, source: str) -> Iterable[Element]:
+        index = self.model.index
+        if source == "name":
+            return min((index.named(name) for name in self._names), key=len)
+        if source == "type":
+            return min((index.of_type(types) for types in self._types), key=len)  # type: ignore
+        if source == "tree":
+            return self._descendants(self._ancestors[0])
+        if source == "space":
+            arrays = self.model.arrays
+            return [arrays.elements[row] for row in self._spatial_rows().tolist()]
+        return self.model.elements()
+
+    def _descendants(self, element: Element) -> Iterator[Element]:
+        stack = list(reversed(element.treenode.children))
+        while stack:
+            node = stack.pop()
+            yield node.element
+            stack.extend(reversed(node.children))
+
+    def _spatial_rows(self) -> ndarray:
+        aabbs = self.model.arrays.aabbs
+        mask = None
+        for extents, intersect in self._boxes:
+            if intersect:
+                test = (aabbs[:, :3] <= extents[3:]).all(axis=1) & (aabbs[:, 3:] >= extents[:3]).all(axis=1)
+            else:
+                test = (aabbs[:, :3] >= extents[:3]).all(axis=1) & (aabbs[:, 3:] <= extents[3:]).all(axis=1)
+            mask = test if mask is None else mask & test
+        return mask.nonzero()[0]  # type: ignore
+
+    def elements(self) -> Iterator[Element]:
+        """Evaluate the query lazily.
+
+        Yields
+        ------
+        Element
+
+        """
+        source = self.plan()
+        filters: list[Callable[[Element], bool]] = []
+
+        for name in self._names:
+            filters.append(lambda element, name=name: element.name == name)
+
+        for types in self._types:
+            filters.append(lambda element, types=types: isinstance(element, types))
+
+        for guid in self._materials:
+            filters.append(lambda element, guid=guid: element._material == guid)
+
+        ancestors = self._ancestors[1:] if source == "tree" else self._ancestors
+        for ancestor in ancestors:
+            filters.append(lambda element, node=ancestor.treenode: element.treenode is not node and node in element.treenode.ancestors)
+
+        if self._boxes and source != "space":
+            arrays = self.model.arrays
+            rows = set(self._spatial_rows().tolist())
+            filters.append(lambda element: arrays.index.get(str(element.guid)) in rows)
+
+        filters.extend(self._predicates)
+
+        for element in self._candidates(source):
+            if all(test(element) for test in filters):
+                yield element
+
+    def first(self) -> Optional[Element]:
+        """The first element matching the query.
+
+        Returns
+        -------
+        Element | None
+
+        """
+        return next(self.elements(), None)
+
+    def count(self) -> int:
+        """Count the elements matching the query.
+
+        Returns
+        -------
+        int
+
+        """
+        return sum(1 for _ in self.elements())
+
+    def to_list(self) -> list[Element]:
+        """Collect the elements matching the query.
+
+        Returns
+        -------
+        list[Element]
+
+        """
+        return list(self.elements())
@@ -88,3 +88,111 @@ def test_mesh_mesh_contacts(vector, size):
     for contact in contacts:
         assert contact.size > 0
         assert TOL.is_close(contact.size, size)
+
+
+@pytest.mark.parametrize("bestfit", [False, True])
+def test_mesh_mesh_contacts_frame(bestfit):
+    box1 = Box(1, 1, 1).to_mesh()
+    box2 = Box(1, 1, 1).translated([0.5, 0.5, 1]).to_mesh()
+
+    contacts = mesh_mesh_contacts(box1, box2, bestfit=bestfit)
+
+    assert len(contacts) == 1
+    assert TOL.is_close(contacts[0].size, 0.25)
+    assert TOL.is_allclose(contacts[0].frame.point, [0.25, 0.25, 0.5])
+    assert TOL.is_allclose(contacts[0].frame.zaxis, [0, 0, 1])
+
+
+def test_mesh_mesh_contacts_gap():
+    # both faces are within tolerance of the plane halfway between them
+    box1 = Box(1, 1, 1).to_mesh()
+    box2 = Box(1, 1, 1).translated([0.5, 0.5, 1 + 1.5e-3]).to_mesh()
+
+    contacts = mesh_mesh_contacts(box1, box2, tolerance=1e-3)
+    assert len(contacts) == 1
+    assert TOL.is_close(contacts[0].frame.point[2], 0.5 + 0.75e-3)
+
+    box3 = Box(1, 1, 1).translated([0.5, 0.5, 1 + 2.5e-3]).to_mesh()
+    assert mesh_mesh_contacts(box1, box3, tolerance=1e-3) == []
+
+
+class _PlanarFace:
+    # minimal stand-in for a brep face, with an outer loop and optional inner loops
+    def __init__(self, loops, is_plane=True):
+        from compas.geometry import Polygon
+
+        self.polygons = [Polygon(loop) for loop in loops]
+        self.is_plane = is_plane
+        self.area = self.polygons[0].area - sum(polygon.area for polygon in self.polygons[1:])
+
+    def to_polygons(self):
+        return self.polygons
+
+
+class _FaceBrep:
+    def __init__(self, faces):
+        self.faces = faces
+
+
+def _box_faces(box, is_plane=True):
+    mesh = box.to_mesh()
+    return [_PlanarFace([mesh.face_coordinates(face)], is_plane=is_plane) for face in mesh.faces()]
+
+
+def test_brep_face_table():
+    from compas_model.algorithms import BrepFaceTable
+
+    outer = [[0, 0, 0], [0, 4, 0], [4, 4, 0], [4, 0, 0]]
+    inner = [[1, 1, 0], [1, 2, 0], [2, 2, 0], [2, 1, 0]]
+    curved = _PlanarFace([[[0, 0, 1], [1, 0, 1], [1, 1, 1]]], is_plane=False)
+    table = BrepFaceTable(_FaceBrep([_PlanarFace([outer, inner]), curved]))
+
+    # non-planar faces are skipped
+    assert len(table) == 1
+    # the inner loop is stored as a hole, not as part of the boundary
+    assert len(table.boundaries[0]) == 4
+    assert [[list(point) for point in hole] for hole in table.holes[0]] == [[[float(x) for x in point] for point in inner]]
+    assert table.areas.tolist() == [15.0]
+    assert table.normals.tolist() == [[0.0, 0.0, -1.0]]
+    assert table.extents.tolist() == [[0.0, 0.0, 0.0, 4.0, 4.0, 0.0]]
+
+
+def test_brep_face_table_candidates():
+    from compas_model.algorithms import BrepFaceTable
+
+    a = BrepFaceTable(_FaceBrep(_box_faces(Box(1, 1, 1))))
+    b = BrepFaceTable(_FaceBrep(_box_faces(Box(1, 1, 1).translated([0.5, 0.5, 1]))))
+    pairs = a.candidates(b)
+    assert len(pairs) == 1
+    i, j = pairs[0]
+    assert a.normals[i].tolist() == [0.0, 0.0, 1.0]
+    assert b.normals[j].tolist() == [0.0, 0.0, -1.0]
+
+    # gaps up to twice the tolerance
+    c = BrepFaceTable(_FaceBrep(_box_faces(Box(1, 1, 1).translated([0.5, 0.5, 1 + 1.5e-3]))))
+    assert len(a.candidates(c, tolerance=1e-3)) == 1
+    assert a.candidates(c, tolerance=1e-4) == []
+
+    # no overlap of the extents
+    d = BrepFaceTable(_FaceBrep(_box_faces(Box(1, 1, 1).translated([2, 0, 1]))))
+    assert a.candidates(d) == []
+
+    # faces that are too small
+    assert a.candidates(b, minimum_area=2.0) == []
+
+    # non-planar faces are not considered
+    e = BrepFaceTable(_FaceBrep(_box_faces(Box(1, 1, 1).translated([0.5, 0.5, 1]), is_plane=False)))
+    assert a.candidates(e) == []
+
+
+def test_brep_brep_contacts_face_tables():
+    from compas_model.algorithms import BrepFaceTable
+
+    a = _FaceBrep(_box_faces(Box(1, 1, 1)))
+    b = _FaceBrep(_box_faces(Box(1, 1, 1).translated([0.5, 0.5, 1])))
+    contacts = brep_brep_contacts(a, b, a_table=BrepFaceTable(a), b_table=BrepFaceTable(b))
+    assert len(contacts) == 1
+    assert TOL.is_close(contacts[0].size, 0.25)
+
+    with pytest.warns(DeprecationWarning):
+        brep_brep_contacts(a, b, deflection=0.1)
@@ -167,3 +167,79 @@ from compas_model.elements import Element  # noqa: F401
 
 def test_import():
     assert True
+
+
+def test_element_point_without_modelgeometry():
+    from compas.geometry import Translation
+    from compas.tolerance import TOL
+    from compas_model.elements import BeamElement
+    from compas_model.elements import PlateElement
+    from compas_model.models import Model
+
+    model = Model()
+    beam = model.add_element(BeamElement(length=2.0, transformation=Translation.from_vector([1, 2, 3])))
+    plate = model.add_element(PlateElement(thickness=0.2))
+
+    assert TOL.is_allclose(beam.point, [1, 2, 4])
+    assert beam._modelgeometry is None
+    assert TOL.is_allclose(plate.point, [0, 0, -0.1])
+    assert plate._modelgeometry is None
+
+    assert TOL.is_allclose(beam.compute_point(precise=True), beam.point)
+    assert TOL.is_allclose(plate.compute_point(precise=True), plate.point)
+
+
+def test_element_geometry_prototypes():
+    from compas.geometry import Translation
+    from compas_model.elements import BeamElement
+
+    a = BeamElement(width=0.3, depth=0.5, length=4.0)
+    b = BeamElement(width=0.3, depth=0.5, length=4.0, transformation=Translation.from_vector([1, 0, 0]))
+    c = BeamElement(width=0.3, depth=0.5, length=5.0)
+
+    assert a.elementgeometry is b.elementgeometry
+    assert a.elementgeometry is not c.elementgeometry
+
+    b.length = 5.0
+    assert b.elementgeometry is c.elementgeometry
+
+
+def test_element_geometry_prototypes_orientation_and_features():
+    from compas.geometry import Frame
+    from compas_model.elements import BeamElement
+    from compas_model.elements import BeamFeature
+
+    a = BeamElement(width=0.3, depth=0.5, length=4.0)
+    b = BeamElement(width=0.3, depth=0.5, length=4.0)
+    assert a.elementgeometry is b.elementgeometry
+
+    # same dimensions and location, but a different orientation of the box
+    b.box.frame = Frame(a.box.frame.point, [0, 1, 0], [-1, 0, 0])
+    b._elementgeometry = None
+    assert b.compute_prototypekey() != a.compute_prototypekey()
+    assert b.elementgeometry is not a.elementgeometry
+
+    shared = a.elementgeometry
+    a.add_feature(BeamFeature())
+    assert a.compute_prototypekey() is None
+    assert a._elementgeometry is None
+    assert a.elementgeometry is not shared
+
+
+def test_element_modelview():
+    from compas.geometry import Translation
+    from compas.tolerance import TOL
+    from compas_model.elements import PlateElement
+    from compas_model.models import Model
+
+    model = Model()
+    plate = model.add_element(PlateElement(thickness=0.2, transformation=Translation.from_vector([0, 0, 1])))
+
+    assert plate.modelview.geometry is plate.elementgeometry
+    assert plate.modelview.coordinates().shape == (8, 3)
+
+    box = plate.aabb
+    assert plate._modelgeometry is None
+    assert TOL.is_close(box.zmin, 0.8)
+    assert TOL.is_close(box.zmax, 1.0)
+    assert TOL.is_allclose(plate.modelview.to_geometry().aabb().points, box.points)
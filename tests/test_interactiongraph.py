@@ -45,3 +45,123 @@
 #     c_graph = mock_graph.copy()
 
 #     assert c_graph.number_of_nodes() == 3
+
+from compas_model.models import InteractionGraph  # noqa: E402
+
+
+def test_graph_sparse_matrices():
+    graph = InteractionGraph()
+    nodes = [graph.add_node() for _ in range(4)]
+    graph.add_edge(nodes[0], nodes[1], weight=2.0)
+    graph.add_edge(nodes[1], nodes[2], weight=3.0)
+    # edge changes are only tracked once there is a matrix to update
+    assert graph._changes is None
+
+    adjacency = graph.adjacency_matrix()
+    assert adjacency.shape == (4, 4)
+    assert adjacency.nnz == 4
+    assert graph.to_csr() is adjacency
+    assert graph.adjacency_matrix(weight="weight")[2, 1] == 3.0
+
+    incidence = graph.incidence_matrix()
+    assert incidence.shape == (2, 4)
+    assert incidence[graph.edge_index[(nodes[1], nodes[2])]].toarray().tolist() == [[0, -1, 1, 0]]
+
+    graph.add_edge(nodes[3], nodes[0])
+    graph.delete_edge((nodes[0], nodes[1]))
+    assert len(graph._changes) == 2
+    adjacency = graph.adjacency_matrix()
+    assert graph._changes == []
+    assert adjacency.nnz == 4
+    assert adjacency[0, 3] == 1 and adjacency[0, 1] == 0
+    assert graph.incidence_matrix().shape == (2, 4)
+
+    graph.delete_node(nodes[1])
+    assert graph.adjacency_matrix().shape == (3, 3)
+    assert graph.index_node == [nodes[0], nodes[2], nodes[3]]
+
+
+def test_graph_find_edge():
+    graph = InteractionGraph()
+    nodes = [graph.add_node() for _ in range(3)]
+    graph.add_edge(nodes[1], nodes[0])
+    graph.add_edge(nodes[1], nodes[2])
+
+    assert graph.find_edge(nodes[0], nodes[1]) == (nodes[1], nodes[0])
+    assert graph.find_edge(nodes[1], nodes[0]) == (nodes[1], nodes[0])
+    assert graph.find_edge(nodes[0], nodes[2]) is None
+
+    graph.add_edge(nodes[0], nodes[1])
+    graph.delete_edge((nodes[1], nodes[0]))
+    assert graph.find_edge(nodes[1], nodes[0]) == (nodes[0], nodes[1])
+
+    graph.delete_node(nodes[2])
+    assert graph.find_edge(nodes[1], nodes[2]) is None
+
+    graph.clear_edges()
+    assert graph.find_edge(nodes[0], nodes[1]) is None
+
+
+def test_graph_bulk_edges():
+    from numpy import array
+
+    graph = InteractionGraph()
+    nodes = [graph.add_node() for _ in range(4)]
+    edges = graph.add_edges_from(array([[0, 1], [1, 2], [3, 2]]), attributes=[{"contacts": [1]}, None, {"modifiers": [2]}])
+
+    assert edges == [(0, 1), (1, 2), (3, 2)]
+    assert graph.number_of_edges() == 3
+    assert graph.edge_attribute((0, 1), "contacts") == [1]
+    assert graph.edge_attribute((3, 2), "modifiers") == [2]
+    assert sorted(graph.neighbors(2)) == [1, 3]
+    assert graph.find_edge(2, 3) == (3, 2)
+    assert graph.adjacency_matrix().nnz == 6
+
+    graph.clear_edges()
+    assert graph.number_of_edges() == 0
+    assert graph.number_of_nodes() == 4
+    assert list(graph.neighbors(nodes[1])) == []
+    assert graph.adjacency_matrix().nnz == 0
+
+
+def test_graph_connected_components():
+    graph = InteractionGraph()
+    nodes = [graph.add_node() for _ in range(5)]
+    graph.add_edge(nodes[0], nodes[1], contacts=[1])
+    graph.add_edge(nodes[2], nodes[1])
+    graph.add_edge(nodes[3], nodes[4])
+
+    assert graph.connected_components() == [[0, 1, 2], [3, 4]]
+    assert graph.connected_components("contacts") == [[0, 1], [2], [3], [4]]
+    assert graph.number_of_components("contacts") == 4
+
+    # incremental updates
+    node = graph.add_node()
+    graph.add_edges_from([(nodes[4], node)], [{"contacts": [2]}])
+    graph.edge_attribute((nodes[2], nodes[1]), "contacts", [3])
+    assert graph.in_same_component(nodes[0], nodes[2], "contacts")
+    assert graph.connected_components("contacts") == [[0, 1, 2], [3], [4, 5]]
+    assert graph.number_of_components() == 2
+
+    # removals
+    graph.delete_edge((nodes[2], nodes[1]))
+    assert graph.connected_components() == [[0, 1], [2], [3, 4, 5]]
+    graph.edge_attribute((nodes[0], nodes[1]), "contacts", [])
+    assert graph.connected_components("contacts") == [[0], [1], [2], [3], [4, 5]]
+
+
+def test_graph_connected_components_edge_attributes():
+    graph = InteractionGraph()
+    nodes = [graph.add_node() for _ in range(3)]
+    graph.add_edge(nodes[0], nodes[1])
+    graph.add_edge(nodes[1], nodes[2], contacts=[1])
+    assert graph.connected_components("contacts") == [[0], [1, 2]]
+
+    version = graph.version
+    graph.edge_attributes((nodes[0], nodes[1]), names=["contacts", "name"], values=[[2], "joint"])
+    assert graph.version[2] > version[2]
+    assert graph.connected_components("contacts") == [[0, 1, 2]]
+    assert graph.edge_attributes((nodes[0], nodes[1]), names=["contacts", "name"]) == [[2], "joint"]
+
+    graph.edge_attributes((nodes[1], nodes[2]), names=["contacts"], values=[[]])
+    assert graph.connected_components("contacts") == [[0, 1], [2]]
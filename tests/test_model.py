@@ -50,3 +50,789 @@ from compas_model.models import Model  # noqa: F401
 
 def test_import():
     assert True
+
+
+def test_model_arrays():
+    from compas.geometry import Translation
+    from compas_model.elements import ColumnElement
+
+    model = Model()
+    group = model.add_group("columns")
+    columns = [model.add_element(ColumnElement(transformation=Translation.from_vector([2 * i, 0, 0])), parent=group) for i in range(3)]
+
+    arrays = model.arrays
+    assert arrays.aabbs.shape == (3, 6)
+    assert arrays.points.shape == (3, 3)
+    assert arrays.transformations.shape == (3, 4, 4)
+    assert arrays.row(columns[1]) == 1
+    assert arrays.points[2].tolist() == [4.0, 0.0, 1.5]
+
+    columns[0].transformation = Translation.from_vector([10, 0, 0])
+    assert model._arrays.is_dirty
+    assert model.arrays.points[0].tolist() == [10.0, 0.0, 1.5]
+    assert not model.arrays.is_dirty
+
+
+def test_model_arrays_ancestor_transformation():
+    from compas.geometry import Translation
+    from compas_model.elements import ColumnElement
+
+    model = Model()
+    group = model.add_group("columns")
+    column = model.add_element(ColumnElement(), parent=group)
+    assert model.arrays.points[0].tolist() == [0.0, 0.0, 1.5]
+
+    group.transformation = Translation.from_vector([1, 0, 0])
+    assert model._arrays.is_dirty
+    assert model.arrays.points[0].tolist() == [1.0, 0.0, 1.5]
+    assert list(column.point) == [1.0, 0.0, 1.5]
+
+    model.transformation = Translation.from_vector([0, 2, 0])
+    assert model._arrays.is_dirty
+    assert model.arrays.points[0].tolist() == [1.0, 2.0, 1.5]
+    assert model.arrays.transformations[0][:3, 3].tolist() == [1.0, 2.0, 0.0]
+
+
+def test_model_bvh_after_move():
+    from compas.geometry import Translation
+    from compas_model.elements import BeamElement
+
+    model = Model()
+    a = model.add_element(BeamElement(width=1, depth=1, length=1))
+    b = model.add_element(BeamElement(width=1, depth=1, length=1, transformation=Translation.from_vector([10, 0, 0])))
+    bvh = model.bvh
+    assert model.bvh is bvh
+    assert bvh.nearest_neighbors(a) == []
+
+    b.transformation = Translation.from_vector([0, 0, 1])
+    assert model.bvh is not bvh
+    assert model.bvh.nearest_neighbors(a) == [b]
+    assert model.bvh.nearest_neighbors(b) == [a]
+
+
+def test_model_cache_evict():
+    from compas_model.elements import BeamElement
+
+    model = Model()
+    beams = [model.add_element(BeamElement()) for _ in range(3)]
+
+    for beam in beams:
+        beam.aabb
+        beam.modelgeometry
+
+    assert model.cache.count("aabb") == 3
+    assert model.cache.count("modelgeometry") == 3
+    assert "_aabb" not in vars(beams[0])
+
+    model.cache.evict("modelgeometry")
+    assert model.cache.count("modelgeometry") == 0
+    assert model.cache.count("aabb") == 3
+    assert beams[0]._modelgeometry is None
+    assert beams[0].modelgeometry is not None
+
+    model.remove_element(beams[0])
+    assert model.cache.count("aabb") == 2
+
+
+def test_model_cache_budget():
+    from compas_model.elements import BeamElement
+
+    model = Model()
+    beams = [model.add_element(BeamElement()) for _ in range(4)]
+
+    for beam in beams:
+        beam.modelgeometry
+    size = model.cache.stats()["modelgeometry"]["size"]
+    assert model.cache.count("modelgeometry") == 4
+
+    model.cache.budget = size // 2 + model.cache.size - size
+    assert model.cache.count("modelgeometry") == 2
+    assert beams[0]._modelgeometry is None
+    assert beams[3]._modelgeometry is not None
+
+    stats = model.cache.stats()["modelgeometry"]
+    assert stats["evictions"] == 2
+    assert stats["entries"] == 2
+
+    assert beams[0].modelgeometry is not None
+    assert model.cache.size <= model.cache.budget
+
+
+def test_model_cache_hit_path():
+    from compas_model.elements import BeamElement
+
+    model = Model()
+    beams = [model.add_element(BeamElement()) for _ in range(3)]
+    boxes = [beam.aabb for beam in beams]
+
+    # without a budget, reads are plain lookups in the side table
+    assert [beam.aabb for beam in reversed(beams)] == boxes[::-1]
+    table = model.cache._tables["aabb"]
+    assert list(table.values) == beams
+    assert not table.counts
+    assert table.heap is None
+    assert model.cache.stats()["aabb"]["hits"] == 3
+
+    # the computed values are not stored on the elements themselves
+    assert not any(name.endswith("aabb") for name in vars(beams[0]))
+
+
+def test_model_cache_budget_lfu():
+    from compas_model.elements import BeamElement
+
+    model = Model()
+    model.cache.policies["modelgeometry"] = "lfu"
+    # the use of cached values is only tracked while the cache has a budget
+    model.cache.budget = 10**9
+    beams = [model.add_element(BeamElement()) for _ in range(4)]
+
+    for beam in beams:
+        beam.modelgeometry
+    for _ in range(3):
+        beams[0].modelgeometry
+        beams[2].modelgeometry
+    beams[1].modelgeometry
+    size = model.cache.stats()["modelgeometry"]["size"]
+
+    # evict the least frequently used value, then the next one after another access
+    model.cache.budget = 3 * size // 4 + model.cache.size - size
+    assert [beam._modelgeometry is not None for beam in beams] == [True, True, True, False]
+
+    beams[3].modelgeometry
+    assert [beam._modelgeometry is not None for beam in beams] == [True, False, True, True]
+    assert model.cache.stats()["modelgeometry"]["evictions"] == 2
+
+
+def test_model_npz(tmp_path):
+    from compas.geometry import Translation
+    from compas_model.elements import BeamElement
+    from compas_model.elements import ColumnElement
+    from compas_model.interactions import Contact
+
+    model = Model()
+    group = model.add_group("frame")
+    a = model.add_element(ColumnElement(height=2.5, name="a"), parent=group)
+    b = model.add_element(BeamElement(length=4, transformation=Translation.from_vector([0, 0, 2.5])), parent=group)
+    c = model.add_element(ColumnElement(), parent=a)
+    model.add_interaction(a, b)
+    model.add_interaction(b, c)
+    model.graph.edge_attribute((a.graphnode, b.graphnode), "contacts", [Contact([[0, 0, 0], [1, 0, 0], [1, 1, 0]], size=0.5)])
+
+    filepath = str(tmp_path / "model.npz")
+    model.to_npz(filepath)
+    other = Model.from_npz(filepath)
+
+    assert [str(element.guid) for element in other.elements()] == [str(element.guid) for element in model.elements()]
+    assert [node.element.name for node in other.tree.nodes if not node.is_root] == [node.element.name for node in model.tree.nodes if not node.is_root]
+    assert other.tree.root.children[0].children[0].children[0].element.guid == c.guid
+
+    a2 = other.find_element_with_name("a")
+    b2 = other._elements[str(b.guid)]
+    assert a2.height == 2.5
+    assert b2.length == 4
+    assert b2.transformation == b.transformation
+    assert other.has_interaction(a2, b2)
+
+    contacts = list(other.contacts())
+    assert len(contacts) == 1
+    assert contacts[0].size == 0.5
+    assert contacts[0].points[1] == [1, 0, 0]
+
+
+def test_model_archive(tmp_path):
+    from numpy import memmap
+
+    from compas_model.elements import BeamElement
+    from compas_model.elements import ColumnElement
+    from compas_model.models import ModelArchive
+
+    model = Model()
+    storeys = [model.add_group("storey {}".format(i)) for i in range(2)]
+    columns = [model.add_element(ColumnElement(), parent=storey) for storey in storeys for _ in range(2)]
+    beams = [model.add_element(BeamElement(), parent=storey) for storey in storeys]
+    for column, beam in zip(columns, [beams[0], beams[0], beams[1], beams[1]]):
+        model.add_interaction(column, beam)
+    model.add_interaction(beams[0], columns[2])
+
+    filepath = str(tmp_path / "model.npz")
+    model.to_npz(filepath)
+
+    with ModelArchive(filepath) as archive:
+        assert len(archive) == 8
+        assert not archive._elements
+        assert archive._guids is None and archive._rows is None
+        assert isinstance(archive._data["element_guids"], memmap)
+        assert archive.children() == [str(storey.guid) for storey in storeys]
+
+        guid = archive.find_element_with_name("storey 1")
+        assert guid == str(storeys[1].guid)
+        assert archive.children(guid) == [str(columns[2].guid), str(columns[3].guid), str(beams[1].guid)]
+        assert len(archive.interactions(beams[0])) == 3
+        assert archive.interactions(columns[0]) == [(str(columns[0].guid), str(beams[0].guid))]
+        assert archive.interaction_attributes(beams[0], columns[0]) == {}
+        assert not archive._elements
+
+        assert archive.element(str(beams[1].guid)).length == beams[1].length
+        assert len(archive._elements) == 1
+
+        part = archive.load(root=guid)
+
+    assert len(list(part.elements())) == 4
+    assert part.graph.number_of_edges() == 2
+    assert part.tree.root.children[0].element.name == "storey 1"
+
+    model.to_npz(filepath, compress=True)
+    with ModelArchive(filepath) as archive:
+        assert not isinstance(archive._data["element_guids"], memmap)
+        assert archive.descendants(storeys[0]) == [str(columns[0].guid), str(columns[1].guid), str(beams[0].guid)]
+
+
+def test_model_extract():
+    from compas_model.elements import BeamElement
+    from compas_model.elements import ColumnElement
+    from compas_model.interactions import Contact
+    from compas_model.materials import Material
+
+    model = Model()
+    steel = Material(name="steel")
+    concrete = Material(name="concrete")
+    model.add_material(steel)
+    model.add_material(concrete)
+
+    storeys = [model.add_group("storey {}".format(i)) for i in range(2)]
+    a = model.add_element(ColumnElement(), parent=storeys[0], material=concrete)
+    b = model.add_element(BeamElement(), parent=storeys[0], material=steel)
+    c = model.add_element(ColumnElement(), parent=storeys[1], material=concrete)
+    model.add_interaction(a, b)
+    model.add_interaction(b, c)
+    model.graph.edge_attribute((a.graphnode, b.graphnode), "contacts", [Contact([[0, 0, 0], [1, 0, 0], [1, 1, 0]])])
+
+    part = model.extract(root=storeys[0])
+
+    assert [str(element.guid) for element in part.elements()] == [str(storeys[0].guid), str(a.guid), str(b.guid)]
+    assert part.tree.root.children[0].element.name == "storey 0"
+    assert len(part.tree.root.children[0].children) == 2
+    assert part.graph.number_of_edges() == 1
+    assert len(list(part.contacts())) == 1
+    assert list(part.contacts())[0] is not list(model.contacts())[0]
+    assert len(part._materials) == 2
+
+    part = model.extract(elements=[b, c])
+    assert [node.element.guid for node in part.tree.root.children] == [b.guid, c.guid]
+    assert part.graph.number_of_edges() == 1
+    assert list(part._materials) == [str(steel.guid), str(concrete.guid)]
+    assert b.model is model
+
+
+def test_model_extract_and_load_materials(tmp_path):
+    from compas_model.elements import BeamElement
+    from compas_model.elements import ColumnElement
+    from compas_model.materials import Material
+    from compas_model.models import ModelArchive
+
+    model = Model()
+    steel = Material(name="steel")
+    concrete = Material(name="concrete")
+    timber = Material(name="timber")
+    for material in (steel, concrete, timber):
+        model.add_material(material)
+
+    storeys = [model.add_group("storey {}".format(i)) for i in range(2)]
+    model.add_element(ColumnElement(), parent=storeys[0], material=concrete)
+    model.add_element(BeamElement(), parent=storeys[1], material=steel)
+    model.add_element(ColumnElement(), parent=storeys[1], material=timber)
+
+    filepath = str(tmp_path / "model.npz")
+    model.to_npz(filepath)
+
+    extracted = model.extract(root=storeys[0])
+    with ModelArchive(filepath) as archive:
+        loaded = archive.load(root=str(storeys[0].guid))
+        full = archive.load()
+
+    # both ways of taking out a subtree only keep the materials of its elements
+    assert list(extracted._materials) == [str(concrete.guid)]
+    assert list(loaded._materials) == list(extracted._materials)
+    assert loaded._materials[str(concrete.guid)].name == "concrete"
+    assert list(full._materials) == [str(steel.guid), str(concrete.guid), str(timber.guid)]
+    assert loaded._materials[str(concrete.guid)] is not full._materials[str(concrete.guid)]
+    assert sorted(element.material.name for element in full.elements() if element._material) == ["concrete", "steel", "timber"]
+
+
+def test_model_serialization_treelayout():
+    from compas.data import json_dumps
+    from compas.data import json_loads
+    from compas_model.elements import BeamElement
+
+    model = Model()
+    group = model.add_group("group")
+    beams = [model.add_element(BeamElement(), parent=group) for _ in range(2)]
+    model.add_element(BeamElement(), parent=beams[0])
+
+    for treelayout in ("nested", "parents"):
+        model.treelayout = treelayout
+        other = json_loads(json_dumps(model))
+        assert other.treelayout == treelayout
+        assert [node.element.guid for node in other.tree.nodes if not node.is_root] == [node.element.guid for node in model.tree.nodes if not node.is_root]
+        assert other.tree.root.children[0].children[0].children[0].element.treenode.parent.element.guid == beams[0].guid
+
+
+def test_model_serialization_deep_tree():
+    from compas.data import json_dumps
+    from compas.data import json_loads
+    from compas_model.elements import BeamElement
+
+    model = Model()
+    model.treelayout = "parents"
+    parent = None
+    for _ in range(2000):
+        parent = model.add_element(BeamElement(), parent=parent)
+
+    other = json_loads(json_dumps(model))
+    node = other.tree.root
+    depth = 0
+    while node.children:
+        node = node.children[0]
+        depth += 1
+    assert depth == 2000
+
+
+def test_model_diff_patch():
+    from compas.data import json_dumps
+    from compas.data import json_loads
+    from compas.geometry import Translation
+    from compas_model.elements import BeamElement
+    from compas_model.elements import ColumnElement
+    from compas_model.interactions import Contact
+
+    model = Model()
+    groups = [model.add_group("group {}".format(i)) for i in range(2)]
+    a = model.add_element(ColumnElement(), parent=groups[0])
+    b = model.add_element(BeamElement(), parent=groups[0])
+    c = model.add_element(ColumnElement(), parent=groups[1])
+    model.add_interaction(a, b)
+    model.add_interaction(b, c)
+
+    other = json_loads(json_dumps(model))
+    assert model.diff(other) == {}
+
+    a2 = other._elements[str(a.guid)]
+    b2 = other._elements[str(b.guid)]
+    c2 = other._elements[str(c.guid)]
+    d2 = other.add_element(BeamElement(), parent=other._elements[str(groups[1].guid)])
+    a2.transformation = Translation.from_vector([1, 0, 0])
+    b2.length = 5
+    other.tree.remove(c2.treenode)
+    other.tree.add_element(c2, parent=other._elements[str(groups[0].guid)])
+    other.remove_interaction(b2, c2)
+    other.add_interaction(c2, d2)
+    other.graph.edge_attribute((a2.graphnode, b2.graphnode), "contacts", [Contact([[0, 0, 0], [1, 0, 0], [1, 1, 0]])])
+
+    patch = model.diff(other)
+    assert [element.guid for element, _ in patch["added"]] == [d2.guid]
+    assert set(patch["changed"]) == {str(a.guid), str(b.guid)}
+    assert patch["moved"] == {str(c.guid): str(groups[0].guid)}
+    assert len(patch["interactions_added"]) == 1
+    assert len(patch["interactions_changed"]) == 1
+    assert len(patch["interactions_removed"]) == 1
+
+    model.apply_patch(json_loads(json_dumps(patch)))
+    assert model.diff(other) == {}
+    assert model._elements[str(a.guid)] is a
+    assert model._elements[str(b.guid)].length == 5
+    assert model._elements[str(b.guid)].treenode.parent is groups[0].treenode
+    assert len(list(model.contacts())) == 1
+
+    other.remove_element(d2)
+    model.apply_patch(model.diff(other))
+    assert str(d2.guid) not in model._elements
+    assert model.graph.number_of_edges() == 1
+
+
+def test_model_diff_patch_directed_interactions():
+    from compas.data import json_dumps
+    from compas.data import json_loads
+    from compas_model.elements import BeamElement
+    from compas_model.modifiers import Modifier
+
+    model = Model()
+    a = model.add_element(BeamElement())
+    b = model.add_element(BeamElement())
+    model.add_interaction(b, a)
+
+    other = json_loads(json_dumps(model))
+    other.add_modifier(other._elements[str(a.guid)], other._elements[str(b.guid)], Modifier())
+
+    patch = model.diff(other)
+    assert [[x, y] for x, y, _ in patch["interactions_added"]] == [[str(a.guid), str(b.guid)]]
+    assert "interactions_changed" not in patch
+
+    model.apply_patch(json_loads(json_dumps(patch)))
+    assert model.diff(other) == {}
+    assert model.graph.has_edge((b.graphnode, a.graphnode))
+    assert len(model.graph.edge_attribute((a.graphnode, b.graphnode), "modifiers")) == 1
+    assert model.graph.edge_attribute((b.graphnode, a.graphnode), "modifiers") is None
+
+    other.graph.delete_edge((b.graphnode, a.graphnode))
+    model.apply_patch(model.diff(other))
+    assert list(model.graph.edges()) == [(a.graphnode, b.graphnode)]
+
+
+def test_model_add_elements():
+    import pytest
+    from compas_model.elements import BeamElement
+
+    model = Model()
+    group = model.add_group("group")
+    beams = model.add_elements([BeamElement() for _ in range(3)], parent=group)
+
+    assert [node.element for node in group.treenode.children] == beams
+    assert [beam.graphnode for beam in beams] == [1, 2, 3]
+    assert all(beam.model is model for beam in beams)
+    assert model.graph.number_of_nodes() == 4
+
+    batch = [BeamElement(), BeamElement(), beams[0]]
+    with pytest.raises(Exception):
+        model.add_elements(batch)
+
+    assert len(list(model.elements())) == 4
+    assert model.graph.number_of_nodes() == 4
+    assert len(model.tree.root.children) == 1
+    assert batch[0].model is None
+    assert batch[0].graphnode is None
+    assert model.add_element(BeamElement()).graphnode == 4
+
+
+def test_model_index():
+    from compas_model.elements import BeamElement
+    from compas_model.elements import ColumnElement
+    from compas_model.elements import Element
+
+    model = Model()
+    a = model.add_element(BeamElement(name="a"))
+    b = model.add_element(ColumnElement(name="b"))
+    c = model.add_element(BeamElement(name="a"))
+
+    assert model.find_element_with_name("a") is a
+    assert model.find_all_elements_with_name("a") == [a, c]
+    assert model.find_all_elements_of_type(BeamElement) == [a, c]
+    assert model.find_all_elements_of_type(Element) == [a, b, c]
+
+    a.name = "x"
+    assert model.find_element_with_name("a") is c
+    assert model.find_element_with_name("x") is a
+    c.name = "x"
+    assert model.find_all_elements_with_name("x") == [a, c]
+
+    d = model.add_element(ColumnElement())
+    assert model.has_element_with_name("ColumnElement")
+    assert model.find_all_elements_of_type(ColumnElement) == [b, d]
+
+    model.remove_element(b)
+    assert not model.has_element_with_name("b")
+    assert model.find_all_elements_of_type(Element) == [a, c, d]
+
+
+def test_model_query():
+    from compas.geometry import Box
+    from compas.geometry import Translation
+    from compas_model.elements import BeamElement
+    from compas_model.elements import ColumnElement
+    from compas_model.materials import Material
+
+    model = Model()
+    steel = Material(name="steel")
+    model.add_material(steel)
+    storeys = [model.add_group("storey {}".format(i)) for i in range(2)]
+    columns = [model.add_element(ColumnElement(transformation=Translation.from_vector([0, 0, 3 * i])), parent=storeys[i]) for i in range(2)]
+    beams = [model.add_element(BeamElement(transformation=Translation.from_vector([0, 0, 3 * i])), parent=storeys[i], material=steel) for i in range(2)]
+
+    query = model.query().of_type(BeamElement)
+    assert query.plan() == "type"
+    assert query.to_list() == beams
+    assert query.with_material(steel).descendants_of(storeys[1]).to_list() == [beams[1]]
+    assert model.query().descendants_of(storeys[0]).plan() == "tree"
+    assert model.query().descendants_of(storeys[0]).to_list() == [columns[0], beams[0]]
+    assert model.query().named("storey 1").plan() == "name"
+    assert model.query().named("storey 1").first() is storeys[1]
+    assert model.query().where(lambda element: element.treenode.parent is storeys[0].treenode).count() == 2
+
+    box = Box.from_corner_corner_height([-1, -1, -1], [1, 1, -1], 4.2)
+    assert model.query().within(box).plan() == "space"
+    assert model.query().within(box).to_list() == [columns[0], beams[0]]
+    assert model.query().of_type(BeamElement).within([-1, -1, 4, 1, 1, 5], intersect=True).to_list() == beams[1:]
+    assert model.query().within([-1, -1, 4, 1, 1, 5]).count() == 0
+
+
+def test_model_remove_elements():
+    from compas_model.elements import BeamElement
+    from compas_model.elements import ColumnElement
+
+    model = Model()
+    groups = [model.add_group("group {}".format(i)) for i in range(2)]
+    columns = [model.add_element(ColumnElement(), parent=group) for group in groups for _ in range(2)]
+    beams = [model.add_element(BeamElement(), parent=group) for group in groups]
+    for column in columns:
+        model.add_interaction(column, beams[0])
+    model.add_interaction(beams[0], beams[1])
+
+    removed = model.remove_elements([groups[1], columns[0]])
+    assert set(removed) == {groups[1], columns[2], columns[3], beams[1], columns[0]}
+    assert list(model.elements()) == [groups[0], columns[1], beams[0]]
+    assert [node.element for node in model.tree.root.children] == [groups[0]]
+    assert [node.element for node in groups[0].treenode.children] == [columns[1], beams[0]]
+    assert model.graph.number_of_nodes() == 3
+    assert model.graph.number_of_edges() == 1
+    assert model.has_interaction(columns[1], beams[0])
+    assert all(element.model is None for element in removed)
+    assert model.find_all_elements_of_type(ColumnElement) == [columns[1]]
+
+    model.remove_elements_of_type(BeamElement)
+    assert model.graph.number_of_edges() == 0
+    assert list(model.elements()) == [groups[0], columns[1]]
+
+
+def test_model_interaction_matrices():
+    from compas_model.elements import BeamElement
+
+    model = Model()
+    beams = model.add_elements([BeamElement() for _ in range(3)])
+    model.add_interaction(beams[0], beams[1])
+    model.add_interaction(beams[2], beams[1])
+
+    assert model.interaction_elements() == beams
+    adjacency = model.graph.adjacency_matrix()
+    assert adjacency.toarray().tolist() == [[0, 1, 0], [1, 0, 1], [0, 1, 0]]
+
+
+def test_model_contact_table():
+    from compas_model.elements import BeamElement
+    from compas_model.interactions import Contact
+
+    model = Model()
+    beams = model.add_elements([BeamElement() for _ in range(3)])
+    a = model.add_interaction(beams[0], beams[1])
+    b = model.add_interaction(beams[1], beams[2])
+    model.graph.edge_attribute(a, "contacts", [Contact([[0, 0, 0], [2, 0, 0], [2, 1, 0], [0, 1, 0]]), Contact([[0, 0, 1], [1, 0, 1], [0, 1, 1]])])
+
+    table = model.contact_table
+    assert len(table) == 2
+    assert table.offsets.tolist() == [0, 4, 7]
+    assert table.areas.round(6).tolist() == [2.0, 0.5]
+    assert table.edge_ids.tolist() == [0, 0]
+    assert model.contact_table is table
+    assert [round(view.size, 6) for view in table.edge_contacts((a[1], a[0]))] == [2.0, 0.5]
+    assert table[1].points.shape == (3, 3)
+    assert table[0].to_contact().size == 2.0
+
+    model.graph.edge_attribute(b, "contacts", [Contact([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])])
+    assert model.contact_table is not table
+    assert len(model.contact_table) == 3
+    assert model.contact_table[2].edge == b
+
+
+def test_model_partition():
+    from compas_model.elements import BeamElement
+
+    model = Model()
+    beams = model.add_elements([BeamElement() for _ in range(8)])
+    for i in range(3):
+        model.add_interaction(beams[i], beams[i + 1])
+        model.add_interaction(beams[i + 4], beams[i + 5])
+    model.add_interaction(beams[3], beams[4])
+
+    parts, cut = model.partition(2)
+    assert sorted(sorted(beams.index(beam) for beam in part) for part in parts) == [[0, 1, 2, 3], [4, 5, 6, 7]]
+    assert cut == [(beams[3], beams[4])]
+
+    parts, cut = model.partition(3, weight=lambda element: 3.0 if element is beams[0] else 1.0)
+    assert len(parts) == 3
+    assert sorted(beams.index(beam) for part in parts for beam in part) == list(range(8))
+
+    parts, _ = model.partition(10)
+    assert len(parts) == 10
+    assert sum(len(part) for part in parts) == 8
+
+
+def test_model_connected_components():
+    from compas_model.elements import BeamElement
+
+    model = Model()
+    beams = model.add_elements([BeamElement() for _ in range(4)])
+    model.add_interaction(beams[0], beams[1])
+    edge = model.add_interaction(beams[1], beams[2])
+    model.graph.edge_attribute(edge, "contacts", [None])
+
+    assert model.connected_components() == [beams[:3], [beams[3]]]
+    assert model.connected_components(contacts=True) == [[beams[0]], beams[1:3], [beams[3]]]
+
+
+def test_model_interface_mesh():
+    from compas.geometry import Polygon
+    from compas_model.elements import BeamElement
+    from compas_model.interactions import Contact
+
+    model = Model()
+    beams = model.add_elements([BeamElement() for _ in range(3)])
+    a = model.add_interaction(beams[0], beams[1])
+    b = model.add_interaction(beams[1], beams[2])
+    hole = Polygon([[1, 1, 0], [2, 1, 0], [2, 2, 0], [1, 2, 0]])
+    model.graph.edge_attribute(a, "contacts", [Contact([[0, 0, 0], [4, 0, 0], [4, 4, 0], [0, 4, 0]], holes=[hole])])
+    model.graph.edge_attribute(b, "contacts", [Contact([[0, 0, 1], [1, 0, 1], [0, 1, 1]])])
+
+    interfaces = model.compute_interface_mesh()
+    assert len(interfaces) == 2
+    assert interfaces.edges.tolist() == [list(a), list(b)]
+    areas = interfaces.areas()
+    assert round(float(areas[: interfaces.face_offsets[1]].sum()), 6) == 15.0
+    assert len(interfaces.contact_faces(1)) == 1
+    assert interfaces.contact_faces(1).min() == interfaces.vertex_offsets[1]
+
+    refined = model.compute_interface_mesh(target_size=0.5)
+    assert len(refined.faces) > len(interfaces.faces)
+    assert round(float(refined.areas().sum()), 6) == 15.5
+    assert refined.to_mesh().number_of_faces() == len(refined.faces)
+
+    # only long edges are split, such that the number of triangles scales with the area
+    vertices, faces = refined.vertices, refined.faces
+    lengths = ((vertices[faces] - vertices[faces[:, [1, 2, 0]]]) ** 2).sum(axis=2) ** 0.5
+    assert lengths.max() <= 0.5 + 1e-9
+    assert len(refined.contact_faces(0)) == 392
+    assert len(refined.contact_faces(1)) == 16
+
+
+def test_model_track_contacts():
+    from compas.geometry import Translation
+    from compas_model.elements import BeamElement
+
+    model = Model()
+    a = model.add_element(BeamElement(width=1, depth=1, length=1))
+    b = model.add_element(BeamElement(width=1, depth=1, length=1, transformation=Translation.from_vector([0, 0, 1])))
+
+    assert model.track_contacts() == {"reused": 0, "recomputed": 1, "separated": 0}
+    edge = model.graph.find_edge(a.graphnode, b.graphnode)
+    assert [contact.size for contact in model.graph.edge_attribute(edge, "contacts")] == [1.0]
+    assert model.track_contacts() == {"reused": 1, "recomputed": 0, "separated": 0}
+
+    # rigid motion of the pair
+    a.transformation = Translation.from_vector([5, 0, 0])
+    b.transformation = Translation.from_vector([5, 0, 1])
+    assert model.track_contacts() == {"reused": 1, "recomputed": 0, "separated": 0}
+    contact = model.graph.edge_attribute(edge, "contacts")[0]
+    assert sorted(point[0] for point in contact.points) == [4.5, 4.5, 5.5, 5.5]
+    assert model.contact_table.origins[0].tolist() == [5.0, 0.0, 1.0]
+
+    # relative motion
+    b.transformation = Translation.from_vector([5.3, 0, 1])
+    assert model.track_contacts() == {"reused": 0, "recomputed": 1, "separated": 0}
+    assert round(model.graph.edge_attribute(edge, "contacts")[0].size, 6) == 0.7
+
+    # elements that move apart are no longer neighbours in the rebuilt BVH
+    b.transformation = Translation.from_vector([20, 0, 1])
+    assert model.track_contacts() == {"reused": 0, "recomputed": 0, "separated": 1}
+    assert model.graph.edge_attribute(edge, "contacts") == []
+    assert model._contactposes == {}
+
+
+def test_model_track_contacts_groups():
+    from compas.geometry import Translation
+    from compas_model.elements import BeamElement
+
+    model = Model()
+    group = model.add_group("group")
+    a = model.add_element(BeamElement(width=1, depth=1, length=1), parent=group)
+    b = model.add_element(BeamElement(width=1, depth=1, length=1, transformation=Translation.from_vector([0, 0, 1])), parent=group)
+
+    assert model.track_contacts() == {"reused": 0, "recomputed": 1, "separated": 0}
+    assert len(list(model.contacts())) == 1
+
+    b.transformation = Translation.from_vector([0, 0, 5])
+    assert model.track_contacts() == {"reused": 0, "recomputed": 0, "separated": 1}
+    assert model.graph.edge_attribute(model.graph.find_edge(a.graphnode, b.graphnode), "contacts") == []
+
+
+def test_model_track_contacts_prune_poses():
+    from compas.geometry import Translation
+    from compas_model.elements import BeamElement
+
+    model = Model()
+    a = model.add_element(BeamElement(width=1, depth=1, length=1))
+    b = model.add_element(BeamElement(width=1, depth=1, length=1, transformation=Translation.from_vector([0, 0, 1])))
+    c = model.add_element(BeamElement(width=1, depth=1, length=1, transformation=Translation.from_vector([0, 0, 2])))
+
+    model.track_contacts()
+    assert len(model._contactposes) == 2
+
+    model.remove_interaction(b, a)
+    assert len(model._contactposes) == 1
+
+    model.remove_element(c)
+    assert model._contactposes == {}
+
+    # contacts removed from the graph directly are recomputed
+    assert model.track_contacts() == {"reused": 0, "recomputed": 1, "separated": 0}
+    model.graph.clear_edges()
+    assert model.track_contacts() == {"reused": 0, "recomputed": 1, "separated": 0}
+    assert len(list(model.contacts())) == 1
+
+    model.compute_contacts(clear=True)
+    assert model._contactposes == {}
+
+
+def test_model_add_modifier_reversed_interaction():
+    from compas_model.elements import BeamElement
+    from compas_model.modifiers import Modifier
+
+    model = Model()
+    a = model.add_element(BeamElement())
+    b = model.add_element(BeamElement())
+    model.add_interaction(b, a)
+
+    modifier = Modifier()
+    model.add_modifier(a, b, modifier)
+
+    assert list(b.modifiers()) == [(a, modifier)]
+    assert list(a.modifiers()) == []
+    assert model.graph.edge_attribute((a.graphnode, b.graphnode), "modifiers") == [modifier]
+
+
+def test_model_diff_npz(tmp_path):
+    from compas.geometry import Rotation
+    from compas.geometry import Translation
+    from compas_model.elements import BeamElement
+    from compas_model.elements import ColumnElement
+
+    model = Model()
+    model.transformation = Translation.from_vector([1, 2, 3])
+    a = model.add_element(ColumnElement(transformation=Rotation.from_axis_and_angle([0, 0, 1], 0.3)))
+    b = model.add_element(BeamElement(transformation=Translation.from_vector([0, 0, 2.5])))
+    model.add_interaction(a, b)
+
+    filepath = str(tmp_path / "model.npz")
+    model.to_npz(filepath)
+    other = Model.from_npz(filepath)
+
+    assert model.diff(other) == {}
+
+    other._elements[str(b.guid)].transformation = Translation.from_vector([0, 0, 2.6])
+    assert list(model.diff(other)["changed"]) == [str(b.guid)]
+
+
+def test_model_copy_and_pickle():
+    import pickle
+
+    from compas_model.elements import BeamElement
+
+    model = Model()
+    group = model.add_group("group")
+    a = model.add_element(BeamElement(name="a"), parent=group)
+    b = model.add_element(BeamElement(name="b"), parent=group)
+    model.add_interaction(a, b)
+    a.aabb
+    b.aabb
+    model.index
+
+    for other in (model.copy(), pickle.loads(pickle.dumps(model))):
+        assert sorted(element.name for element in other.elements()) == ["a", "b", "group"]
+        assert other.graph.number_of_edges() == 1
+        assert other.find_element_with_name("b").name == "b"